@@ -1,6 +1,8 @@
 """FastAPI 메인 애플리케이션."""
 
 from fastapi import FastAPI
+from packages.core.db.engine_registry import dispose_async_engine
+from packages.infrastructure.services.llm.llm_client_factory import get_llm_client_factory
 from packages.infrastructure.di.container import container
 
 from apps.api.routes import router
@@ -17,6 +19,14 @@ def create_app() -> FastAPI:
     container.wire(modules=["apps.api.routes"])
     
     app.include_router(router)
+    
+    @app.on_event("shutdown")
+    async def _dispose_db_engine():
+        # 이벤트 루프 종료 전에 asyncpg 커넥션 풀 정리
+        await dispose_async_engine()
+        # LLM keep-alive 커넥션 정리
+        await get_llm_client_factory().aclose()
+    
     return app
 
 
@@ -1,10 +1,13 @@
 """API 라우트."""
 
-from fastapi import APIRouter, Depends, HTTPException, Path
+import json
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, Query, Request
+from fastapi.responses import StreamingResponse
 from dependency_injector.wiring import inject, Provide
-from typing import List
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional
 from packages.core.external.langgraph.workflow import LangGraphWorkflowService
 from packages.infrastructure.di.container import Container
+from packages.infrastructure.logging import get_logger
 from packages.presentation.api.dto.request.side_job_generate_request import SideJobGenerateRequest
 from packages.presentation.api.dto.request.side_job_regenerate_request import SideJobRegenerateRequest
 from packages.presentation.api.dto.request.side_job_regenerate_all_request import ReGenerateAllSideJobRequest
@@ -20,19 +23,32 @@ from packages.presentation.api.dto.request.title_request import TitleRequest
 from packages.presentation.api.dto.response.title_response import TitleResponse
 from packages.presentation.api.dto.request.custom_side_job_request import CustomSideJobRequest
 
+logger = get_logger(__name__)
+
 router = APIRouter(prefix="/ai", tags=["AI"])
 
 
+def cache_bypass_requested(
+    x_cache_bypass: Optional[str] = Header(None),
+    cache_control: Optional[str] = Header(None)
+) -> bool:
+    """X-Cache-Bypass: 1 또는 Cache-Control: no-cache 요청이면 LLM 응답 캐시를 건너뜀."""
+    if x_cache_bypass and x_cache_bypass.strip().lower() in ("1", "true", "yes"):
+        return True
+    return bool(cache_control and "no-cache" in cache_control.lower())
+
+
 @router.post("/generate-side-job", response_model=List[SideJobResponse])
 @inject
 async def side_jobs_generate(
     request: SideJobGenerateRequest,
+    bypass_cache: bool = Depends(cache_bypass_requested),
     service: LangGraphWorkflowService = Depends(Provide[Container.langgraph_workflow])
 ):
     """사이드잡을 생성하고 저장합니다."""
     try:
         # AI 생성 및 저장
-        saved_entities = await service.generate_side_jobs(request.model_dump())
+        saved_entities = await service.generate_side_jobs(request.model_dump(), bypass_cache=bypass_cache)
         
         # API 응답 DTO로 변환
         return [
@@ -188,6 +204,38 @@ async def health_check():
     """헬스 체크."""
     return {"status": "healthy"}
 
+@status_router.get("/embedding")
+async def embedding_metrics():
+    """임베딩 배처/캐시 지표."""
+    from packages.infrastructure.services.embedding.cached_embedding_service import get_embedding_service
+    from packages.infrastructure.services.embedding.micro_batcher import get_embedding_batcher
+
+    embedding_service = get_embedding_service()
+    return {
+        "batcher": get_embedding_batcher().metrics(),
+        "cache": embedding_service.stats() if hasattr(embedding_service, "stats") else None
+    }
+
+@status_router.get("/llm")
+async def llm_pool_metrics():
+    """LLM 클라이언트 커넥션 풀 지표."""
+    from packages.infrastructure.services.llm.llm_client_factory import get_llm_client_factory
+
+    return get_llm_client_factory().stats()
+
+@status_router.get("/llm-cache")
+async def llm_cache_metrics():
+    """LLM 응답 캐시(완전 일치/의미 기반) 적중률과 절약한 지연 시간."""
+    from packages.infrastructure.services.llm.llm_response_cache import get_llm_response_cache
+    from packages.infrastructure.services.llm.semantic_response_cache import get_semantic_response_cache
+
+    response_cache = get_llm_response_cache()
+    semantic_cache = get_semantic_response_cache()
+    return {
+        "exact": response_cache.metrics() if response_cache is not None else {"enabled": False},
+        "semantic": semantic_cache.metrics() if semantic_cache is not None else {"enabled": False}
+    }
+
 router.include_router(status_router)
 
 import traceback
@@ -206,15 +254,62 @@ async def chat(
         raise HTTPException(status_code=500, detail=f"챗봇 응답 생성 실패: {str(e)}")
 
 
+def _format_stream_event(event: Dict[str, Any], stream_format: str) -> str:
+    """스트림 이벤트 직렬화 (SSE: event/data 블록, NDJSON: 한 줄 JSON)."""
+    if stream_format == "ndjson":
+        return json.dumps(event, ensure_ascii=False) + "\n"
+    data = {key: value for key, value in event.items() if key != "type"}
+    return f"event: {event['type']}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@router.post("/chat/stream")
+@inject
+async def chat_stream(
+    request: ChatRequest,
+    http_request: Request,
+    stream_format: Literal["sse", "ndjson"] = Query("sse", alias="format"),
+    service: LangGraphWorkflowService = Depends(Provide[Container.langgraph_workflow])
+):
+    """챗봇 응답을 토큰 단위로 스트리밍합니다 (SSE 기본, ?format=ndjson이면 NDJSON).
+
+    token 이벤트({"delta": ...})를 생성되는 대로 보내고, 마지막에 done 이벤트({"message", "usage"})를 보냅니다.
+    클라이언트 연결이 끊기면 LLM 스트림을 닫아 생성을 중단합니다.
+    """
+    async def event_stream() -> AsyncIterator[str]:
+        events = service.astream_chat(request.model_dump())
+        try:
+            async for event in events:
+                if await http_request.is_disconnected():
+                    logger.info("클라이언트 연결 종료, 챗봇 응답 생성 중단")
+                    break
+                if event["type"] == "done":
+                    event = {"type": "done", **ChatResponse(message=event["message"], usage=event["usage"]).model_dump()}
+                yield _format_stream_event(event, stream_format)
+        except Exception as e:
+            traceback.print_exc()
+            yield _format_stream_event({"type": "error", "detail": f"챗봇 응답 생성 실패: {str(e)}"}, stream_format)
+        finally:
+            # 중단(연결 종료/취소) 시에도 워크플로우와 LLM HTTP 스트림을 닫음
+            await events.aclose()
+
+    media_type = "application/x-ndjson" if stream_format == "ndjson" else "text/event-stream"
+    return StreamingResponse(
+        event_stream(),
+        media_type=media_type,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.post("/title/summarize", response_model=TitleResponse)
 @inject
 async def summarize_title(
     request: TitleRequest,
+    bypass_cache: bool = Depends(cache_bypass_requested),
     service: LangGraphWorkflowService = Depends(Provide[Container.langgraph_workflow])
 ):
     """챗봇 대화 제목을 생성합니다."""
     try:
-        ai_result = await service.generate_title(request.model_dump())
+        ai_result = await service.generate_title(request.model_dump(), bypass_cache=bypass_cache)
         return TitleResponse(title=ai_result.get("title", ""))
     except Exception as e:
         traceback.print_exc()
@@ -225,12 +320,13 @@ async def summarize_title(
 @inject
 async def validate_custom_side_job(
     request: CustomSideJobRequest,
+    bypass_cache: bool = Depends(cache_bypass_requested),
     service: LangGraphWorkflowService = Depends(Provide[Container.langgraph_workflow])
 ):
     """사용자가 입력한 부업을 검증합니다."""
     try:
          # sns 부업과 관련있으면 True, 아니면 False 반환
-       return await service.validate_custom_side_job(request.side_job)
+       return await service.validate_custom_side_job(request.side_job, bypass_cache=bypass_cache)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"검증 중 에러 발생: {str(e)}")
@@ -28,7 +28,7 @@ def generate_side_jobs_task(
     try:
         logger.info(f"사이드잡 생성 시작: user_id={user_id}")
         # 컨테이너에서 Workflow 서비스 가져오기
-        workflow = container.langgraph_workflow()
+        workflow = container.worker_langgraph_workflow()
         
         # Workflow를 사용하여 사이드잡 생성 및 저장
         # 동기적으로 실행 (Celery task 내에서)
@@ -82,7 +82,7 @@ def generate_missions_task(
     """미션 생성을 위한 Celery task (Workflow 사용)."""
     try:
         # 컨테이너에서 Workflow 서비스 가져오기
-        workflow = container.langgraph_workflow()
+        workflow = container.worker_langgraph_workflow()
         
         # Workflow를 사용하여 미션 생성 및 저장
         import asyncio
@@ -130,7 +130,7 @@ def generate_mission_steps_task(
     """미션 단계 생성을 위한 Celery task (Workflow 사용)."""
     try:
         # 컨테이너에서 Workflow 서비스 가져오기
-        workflow = container.langgraph_workflow()
+        workflow = container.worker_langgraph_workflow()
         
         # Workflow를 사용하여 미션 단계 생성 및 저장
         import asyncio
@@ -177,7 +177,7 @@ def regenerate_side_jobs_task(
     """사이드잡 재생성을 위한 Celery task (Workflow 사용)."""
     try:
         # 컨테이너에서 Workflow 서비스 가져오기
-        workflow = container.langgraph_workflow()
+        workflow = container.worker_langgraph_workflow()
         
         # Workflow를 사용하여 사이드잡 재생성 및 저장
         import asyncio
@@ -1,22 +1,114 @@
 """SNS 트렌드 RSS 크롤링을 위한 Celery 태스크."""
 
 import logging
-from celery import shared_task
+from typing import Any, Dict, List, Optional
+from celery import chord, shared_task
+from celery.exceptions import SoftTimeLimitExceeded
+from packages.infrastructure.config.config import get_settings
+from packages.infrastructure.services.crawling.rss_crawler import RSSCrawler
 from packages.infrastructure.services.trend_crawling_service import TrendCrawlingService
 
 logger = logging.getLogger(__name__)
 
+settings = get_settings()
+
+# 피드별 결과에서 합산하는 카운터
+_COUNT_KEYS = ("rss", "inserted", "updated", "skipped", "rejected")
+
 
 @shared_task(bind=True, name='crawl_sns_trends')
-def crawl_sns_trends_task(self):
-    """SNS 트렌드 RSS 크롤링 태스크."""
+def crawl_sns_trends_task(self, full: bool = False, feed_urls: Optional[List[str]] = None):
+    """SNS 트렌드 RSS 크롤링 태스크 (기본은 워터마크 기반 증분, full=True면 전체 재수집).
+
+    피드마다 crawl_sns_feed 태스크로 나눠(fan-out) 여러 워커가 동시에 처리하고,
+    chord 콜백(aggregate_sns_feed_results)이 결과를 합산합니다.
+    feed_urls를 지정하면 해당 피드만 크롤링합니다.
+    """
+    feed_urls = feed_urls or RSSCrawler().feed_urls()
+    if not feed_urls:
+        return {"dispatched": 0}
+
+    result = chord(
+        crawl_sns_feed_task.s(feed_url, full) for feed_url in feed_urls
+    )(aggregate_sns_feed_results_task.s())
+
+    logger.info(f"SNS 트렌드 RSS 크롤링 분배: 피드 {len(feed_urls)}개 (chord {result.id})")
+    return {"dispatched": len(feed_urls), "chord_id": result.id}
+
+
+@shared_task(
+    bind=True,
+    name='crawl_sns_feed',
+    soft_time_limit=settings.crawling_feed_soft_time_limit,
+    time_limit=settings.crawling_feed_time_limit,
+    max_retries=settings.crawling_feed_max_retries
+)
+def crawl_sns_feed_task(self, feed_url: str, full: bool = False) -> Dict[str, Any]:
+    """피드 하나 가져오기 + 파싱 + 저장.
+
+    피드 요청 실패는 피드 health(서킷 브레이커)에 기록되고 정상 결과로 끝납니다.
+    저장 등 그 밖의 실패는 지수 백오프로 재시도하고, 재시도를 모두 쓰면 오류 결과를
+    반환해 chord 전체가 실패하지 않게 합니다.
+    """
     try:
-        logger.info("SNS 트렌드 RSS 크롤링 시작")
-        crawling_service = TrendCrawlingService()
-        results = crawling_service.crawl_all_trends()
-        
-        logger.info(f"SNS 트렌드 RSS 크롤링 완료: {results}")
-        return results
+        return TrendCrawlingService().crawl_feed(feed_url, full=full)
+    except SoftTimeLimitExceeded:
+        logger.error(f"피드 크롤링 시간 초과: {feed_url}")
+        return {"feed_url": feed_url, "error": "soft time limit exceeded"}
     except Exception as e:
-        logger.error(f"SNS 트렌드 RSS 크롤링 실패: {e}")
-        raise self.retry(exc=e, countdown=60, max_retries=3)
\ No newline at end of file
+        if self.request.retries >= self.max_retries:
+            logger.error(f"피드 크롤링 최종 실패 ({feed_url}): {e}")
+            return {"feed_url": feed_url, "error": str(e)}
+        logger.warning(f"피드 크롤링 실패, 재시도 ({feed_url}): {e}")
+        raise self.retry(exc=e, countdown=30 * (2 ** self.request.retries))
+
+
+@shared_task(name='aggregate_sns_feed_results')
+def aggregate_sns_feed_results_task(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """chord 콜백: 피드별 결과 합산 후 새로 저장된 행이 있으면 검색 인덱스 갱신."""
+    summary: Dict[str, Any] = {key: 0 for key in _COUNT_KEYS}
+    feeds: Dict[str, int] = {}
+    errors = []
+
+    for result in results:
+        if not result:
+            continue
+        if result.get("error"):
+            errors.append({"feed_url": result.get("feed_url"), "error": result["error"]})
+            feeds["task_error"] = feeds.get("task_error", 0) + 1
+            continue
+        for key in _COUNT_KEYS:
+            summary[key] += result.get(key, 0)
+        for status, count in (result.get("feeds") or {}).items():
+            feeds[status] = feeds.get(status, 0) + count
+
+    summary.update(feeds=feeds, errors=errors)
+
+    if summary["inserted"] or summary["updated"]:
+        refresh_trend_search_index_task.delay()
+
+    logger.info(f"SNS 트렌드 RSS 크롤링 완료: {summary}")
+    return summary
+
+
+@shared_task(name='refresh_trend_search_index')
+def refresh_trend_search_index_task() -> Dict[str, Any]:
+    """크롤링 후속 인덱싱 (벡터 인덱스 보장 + 통계 갱신)."""
+    from packages.core.db.vector_database import VectorDatabase
+
+    VectorDatabase().refresh_search_index()
+    return {"refreshed": True}
+
+
+@shared_task(name='dispatch_due_sns_feeds')
+def dispatch_due_sns_feeds_task():
+    """크롤링할 차례가 된 피드만 골라 크롤링 태스크로 넘기는 디스패처 (beat에서 주기 실행)."""
+    # 선점(next_crawl_at 임대)한 피드만 넘겨 아직 처리 중인 피드가 중복 디스패치되지 않게 함
+    due_feed_urls = TrendCrawlingService().claim_due_feed_urls()
+    if not due_feed_urls:
+        logger.info("크롤링할 차례가 된 피드 없음")
+        return {"dispatched": 0}
+
+    crawl_sns_trends_task.delay(feed_urls=due_feed_urls)
+    logger.info(f"피드 크롤링 디스패치: {len(due_feed_urls)}개")
+    return {"dispatched": len(due_feed_urls)}
@@ -0,0 +1,211 @@
+"""녹화된 피드를 로컬 재생 서버로 돌려 크롤러 처리량을 측정하는 벤치마크 (네트워크 불필요).
+
+사용법:
+    python benchmark_crawler.py --json   # 저장소에 포함된 fixtures/feed_corpus 사용 (CI, 오프라인)
+    python benchmark_crawler.py --latency-ms 200 --error-rate 0.1 --passes 2
+    python benchmark_crawler.py --storage db --json   # 실제 Postgres 저장 경로 포함
+    python benchmark_crawler.py --repeat-corpus 50 --parse-workers 8   # 대량 크롤링 HTML 파싱 분산
+    python benchmark_entry_pipeline.py --record .cache/feed_corpus   # 실제 피드 녹화 (네트워크 필요)
+    python benchmark_crawler.py .cache/feed_corpus   # 녹화한 실제 피드로 측정
+
+저장 경로(--storage):
+    none  크롤러만 측정
+    dry   저장 서비스의 정규화 + 임베딩까지 측정 (DB 없음, 기본값)
+    db    TrendStorageService 스트림 저장까지 측정 (Postgres 필요)
+
+두 번째 pass부터는 첫 pass에서 기록한 ETag/digest/워터마크를 사용하므로
+304/변경 없음 경로의 비용을 확인할 수 있습니다. 재생 서버가 304를 보냈는데
+크롤러가 not_modified로 집계하지 않은 pass가 있으면 종료 코드 1로 실패합니다
+(304를 오류로 처리하는 회귀 방지).
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# 저장소에 포함된 오프라인 피드 코퍼스 (RSS/Atom, ETag/Last-Modified 헤더 포함)
+DEFAULT_CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "feed_corpus")
+
+# 설정 로드에 필요한 환경 변수 (재생 서버는 로컬이므로 요청 간 지연 없음)
+os.environ.setdefault('CLOVA_X_PROVIDER', 'naver')
+os.environ.setdefault('CLOVA_X_MODEL', 'HCX-007')
+os.environ.setdefault('CLOVA_X_API_KEY', 'dummy_key')
+os.environ.setdefault('CLOVA_X_BASE_URL', 'https://clovastudio.naver.com')
+os.environ.setdefault('CRAWLING_DELAY_MIN', '0')
+os.environ.setdefault('CRAWLING_DELAY_MAX', '0')
+
+from packages.infrastructure.services.crawling.feed_corpus import load_corpus
+from packages.infrastructure.services.crawling.feed_state_store import InMemoryFeedStateStore
+from packages.infrastructure.services.crawling.html_parse_pool import HtmlParsePool
+from packages.infrastructure.services.crawling.replay_server import FeedReplayServer, ReplayConfig
+from packages.infrastructure.services.crawling.rss_crawler import RSSCrawler
+
+
+class NullSink:
+    """저장하지 않고 개수만 셈."""
+
+    async def consume(self, trends, batch_size: int) -> int:
+        count = 0
+        async for _ in trends:
+            count += 1
+        return count
+
+
+class DryStorageSink:
+    """저장 서비스의 정규화 + 배치 임베딩까지만 수행 (DB 쓰기 없음)."""
+
+    def __init__(self):
+        from packages.infrastructure.services.trend_storage_service import TrendStorageService
+        self.storage_service = TrendStorageService()
+
+    async def consume(self, trends, batch_size: int) -> int:
+        count, batch = 0, []
+        async for trend in trends:
+            batch.append(trend)
+            if len(batch) >= batch_size:
+                count += await asyncio.to_thread(self._process, batch)
+                batch = []
+        if batch:
+            count += await asyncio.to_thread(self._process, batch)
+        return count
+
+    def _process(self, batch) -> int:
+        rows = [self.storage_service._normalize_trend(trend) for trend in batch]
+        self.storage_service._embed_trends(rows)
+        return len(rows)
+
+
+class DatabaseSink:
+    """TrendStorageService 스트림 저장 (Postgres)."""
+
+    def __init__(self):
+        from packages.infrastructure.services.trend_storage_service import TrendStorageService
+        self.storage_service = TrendStorageService()
+
+    async def consume(self, trends, batch_size: int) -> int:
+        totals = await self.storage_service.asave_trend_stream(trends, batch_size=batch_size)
+        return totals["saved"]
+
+
+SINKS = {"none": NullSink, "dry": DryStorageSink, "db": DatabaseSink}
+
+
+def served_not_modified(before: dict, after: dict) -> int:
+    """두 재생 서버 집계 사이에 응답한 304 수."""
+    return after.get("304", 0) - before.get("304", 0)
+
+
+def check_not_modified(results: list) -> list:
+    """재생 서버가 304를 보냈는데 크롤러가 not_modified를 하나도 집계하지 않은 pass 목록."""
+    return [
+        number for number, result in enumerate(results, start=1)
+        if result["served_not_modified"] and not result["feed_status"].get("not_modified")
+    ]
+
+
+async def run_pass(crawler: RSSCrawler, sink, batch_size: int) -> dict:
+    """크롤링 한 번 실행 및 지표 계산."""
+    cpu_started, started = time.process_time(), time.perf_counter()
+    entries = 0
+
+    async def counted():
+        nonlocal entries
+        async for trend in crawler.aiter_trends():
+            entries += 1
+            yield trend
+
+    rows = await sink.consume(counted(), batch_size)
+    crawler.save_feed_states()
+
+    wall = time.perf_counter() - started
+    cpu = time.process_time() - cpu_started
+    feeds = len(crawler.feed_stats)
+    return {
+        "feeds": feeds,
+        "entries": entries,
+        "rows": rows,
+        "wall_s": round(wall, 3),
+        "feeds_per_s": round(feeds / wall, 2) if wall else 0.0,
+        "entries_per_s": round(entries / wall, 2) if wall else 0.0,
+        "cpu_ms_per_entry": round(cpu / entries * 1000, 3) if entries else None,
+        "rows_per_s": round(rows / wall, 2) if wall else 0.0,
+        "feed_status": crawler.feed_stats_summary(),
+    }
+
+
+async def run_benchmark(args) -> list:
+    """재생 서버를 띄우고 지정한 횟수만큼 크롤링."""
+    feeds = load_corpus(args.corpus)
+    if args.repeat_corpus > 1:
+        feeds = feeds * args.repeat_corpus
+
+    config = ReplayConfig(
+        latency_ms=args.latency_ms,
+        error_rate=args.error_rate,
+        not_modified_rate=args.not_modified_rate,
+        seed=args.seed
+    )
+    sink = SINKS[args.storage]()
+    state_store = InMemoryFeedStateStore()
+    parse_pool = HtmlParsePool(workers=args.parse_workers) if args.parse_workers else None
+
+    results = []
+    try:
+        with FeedReplayServer(feeds, config, port_count=args.hosts) as server:
+            for _ in range(args.passes):
+                crawler = RSSCrawler(rss_feeds=server.rss_feeds(), state_store=state_store, parse_pool=parse_pool)
+                before = await asyncio.to_thread(server.status_counts)
+                result = await run_pass(crawler, sink, args.batch_size)
+                after = await asyncio.to_thread(server.status_counts)
+                result["served_not_modified"] = served_not_modified(before, after)
+                results.append(result)
+    finally:
+        if parse_pool is not None:
+            parse_pool.shutdown()
+    return results
+
+
+def main():
+    """메인 함수."""
+    parser = argparse.ArgumentParser(description="오프라인 피드 재생 크롤러 벤치마크")
+    parser.add_argument("corpus", nargs="?", default=DEFAULT_CORPUS,
+                        help="녹화된 피드 코퍼스 디렉터리 (기본: fixtures/feed_corpus)")
+    parser.add_argument("--storage", choices=sorted(SINKS), default="dry", help="저장 경로 (기본 dry)")
+    parser.add_argument("--passes", type=int, default=1, help="크롤링 반복 횟수 (2 이상이면 304/변경 없음 경로 포함)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="응답 지연 (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 응답 확률")
+    parser.add_argument("--not-modified-rate", type=float, default=0.0, help="무조건 304 응답 확률")
+    parser.add_argument("--hosts", type=int, default=8, help="피드를 나눠 배치할 가상 호스트(포트) 수")
+    parser.add_argument("--repeat-corpus", type=int, default=1, help="코퍼스를 N배로 복제해 부하 증가")
+    parser.add_argument("--parse-workers", type=int, default=0, help="HTML 파싱 프로세스 수 (0이면 설정값 사용)")
+    parser.add_argument("--batch-size", type=int, default=100, help="저장 마이크로 배치 크기")
+    parser.add_argument("--seed", type=int, default=0, help="오류/304 난수 시드")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력 (CI용)")
+    args = parser.parse_args()
+
+    results = asyncio.run(run_benchmark(args))
+    failed_passes = check_not_modified(results)
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+    else:
+        print("=" * 60)
+        for number, result in enumerate(results, start=1):
+            print(f"[pass {number}] 피드 {result['feeds']}개, 항목 {result['entries']}개, 저장 {result['rows']}행, {result['wall_s']}초")
+            print(f"  feeds/s: {result['feeds_per_s']}, entries/s: {result['entries_per_s']}, rows/s: {result['rows_per_s']}")
+            print(f"  CPU/항목: {result['cpu_ms_per_entry']} ms, 피드 상태: {result['feed_status']}, 서버 304: {result['served_not_modified']}개")
+        print("=" * 60)
+
+    if failed_passes:
+        print(f"실패: pass {failed_passes}에서 재생 서버가 304를 보냈지만 크롤러의 not_modified가 0개입니다", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""RSS 항목 처리 파이프라인의 항목당 비용을 녹화된 피드 코퍼스로 측정하는 스크립트.
+
+사용법:
+    python benchmark_entry_pipeline.py --repeat 5   # 저장소에 포함된 fixtures/feed_corpus 사용 (오프라인)
+    python benchmark_entry_pipeline.py --record .cache/feed_corpus   # 실제 피드 녹화 (네트워크 필요)
+    python benchmark_entry_pipeline.py .cache/feed_corpus --repeat 5
+
+before: 분류기마다 요약 HTML을 다시 파싱하던 이전 경로를 재현한 것
+after:  normalize_entry로 한 번 파싱하고 KeywordMatcher로 한 번 스캔한 결과를 모든 분류기가 공유하는 현재 경로
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# 저장소에 포함된 오프라인 피드 코퍼스
+DEFAULT_CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "feed_corpus")
+
+# 설정 로드에 필요한 환경 변수 (네트워크/DB는 사용하지 않음)
+os.environ.setdefault('CLOVA_X_PROVIDER', 'naver')
+os.environ.setdefault('CLOVA_X_MODEL', 'HCX-007')
+os.environ.setdefault('CLOVA_X_API_KEY', 'dummy_key')
+os.environ.setdefault('CLOVA_X_BASE_URL', 'https://clovastudio.naver.com')
+
+import feedparser
+from bs4 import BeautifulSoup
+
+from packages.infrastructure.services.crawling.entry_normalizer import normalize_entry
+from packages.infrastructure.services.crawling.feed_corpus import load_corpus, record_corpus
+from packages.infrastructure.services.crawling.rss_crawler import RSSCrawler
+
+
+def legacy_extract_content(entry) -> str:
+    """이전 _extract_content (호출마다 BeautifulSoup 파싱)."""
+    content = entry.get('summary', '') or entry.get('description', '')
+    text_content = BeautifulSoup(content, 'html.parser').get_text(strip=True)
+    return text_content[:1000] if text_content else entry.get('title', '')
+
+
+def legacy_process(crawler: RSSCrawler, entry) -> None:
+    """이전 경로 재현: 관련성 1회 + 관련 항목이면 분류기별 파싱 6회."""
+    combined = f"{entry.get('title', '').lower()} {legacy_extract_content(entry).lower()}"
+    related = any(keyword.lower() in combined for keyword in crawler.sns_keywords) or any(
+        re.search(pattern, combined, re.IGNORECASE)
+        for pattern in (r'#\w+', r'@\w+', r'social\s+media', r'digital\s+marketing',
+                        r'content\s+creator', r'influencer', r'viral', r'trending')
+    )
+    if not related:
+        return
+
+    legacy_extract_content(entry)  # _create_trend_data
+    legacy_extract_content(entry).lower()  # _extract_tags
+    legacy_extract_content(entry).lower()  # _determine_sns_trend_type
+    legacy_extract_content(entry)  # _extract_engagement_metrics
+    legacy_extract_content(entry)  # _has_media_content
+    legacy_extract_content(entry).lower()  # _extract_legal_implications
+
+
+def current_process(crawler: RSSCrawler, entry) -> None:
+    """현재 경로: 한 번 정규화/키워드 스캔 후 분류기 공유."""
+    record = normalize_entry(entry)
+    hits = crawler.matcher.match(record.combined_lower)
+    if crawler._is_sns_related(hits):
+        crawler._create_trend_data(record, hits, "benchmark")
+
+
+def measure(process, crawler: RSSCrawler, entries, repeat: int) -> float:
+    """항목당 평균 처리 시간 (마이크로초, repeat회 중 최솟값)."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for entry in entries:
+            process(crawler, entry)
+        best = min(best, time.perf_counter() - started)
+    return best / len(entries) * 1_000_000
+
+
+def main():
+    """메인 함수."""
+    parser = argparse.ArgumentParser(description="RSS 항목 처리 파이프라인 마이크로 벤치마크")
+    parser.add_argument("corpus", nargs="?", default=DEFAULT_CORPUS,
+                        help="녹화된 피드 코퍼스 디렉터리 (기본: fixtures/feed_corpus)")
+    parser.add_argument("--record", action="store_true", help="크롤러의 피드 목록을 먼저 녹화")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 측정 횟수")
+    args = parser.parse_args()
+
+    if args.record and os.path.abspath(args.corpus) == DEFAULT_CORPUS:
+        parser.error("--record는 저장소에 포함된 fixtures/feed_corpus를 덮어쓰므로 다른 디렉터리를 지정하세요")
+
+    crawler = RSSCrawler()
+    if args.record:
+        record_corpus(crawler.rss_feeds, args.corpus, crawler.settings.crawling_timeout,
+                      crawler.settings.crawling_user_agent)
+
+    entries = [entry for feed in load_corpus(args.corpus) for entry in feedparser.parse(feed.body).entries]
+    if not entries:
+        print("코퍼스에 항목이 없습니다.")
+        return
+
+    before = measure(legacy_process, crawler, entries, args.repeat)
+    after = measure(current_process, crawler, entries, args.repeat)
+
+    print("=" * 50)
+    print(f"항목 수: {len(entries)}")
+    print(f"before (분류기별 파싱): {before:8.1f} µs/항목")
+    print(f"after  (단일 정규화):   {after:8.1f} µs/항목")
+    print(f"개선: {before / after:.1f}배")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""생성 노드 비동기 경로의 동시성 확인 스크립트 (가짜 LLM 사용, 네트워크/DB 불필요).
+
+N개의 요청을 동시에 보냈을 때 acall(ainvoke) 경로는 LLM 지연의 약 1배,
+이전처럼 이벤트 루프에서 동기 invoke를 호출하면 약 N배가 걸리는지 확인합니다.
+
+- 노드: 모든 생성 노드 (structured output 노드는 응답 Pydantic 모델을 돌려주는 가짜 LLM 사용)
+- 워크플로우: LangGraphWorkflowService(use_async_llm=True)의 generate_title / validate_custom_side_job을
+  동시에 호출해 _generation_action 배선까지 확인
+
+사용법:
+    python check_llm_concurrency.py   # 직렬 처리가 감지되면 종료 코드 1
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# 환경 변수 설정
+os.environ.setdefault('CLOVA_X_PROVIDER', 'naver')
+os.environ.setdefault('CLOVA_X_MODEL', 'HCX-007')
+os.environ.setdefault('CLOVA_X_API_KEY', 'dummy_key')
+os.environ.setdefault('CLOVA_X_BASE_URL', 'https://clovastudio.naver.com')
+# 응답 캐시가 켜져 있으면 첫 pass 이후 LLM을 호출하지 않아 동시성 검증이 무의미해짐
+os.environ['LLM_CACHE_ENABLED'] = 'false'
+os.environ['LLM_SEMANTIC_CACHE_ENABLED'] = 'false'
+
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from packages.core.external.langgraph.workflow import LangGraphWorkflowService
+from packages.infrastructure.nodes.generation.chat_generation_node import ChatGenerationNode
+from packages.infrastructure.nodes.generation.chat_title_generation_node import ChatTitleGenerationNode
+from packages.infrastructure.nodes.generation.mission_generation_node import MissionGenerationNode
+from packages.infrastructure.nodes.generation.mission_step_generation_node import MissionStepGenerationNode
+from packages.infrastructure.nodes.generation.mission_step_regeneration_node import MissionStepRegenerationNode
+from packages.infrastructure.nodes.generation.regenerate_side_job_generation_node import RegenerateSideJobGenerationNode
+from packages.infrastructure.nodes.generation.side_job_generation_node import SideJobGenerationNode
+from packages.infrastructure.nodes.generation.validate_custom_side_job_node import ValidateCustomSideJobNode
+from packages.infrastructure.services.llm.llm_client_factory import get_llm_client_factory
+from packages.presentation.api.dto.response.ai_response_models import (
+    GuideAiResponse, MissionAIResponse, MissionsAIResponse, MissionStepAIResponse, MissionStepsAIResponse,
+    SideJobAIResponse, SideJobsAIResponse
+)
+
+LATENCY = 0.5  # 가짜 LLM 응답 지연 (초)
+CONCURRENCY = 8  # 동시 요청 수
+
+SIDE_JOBS = SideJobsAIResponse(side_jobs=[
+    SideJobAIResponse(title="차분한 개발 브이로그 유튜브", description="퇴근 후 개발 과정을 기록하는 영상"),
+    SideJobAIResponse(title="유쾌한 코딩 팁 인스타그램 릴스", description="1분 코딩 팁 숏폼"),
+])
+MISSIONS = MissionsAIResponse(missions=[
+    MissionAIResponse(title="채널 개설", orderNo=1, notes="기본 설정",
+                      guide=[GuideAiResponse(guide_title="채널 이름 정하기", description="키워드 3개 조합")]),
+])
+MISSION_STEPS = MissionStepsAIResponse(mission_steps=[
+    MissionStepAIResponse(title="채널 이름 후보 5개 적기", seq=1, detail="관심 키워드 조합"),
+    MissionStepAIResponse(title="채널 아트 만들기", seq=2, detail="무료 템플릿 사용"),
+])
+
+# 요청 데이터
+SIDE_JOB_PROFILE = {"job": "개발자", "hobbies": ["독서", "요가"], "expression_style": "영상", "strength_type": "분석"}
+MISSION_REQUEST = {
+    "sidejob_title": "차분한 개발 브이로그 유튜브", "sidejob_design_notes": "퇴근 후 개발 과정을 기록하는 영상",
+    "mission_title": "채널 개설", "mission_description": "기본 설정", "mission_design_notes": "기본 설정",
+    "order_no": 1, "side_job_title": "차분한 개발 브이로그 유튜브", "side_job_description": "퇴근 후 개발 과정 기록",
+}
+TITLE_REQUEST = {"message": "유튜브 부업 어떻게 시작해?"}
+VALIDATE_REQUEST = "인스타그램 릴스 편집"
+
+
+def fake_llm(result, latency: float = LATENCY) -> RunnableLambda:
+    """고정 지연 후 result를 돌려주는 가짜 LLM (invoke는 time.sleep, ainvoke는 asyncio.sleep).
+
+    일반 노드에는 AIMessage, structured output 노드에는 응답 Pydantic 모델을 넘깁니다.
+    """
+
+    def invoke(_):
+        time.sleep(latency)
+        return result
+
+    async def ainvoke(_):
+        await asyncio.sleep(latency)
+        return result
+
+    return RunnableLambda(invoke, afunc=ainvoke)
+
+
+def with_fake_llm(node, result):
+    """노드의 LLM을 가짜 LLM으로 교체."""
+    node.llm = fake_llm(result)
+    return node
+
+
+def create_cases():
+    """(이름, 노드, 초기 상태) 목록."""
+    return [
+        ("chat", with_fake_llm(ChatGenerationNode(), AIMessage(content="부업 가이드 답변입니다.")),
+         {"request_data": {**TITLE_REQUEST, "history": []}}),
+        ("title", with_fake_llm(ChatTitleGenerationNode(), AIMessage(content="유튜브 부업 시작")),
+         {"request_data": TITLE_REQUEST}),
+        ("validate", with_fake_llm(ValidateCustomSideJobNode(), AIMessage(content="True")),
+         {"request_data": VALIDATE_REQUEST}),
+        ("side_job", with_fake_llm(SideJobGenerationNode(), SIDE_JOBS),
+         {"profile_data": SIDE_JOB_PROFILE, "trend_data": {}}),
+        ("regen_side", with_fake_llm(RegenerateSideJobGenerationNode(), SIDE_JOBS),
+         {"profile_data": {**SIDE_JOB_PROFILE, "feedback_reasons": ["너무 어려움"], "etc_feedback": ""}}),
+        ("mission", with_fake_llm(MissionGenerationNode(), MISSIONS),
+         {"request_data": MISSION_REQUEST}),
+        ("step", with_fake_llm(MissionStepGenerationNode(), MISSION_STEPS),
+         {"request_data": MISSION_REQUEST}),
+        ("regen_step", with_fake_llm(MissionStepRegenerationNode(), MISSION_STEPS),
+         {"request_data": MISSION_REQUEST, "reasons": ["너무 김"], "etc_feedback": ""}),
+    ]
+
+
+def create_workflow_service(use_async_llm: bool) -> LangGraphWorkflowService:
+    """가짜 LLM을 쓰는 워크플로우 서비스 (제목/부업 검증 워크플로우는 저장 노드가 없어 UoW 불필요)."""
+    factory = get_llm_client_factory()
+    original_get_llm = factory.get_llm
+
+    def fake_get_llm(temperature=None, max_tokens=None, schema=None, **overrides):
+        # 제목은 "True", 부업 검증은 True로 판정되는 응답
+        return fake_llm({
+            SideJobsAIResponse: SIDE_JOBS, MissionsAIResponse: MISSIONS, MissionStepsAIResponse: MISSION_STEPS
+        }.get(schema, AIMessage(content="True")))
+
+    factory.get_llm = fake_get_llm
+    try:
+        return LangGraphWorkflowService(uow_factory=None, use_async_llm=use_async_llm)
+    finally:
+        factory.get_llm = original_get_llm
+
+
+async def measure(node, state, use_async: bool) -> float:
+    """CONCURRENCY개 요청을 동시에 실행한 총 소요 시간 (초)."""
+
+    async def blocking_call():
+        # 이전 동작 재현: 이벤트 루프 안에서 동기 invoke 호출
+        return node(state)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(node.acall(state) if use_async else blocking_call() for _ in range(CONCURRENCY)))
+    return time.perf_counter() - started
+
+
+async def measure_workflow(service: LangGraphWorkflowService, name: str) -> float:
+    """워크플로우 서비스 메서드를 CONCURRENCY개 동시에 호출한 총 소요 시간 (초)."""
+    if name == "title":
+        calls = [service.generate_title(dict(TITLE_REQUEST)) for _ in range(CONCURRENCY)]
+    else:
+        calls = [service.validate_custom_side_job(VALIDATE_REQUEST) for _ in range(CONCURRENCY)]
+
+    started = time.perf_counter()
+    await asyncio.gather(*calls)
+    return time.perf_counter() - started
+
+
+def main():
+    """메인 함수 (acall 경로가 동시 요청 N개를 지연의 2배 미만으로 처리하는지 확인)."""
+    failed = []
+    for name, node, state in create_cases():
+        blocking = asyncio.run(measure(node, state, use_async=False))
+        concurrent = asyncio.run(measure(node, state, use_async=True))
+        print(
+            f"{name:<12} invoke x{CONCURRENCY}: {blocking:.2f}s ({blocking / LATENCY:.1f}배) | "
+            f"acall x{CONCURRENCY}: {concurrent:.2f}s ({concurrent / LATENCY:.1f}배)"
+        )
+        if concurrent >= LATENCY * 2:
+            failed.append(name)
+
+    # 워크플로우 배선 확인 (use_async_llm=True면 생성 노드가 acall로 등록되어야 함)
+    service = create_workflow_service(use_async_llm=True)
+    for name in ("title", "validate"):
+        concurrent = asyncio.run(measure_workflow(service, name))
+        print(f"workflow:{name:<3} ainvoke x{CONCURRENCY}: {concurrent:.2f}s ({concurrent / LATENCY:.1f}배)")
+        if concurrent >= LATENCY * 2:
+            failed.append(f"workflow:{name}")
+
+    if failed:
+        print(f"❌ 동시 요청이 직렬로 처리됨: {', '.join(failed)}")
+        sys.exit(1)
+    print("✅ 모든 생성 노드와 API 워크플로우가 동시 요청을 병렬로 처리")
+
+
+if __name__ == "__main__":
+    main()
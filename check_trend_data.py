@@ -106,6 +106,27 @@ def test_trend_retrieval():
         traceback.print_exc()
         return False
 
+def test_vector_index_usage():
+    """벡터 검색 쿼리가 ANN 인덱스를 사용하는지 EXPLAIN으로 확인합니다."""
+    try:
+        print("\n🔍 벡터 인덱스 사용 여부 확인 (EXPLAIN)...")
+        
+        from packages.infrastructure.services.trend_retriever_service import TrendRetrieverService
+        
+        retriever = TrendRetrieverService()
+        result = retriever.explain_vector_search("인스타그램 트렌드", limit=3, disable_seqscan=True)
+        
+        print(result["plan"])
+        print(f"ANN 인덱스 사용: {result['uses_vector_index']}")
+        
+        return result["uses_vector_index"]
+        
+    except Exception as e:
+        print(f"❌ 벡터 인덱스 확인 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
 if __name__ == "__main__":
     print("=" * 50)
     print("트렌드 데이터 확인 및 테스트")
@@ -118,11 +139,14 @@ if __name__ == "__main__":
         # 2. 트렌드 검색 테스트
         retrieval_works = test_trend_retrieval()
         
-        if retrieval_works:
+        # 3. 벡터 인덱스 사용 여부 확인
+        index_used = test_vector_index_usage()
+        
+        if retrieval_works and index_used:
             print("\n✅ 모든 테스트 통과!")
             print("트렌드 데이터가 정상적으로 저장되고 검색됩니다.")
         else:
-            print("\n❌ 트렌드 검색에 문제가 있습니다.")
+            print("\n❌ 트렌드 검색 또는 벡터 인덱스 사용에 문제가 있습니다.")
     else:
         print("\n❌ 데이터베이스에 트렌드 데이터가 없습니다.")
 
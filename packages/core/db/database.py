@@ -14,6 +14,7 @@ def create_database_engine(database_url: str):
         engine = create_engine(
             database_url,
             pool_pre_ping=True,
+            pool_recycle=300,
             pool_size=10,
             max_overflow=20,
             echo=False,  # SQL 로깅 비활성화 (운영환경)
@@ -54,4 +55,40 @@ def create_database_engine_from_config():
     
     logger.info(f"설정 기반 PostgreSQL 연결: {settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}")
     
-    return create_database_engine(url)
\ No newline at end of file
+    return create_database_engine(url)
+
+def create_async_database_engine_from_config():
+    """설정에서 개별 값들을 읽어서 asyncpg 기반 비동기 엔진을 생성합니다."""
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    settings = get_settings()
+
+    url = URL.create(
+        "postgresql+asyncpg",
+        username=settings.DB_USER,
+        password=settings.DB_PWD,
+        host=settings.DB_HOST,
+        port=settings.DB_PORT,
+        database=settings.DB_NAME
+    )
+
+    try:
+        engine = create_async_engine(
+            url,
+            pool_pre_ping=True,
+            pool_recycle=300,
+            pool_size=10,
+            max_overflow=20,
+            echo=False,
+            # asyncpg 연결 옵션 (psycopg2의 connect_timeout/application_name에 대응)
+            connect_args={
+                "timeout": 10,
+                "server_settings": {"application_name": "booquest"}
+            }
+        )
+        logger.info(f"설정 기반 비동기 PostgreSQL 엔진 생성 완료: {settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}")
+        return engine
+
+    except Exception as e:
+        logger.error(f"비동기 PostgreSQL 엔진 생성 실패: {e}")
+        raise
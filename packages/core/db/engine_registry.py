@@ -0,0 +1,153 @@
+"""프로세스 단위로 공유되는 SQLAlchemy 엔진/세션 팩토리 레지스트리."""
+
+import os
+import threading
+from typing import Optional
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+from packages.infrastructure.logging import get_logger
+from .database import create_database_engine_from_config, create_async_database_engine_from_config
+
+logger = get_logger(__name__)
+
+
+class EngineRegistry:
+    """프로세스당 하나의 엔진과 sessionmaker를 보관하는 레지스트리.
+
+    Celery prefork 워커나 uvicorn 워커처럼 fork된 자식 프로세스에서는
+    부모의 커넥션 풀을 그대로 쓰면 소켓이 공유되므로, PID가 바뀌면
+    기존 풀을 버리고 엔진을 다시 생성합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._engine: Optional[Engine] = None
+        self._session_factory: Optional[sessionmaker] = None
+        self._async_engine = None
+        self._async_session_factory = None
+        self._pid: Optional[int] = None
+
+    def get_engine(self) -> Engine:
+        """현재 프로세스의 엔진을 반환합니다 (없으면 생성)."""
+        engine = self._engine
+        if engine is not None and self._pid == os.getpid():
+            return engine
+
+        with self._lock:
+            self._check_pid()
+            if self._engine is None:
+                self._engine = create_database_engine_from_config()
+                self._session_factory = sessionmaker(bind=self._engine, expire_on_commit=False)
+                logger.info(f"공유 DB 엔진 생성 완료 (pid={self._pid})")
+            return self._engine
+
+    def get_session_factory(self) -> sessionmaker:
+        """현재 프로세스의 sessionmaker를 반환합니다."""
+        self.get_engine()
+        return self._session_factory
+
+    def get_async_engine(self):
+        """현재 프로세스의 asyncpg 엔진을 반환합니다 (없으면 생성)."""
+        engine = self._async_engine
+        if engine is not None and self._pid == os.getpid():
+            return engine
+
+        with self._lock:
+            self._check_pid()
+            if self._async_engine is None:
+                from sqlalchemy.ext.asyncio import async_sessionmaker
+
+                self._async_engine = create_async_database_engine_from_config()
+                self._async_session_factory = async_sessionmaker(bind=self._async_engine, expire_on_commit=False)
+                logger.info(f"공유 비동기 DB 엔진 생성 완료 (pid={self._pid})")
+            return self._async_engine
+
+    def get_async_session_factory(self):
+        """현재 프로세스의 async_sessionmaker를 반환합니다."""
+        self.get_async_engine()
+        return self._async_session_factory
+
+    def dispose(self) -> None:
+        """동기 엔진과 커넥션 풀을 정리합니다 (애플리케이션 종료 시 사용)."""
+        with self._lock:
+            if self._engine is not None and self._pid == os.getpid():
+                self._engine.dispose()
+                logger.info("공유 DB 엔진 정리 완료")
+            self._engine = None
+            self._session_factory = None
+
+    async def dispose_async(self) -> None:
+        """비동기 엔진과 커넥션 풀을 정리합니다 (이벤트 루프 종료 전 사용)."""
+        with self._lock:
+            engine = self._async_engine if self._pid == os.getpid() else None
+            self._async_engine = None
+            self._async_session_factory = None
+        if engine is not None:
+            await engine.dispose()
+            logger.info("공유 비동기 DB 엔진 정리 완료")
+
+    def _check_pid(self) -> None:
+        """PID가 바뀌었으면(fork) 상속받은 엔진을 버립니다. 락 안에서 호출."""
+        pid = os.getpid()
+        if self._pid != pid:
+            self._discard_inherited()
+            self._pid = pid
+
+    def _discard_inherited(self) -> None:
+        """fork로 상속받은 엔진을 부모 커넥션을 닫지 않고 버립니다."""
+        try:
+            # close=False: 부모 프로세스가 사용 중인 소켓은 건드리지 않음
+            if self._engine is not None:
+                self._engine.dispose(close=False)
+            if self._async_engine is not None:
+                self._async_engine.sync_engine.dispose(close=False)
+        except Exception as e:
+            logger.warning(f"상속된 DB 엔진 정리 실패: {e}")
+        self._engine = None
+        self._session_factory = None
+        self._async_engine = None
+        self._async_session_factory = None
+
+    def _after_fork_in_child(self) -> None:
+        """fork 직후 자식 프로세스에서 호출되는 훅."""
+        # fork 시점에 다른 스레드가 락을 잡고 있었을 수 있으므로 새로 생성
+        self._lock = threading.RLock()
+        self._discard_inherited()
+        self._pid = os.getpid()
+
+
+# 전역 레지스트리 인스턴스
+_registry = EngineRegistry()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_registry._after_fork_in_child)
+
+
+def get_engine() -> Engine:
+    """프로세스 공유 엔진 반환."""
+    return _registry.get_engine()
+
+
+def get_session_factory() -> sessionmaker:
+    """프로세스 공유 sessionmaker 반환."""
+    return _registry.get_session_factory()
+
+
+def get_async_engine():
+    """프로세스 공유 비동기 엔진 반환."""
+    return _registry.get_async_engine()
+
+
+def get_async_session_factory():
+    """프로세스 공유 async_sessionmaker 반환."""
+    return _registry.get_async_session_factory()
+
+
+def dispose_engine() -> None:
+    """프로세스 공유 엔진 정리."""
+    _registry.dispose()
+
+
+async def dispose_async_engine() -> None:
+    """프로세스 공유 비동기 엔진 정리."""
+    await _registry.dispose_async()
@@ -1,8 +1,8 @@
 """SQLAlchemy Unit of Work implementation."""
 
-from contextlib import AbstractContextManager
+from contextlib import AbstractContextManager, AbstractAsyncContextManager
 from packages.infrastructure.logging import get_logger
-from .database import create_database_engine_from_config
+from .engine_registry import get_session_factory, get_async_session_factory
 
 logger = get_logger(__name__)
 
@@ -12,11 +12,8 @@ class SqlAlchemyUoW(AbstractContextManager):
     
     def __init__(self):
         """UoW 초기화."""
-        # 설정에서 자동으로 연결 정보 구성
-        engine = create_database_engine_from_config()
-        from sqlalchemy.orm import sessionmaker
-        self._maker = sessionmaker(bind=engine, expire_on_commit=False)
-        logger.info("SQLAlchemy UoW 초기화 완료")
+        # 프로세스 공유 엔진의 sessionmaker 사용 (UoW마다 커넥션 풀을 만들지 않음)
+        self._maker = get_session_factory()
     
     def __enter__(self):
         """컨텍스트 매니저 진입."""
@@ -33,3 +30,32 @@ class SqlAlchemyUoW(AbstractContextManager):
             self.session.commit()
             logger.debug("UoW 커밋 완료")
         self.session.close()
+
+
+class AsyncSqlAlchemyUoW(AbstractAsyncContextManager):
+    """asyncpg 기반 SQLAlchemy 비동기 Unit of Work 구현체.
+
+    FastAPI 이벤트 루프 위에서 실행되는 워크플로우용이며,
+    Celery 태스크는 동기 SqlAlchemyUoW를 그대로 사용합니다.
+    """
+
+    def __init__(self):
+        """UoW 초기화."""
+        self._maker = get_async_session_factory()
+
+    async def __aenter__(self):
+        """비동기 컨텍스트 매니저 진입."""
+        self.session = self._maker()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        """비동기 컨텍스트 매니저 종료."""
+        try:
+            if exc:
+                await self.session.rollback()
+                logger.error(f"UoW 롤백: {exc}")
+            else:
+                await self.session.commit()
+                logger.debug("UoW 커밋 완료")
+        finally:
+            await self.session.close()
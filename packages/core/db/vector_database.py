@@ -1,8 +1,8 @@
 """PostgreSQL Vector 확장을 위한 데이터베이스 설정."""
 
 import logging
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import text
+from packages.core.db.engine_registry import get_engine, get_session_factory
 from packages.infrastructure.config.config import get_settings
 
 logger = logging.getLogger(__name__)
@@ -17,20 +17,11 @@ class VectorDatabase:
         self.session_factory = None
     
     def create_engine(self):
-        """Vector 확장을 지원하는 엔진 생성."""
+        """Vector 확장을 지원하는 엔진 설정 (프로세스 공유 엔진 사용)."""
         try:
-            # PostgreSQL 연결 URL 생성
-            db_url = f"postgresql+psycopg2://{self.settings.DB_USER}:{self.settings.DB_PWD}@{self.settings.DB_HOST}:{self.settings.DB_PORT}/{self.settings.DB_NAME}"
-            
-            self.engine = create_engine(
-                db_url,
-                echo=False,
-                pool_pre_ping=True,
-                pool_recycle=300
-            )
-            
-            self.session_factory = sessionmaker(bind=self.engine)
-            logger.info("Vector 데이터베이스 엔진 생성 완료")
+            self.engine = get_engine()
+            self.session_factory = get_session_factory()
+            logger.info("Vector 데이터베이스 엔진 연결 완료")
             
         except Exception as e:
             logger.error(f"Vector 데이터베이스 엔진 생성 실패: {e}")
@@ -53,10 +44,22 @@ class VectorDatabase:
         """벡터 테이블들을 생성."""
         try:
             from packages.domain.entities.sns_trend import SNSTrend, TrendEmbedding
+            from packages.domain.entities.crawl_feed_state import CrawlFeedState
             
             # 테이블 생성
             SNSTrend.metadata.create_all(self.engine)
             TrendEmbedding.metadata.create_all(self.engine)
+            CrawlFeedState.__table__.create(self.engine, checkfirst=True)
+            
+            # 기존 Text(JSON 문자열) 임베딩 컬럼을 vector 타입으로 변환
+            self.migrate_embedding_column()
+            
+            # 콘텐츠 식별 키 컬럼 추가/백필 및 유니크 인덱스 생성
+            self.migrate_trend_content_key()
+            
+            # 코사인 거리 ANN 인덱스 및 검색 필터용 인덱스 생성
+            self.create_vector_index()
+            self.create_trend_filter_index()
             
             logger.info("벡터 테이블 생성 완료")
             
@@ -64,6 +67,146 @@ class VectorDatabase:
             logger.error(f"벡터 테이블 생성 실패: {e}")
             raise
     
+    def migrate_embedding_column(self):
+        """trend_embeddings.embedding 컬럼이 text이면 vector(N)으로 변환 (기존 행 백필)."""
+        try:
+            from packages.domain.entities.sns_trend import EMBEDDING_DIMENSION
+            
+            with self.engine.begin() as conn:
+                column_type = conn.execute(text("""
+                    SELECT data_type
+                    FROM information_schema.columns
+                    WHERE table_name = 'trend_embeddings' AND column_name = 'embedding'
+                """)).scalar()
+                
+                if column_type is None or column_type == "USER-DEFINED":
+                    # 컬럼이 없거나 이미 vector 타입
+                    return
+                
+                # JSON 배열 문자열("[0.1, 0.2, ...]")은 vector 입력 형식과 호환되므로 그대로 캐스팅
+                conn.execute(text(
+                    f"ALTER TABLE trend_embeddings "
+                    f"ALTER COLUMN embedding TYPE vector({EMBEDDING_DIMENSION}) "
+                    f"USING embedding::vector({EMBEDDING_DIMENSION})"
+                ))
+                logger.info(f"trend_embeddings.embedding 컬럼 변환 완료: {column_type} → vector({EMBEDDING_DIMENSION})")
+                
+        except Exception as e:
+            logger.error(f"임베딩 컬럼 변환 실패: {e}")
+            raise
+    
+    def migrate_trend_content_key(self):
+        """sns_trends.content_key 컬럼 추가, 기존 행 백필, 유니크 인덱스 생성.
+        
+        기존 데이터에 같은 키가 여러 개면 가장 오래된(id가 작은) 행만 키를 갖고,
+        나머지는 비활성화하여 유니크 인덱스와 충돌하지 않게 합니다.
+        """
+        try:
+            from packages.infrastructure.utils.content_identity import content_key
+            
+            with self.engine.begin() as conn:
+                conn.execute(text("ALTER TABLE sns_trends ADD COLUMN IF NOT EXISTS content_key VARCHAR(64)"))
+                
+                rows = conn.execute(text(
+                    "SELECT id, url, title FROM sns_trends WHERE content_key IS NULL AND is_active = true ORDER BY id"
+                )).fetchall()
+                
+                if rows:
+                    existing_keys = {
+                        row[0] for row in conn.execute(text(
+                            "SELECT content_key FROM sns_trends WHERE content_key IS NOT NULL"
+                        ))
+                    }
+                    updates, duplicate_ids = [], []
+                    for row in rows:
+                        key = content_key(row.url, row.title)
+                        if key in existing_keys:
+                            duplicate_ids.append(row.id)
+                        else:
+                            existing_keys.add(key)
+                            updates.append({"id": row.id, "content_key": key})
+                    
+                    if updates:
+                        conn.execute(text("UPDATE sns_trends SET content_key = :content_key WHERE id = :id"), updates)
+                    if duplicate_ids:
+                        conn.execute(
+                            text("UPDATE sns_trends SET is_active = false WHERE id = ANY(:ids)"),
+                            {"ids": duplicate_ids}
+                        )
+                    logger.info(f"content_key 백필 완료: {len(updates)}개, 중복 비활성화 {len(duplicate_ids)}개")
+                
+                conn.execute(text(
+                    "CREATE UNIQUE INDEX IF NOT EXISTS ux_sns_trends_content_key ON sns_trends (content_key)"
+                ))
+                
+        except Exception as e:
+            logger.error(f"content_key 마이그레이션 실패: {e}")
+            raise
+    
+    def create_vector_index(self):
+        """설정에 따라 HNSW 또는 IVFFlat 코사인 인덱스를 생성."""
+        try:
+            index_type = self.settings.vector_index_type.lower()
+            
+            if index_type == "hnsw":
+                index_sql = (
+                    "CREATE INDEX IF NOT EXISTS ix_trend_embeddings_embedding_hnsw "
+                    "ON trend_embeddings USING hnsw (embedding vector_cosine_ops) "
+                    f"WITH (m = {int(self.settings.vector_hnsw_m)}, "
+                    f"ef_construction = {int(self.settings.vector_hnsw_ef_construction)})"
+                )
+            elif index_type == "ivfflat":
+                # IVFFlat은 데이터가 어느 정도 쌓인 뒤 생성해야 리콜이 좋음
+                index_sql = (
+                    "CREATE INDEX IF NOT EXISTS ix_trend_embeddings_embedding_ivfflat "
+                    "ON trend_embeddings USING ivfflat (embedding vector_cosine_ops) "
+                    f"WITH (lists = {int(self.settings.vector_ivfflat_lists)})"
+                )
+            else:
+                raise ValueError(f"지원하지 않는 벡터 인덱스 종류: {self.settings.vector_index_type}")
+            
+            with self.engine.begin() as conn:
+                conn.execute(text(index_sql))
+                conn.execute(text("ANALYZE trend_embeddings"))
+            
+            logger.info(f"벡터 인덱스 생성 완료: {index_type}")
+            
+        except Exception as e:
+            logger.error(f"벡터 인덱스 생성 실패: {e}")
+            raise
+    
+    def create_trend_filter_index(self):
+        """벡터 검색의 활성/플랫폼 필터와 조인을 지원하는 부분 인덱스 생성."""
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(text(
+                    "CREATE INDEX IF NOT EXISTS ix_sns_trends_active_platform_uuid "
+                    "ON sns_trends (platform, uuid) WHERE is_active = true"
+                ))
+            
+            logger.info("트렌드 필터 인덱스 생성 완료")
+            
+        except Exception as e:
+            logger.error(f"트렌드 필터 인덱스 생성 실패: {e}")
+            raise
+    
+    def refresh_search_index(self):
+        """대량 적재 후 검색 인덱스/통계 갱신 (인덱스 보장 + ANALYZE)."""
+        try:
+            if self.engine is None:
+                self.create_engine()
+            
+            # IF NOT EXISTS이므로 이미 있으면 통계만 갱신됨
+            self.create_vector_index()
+            with self.engine.begin() as conn:
+                conn.execute(text("ANALYZE sns_trends"))
+            
+            logger.info("트렌드 검색 인덱스 갱신 완료")
+            
+        except Exception as e:
+            logger.error(f"트렌드 검색 인덱스 갱신 실패: {e}")
+            raise
+    
     def initialize(self):
         """Vector 데이터베이스 초기화."""
         try:
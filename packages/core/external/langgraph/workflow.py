@@ -1,6 +1,6 @@
 """LangGraph 워크플로우 서비스."""
 
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Dict
 from langgraph.graph import StateGraph, END
 from packages.infrastructure.logging import get_logger
 
@@ -23,10 +23,18 @@ from packages.infrastructure.nodes.generation.chat_title_generation_node import
 class LangGraphWorkflowService:
     """LangGraph 워크플로우 서비스."""
     
-    def __init__(self, uow_factory):
-        """워크플로우 서비스 초기화."""
+    def __init__(self, uow_factory, async_uow_factory=None, use_async_llm: bool = False):
+        """워크플로우 서비스 초기화.
+
+        async_uow_factory가 주어지면(API) 저장 노드는 AsyncSqlAlchemyUoW로 저장하고,
+        use_async_llm이 True면(API) 생성 노드는 LLM을 ainvoke로 호출해 이벤트 루프를 막지 않습니다.
+        둘 다 없으면(Celery 워커) 생성/저장 모두 동기 경로를 사용합니다.
+        """
         self.logger = get_logger(__name__)
         self.uow_factory = uow_factory
+        self.async_uow_factory = async_uow_factory
+        self.use_async_save = async_uow_factory is not None
+        self.use_async_llm = use_async_llm
         
         # 워크플로우 구축
         self.mission_workflow = self._build_mission_workflow()
@@ -49,6 +57,15 @@ class LangGraphWorkflowService:
             **kwargs
         }
 
+    def _create_save_node(self, node_cls, table):
+        """UoW 종류(동기/비동기)에 맞는 저장 노드를 생성합니다."""
+        uow_factory = self.async_uow_factory if self.use_async_save else self.uow_factory
+        return node_cls(uow_factory, table)
+
+    def _generation_action(self, node):
+        """실행 환경에 맞는 생성 노드 경로 (API: 비동기 acall, Celery 워커: 동기 __call__)."""
+        return node.acall if self.use_async_llm else node
+
     def _build_mission_workflow(self):
         """미션 생성 워크플로우를 구축합니다."""
         from packages.infrastructure.nodes.states.langgraph_state import MissionState
@@ -57,11 +74,11 @@ class LangGraphWorkflowService:
         
         # AI 생성 노드
         generation_node = MissionGenerationNode()
-        sg.add_node(generation_node.name, generation_node)
+        sg.add_node(generation_node.name, self._generation_action(generation_node))
         
         # 저장 노드
-        save_node = SaveMissionNode(self.uow_factory, Mission)
-        sg.add_node(save_node.name, save_node.save_missions)
+        save_node = self._create_save_node(SaveMissionNode, Mission)
+        sg.add_node(save_node.name, save_node.asave_missions if self.use_async_save else save_node.save_missions)
         
         # 엣지 연결
         sg.add_edge(generation_node.name, save_node.name)
@@ -78,11 +95,11 @@ class LangGraphWorkflowService:
         
         # AI 생성 노드
         generation_node = MissionStepGenerationNode()
-        sg.add_node(generation_node.name, generation_node)
+        sg.add_node(generation_node.name, self._generation_action(generation_node))
         
         # 저장 노드
-        save_node = SaveMissionStepNode(self.uow_factory, MissionStep)
-        sg.add_node(save_node.name, save_node.save_mission_steps)
+        save_node = self._create_save_node(SaveMissionStepNode, MissionStep)
+        sg.add_node(save_node.name, save_node.asave_mission_steps if self.use_async_save else save_node.save_mission_steps)
         
         # 엣지 연결
         sg.add_edge(generation_node.name, save_node.name)
@@ -104,11 +121,11 @@ class LangGraphWorkflowService:
         
         # AI 생성 노드
         generation_node = SideJobGenerationNode()
-        sg.add_node(generation_node.name, generation_node)
+        sg.add_node(generation_node.name, self._generation_action(generation_node))
         
         # 저장 노드
-        save_node = SaveSideJobNode(self.uow_factory, SideJob)
-        sg.add_node(save_node.name, save_node.save_side_jobs)
+        save_node = self._create_save_node(SaveSideJobNode, SideJob)
+        sg.add_node(save_node.name, save_node.asave_side_jobs if self.use_async_save else save_node.save_side_jobs)
         
         # 엣지 연결
         sg.add_edge(trend_retrieval_node.name, generation_node.name)
@@ -126,11 +143,11 @@ class LangGraphWorkflowService:
         
         # AI 재생성 노드
         generation_node = RegenerateSideJobGenerationNode()
-        sg.add_node(generation_node.name, generation_node)
+        sg.add_node(generation_node.name, self._generation_action(generation_node))
         
         # 저장 노드
-        save_node = SaveSideJobNode(self.uow_factory, SideJob)
-        sg.add_node(save_node.name, save_node.save_side_jobs)
+        save_node = self._create_save_node(SaveSideJobNode, SideJob)
+        sg.add_node(save_node.name, save_node.asave_side_jobs if self.use_async_save else save_node.save_side_jobs)
         
         # 엣지 연결
         sg.add_edge(generation_node.name, save_node.name)
@@ -147,10 +164,10 @@ class LangGraphWorkflowService:
         sg = StateGraph(SideJobState)
 
         generation_node = SideJobGenerationNode()
-        sg.add_node(generation_node.name, generation_node)
+        sg.add_node(generation_node.name, self._generation_action(generation_node))
 
-        save_node = SaveSideJobNode(self.uow_factory, SideJob)
-        sg.add_node(save_node.name, save_node.save_side_jobs)
+        save_node = self._create_save_node(SaveSideJobNode, SideJob)
+        sg.add_node(save_node.name, save_node.asave_side_jobs if self.use_async_save else save_node.save_side_jobs)
 
         sg.add_edge(generation_node.name, save_node.name)
         sg.add_edge(save_node.name, END)
@@ -167,11 +184,11 @@ class LangGraphWorkflowService:
         
         # AI 생성 노드
         generation_node = MissionStepRegenerationNode()
-        sg.add_node(generation_node.name, generation_node)
+        sg.add_node(generation_node.name, self._generation_action(generation_node))
         
         # 저장 노드
-        save_node = SaveMissionStepNode(self.uow_factory, MissionStep)
-        sg.add_node(save_node.name, save_node.save_mission_steps)
+        save_node = self._create_save_node(SaveMissionStepNode, MissionStep)
+        sg.add_node(save_node.name, save_node.asave_mission_steps if self.use_async_save else save_node.save_mission_steps)
         
         # 엣지 연결
         sg.add_edge(generation_node.name, save_node.name)
@@ -187,6 +204,7 @@ class LangGraphWorkflowService:
         sg = StateGraph(ChatState)
 
         generation_node = ChatGenerationNode()
+        self.chat_generation_node_name = generation_node.name
 #         classify_node = ChatClassifyNode(generation_node.llm)
 
         def _get_state_value(state: ChatState, key: str, default=None):
@@ -214,7 +232,7 @@ class LangGraphWorkflowService:
             return _update_state(state, {"ai_result": payload})
 
 #         sg.add_node(classify_node.name, classify_node)
-        sg.add_node(generation_node.name, generation_node)
+        sg.add_node(generation_node.name, self._generation_action(generation_node))
 #         sg.add_node("chat_request_related", _handle_irrelevant)
 
 #         sg.add_conditional_edges(
@@ -240,7 +258,7 @@ class LangGraphWorkflowService:
         sg = StateGraph(TitleState)
         
         generation_node = ChatTitleGenerationNode()
-        sg.add_node(generation_node.name, generation_node)
+        sg.add_node(generation_node.name, self._generation_action(generation_node))
         
         sg.add_edge(generation_node.name, END)
         sg.set_entry_point(generation_node.name)
@@ -255,7 +273,7 @@ class LangGraphWorkflowService:
 
         # AI 검증 노드
         validation_node = ValidateCustomSideJobNode()
-        sg.add_node(validation_node.name, validation_node)
+        sg.add_node(validation_node.name, self._generation_action(validation_node))
 
         # END로 연결 (검증만 수행하므로 저장 없음)
         sg.add_edge(validation_node.name, END)
@@ -290,12 +308,13 @@ class LangGraphWorkflowService:
             self.logger.error(f"미션 단계 생성 오류: {e}")
             raise
 
-    async def generate_side_jobs(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
-        """사이드잡을 생성합니다."""
+    async def generate_side_jobs(self, request_data: Dict[str, Any], bypass_cache: bool = False) -> Dict[str, Any]:
+        """사이드잡을 생성합니다 (bypass_cache=True면 의미 기반 캐시를 건너뜀)."""
         try:
             initial_state = self._create_initial_state(
                 profile_data=request_data,
-                user_id=request_data.get("user_id")
+                user_id=request_data.get("user_id"),
+                cache_bypass=bypass_cache
             )
             
             result = await self.side_job_workflow.ainvoke(initial_state)
@@ -383,12 +402,44 @@ class LangGraphWorkflowService:
             self.logger.error(f"챗봇 응답 생성 실패: {e}")
             raise
 
-    async def generate_title(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
-        """챗봇 대화 제목을 생성합니다."""
+    async def astream_chat(self, request_data: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """챗봇 응답을 토큰 단위로 스트리밍합니다.
+
+        생성 노드의 LLM 호출에서 나오는 토큰을 {"type": "token", "delta": ...}로 바로 내보내고,
+        워크플로우가 끝나면 최종 본문과 토큰 사용량을 {"type": "done", ...}으로 내보냅니다.
+        호출 측에서 제너레이터를 닫거나 태스크를 취소하면(클라이언트 연결 종료) LLM 스트림도 함께 닫혀 생성이 중단됩니다.
+        """
+        initial_state = self._create_initial_state(
+            request_data=request_data,
+            user_id=request_data.get("user_id"),
+        )
+        final_state: Dict[str, Any] = {}
+        try:
+            async for mode, payload in self.chat_workflow.astream(initial_state, stream_mode=["messages", "values"]):
+                if mode == "values":
+                    final_state = payload
+                    continue
+
+                chunk, metadata = payload
+                if metadata.get("langgraph_node") != self.chat_generation_node_name:
+                    continue
+                delta = chunk.content if isinstance(chunk.content, str) else ""
+                if delta:
+                    yield {"type": "token", "delta": delta}
+        except Exception as e:
+            self.logger.error(f"챗봇 응답 스트리밍 실패: {e}")
+            raise
+
+        ai_result = final_state.get("ai_result") or {}
+        yield {"type": "done", "message": ai_result.get("message", ""), "usage": ai_result.get("usage")}
+
+    async def generate_title(self, request_data: Dict[str, Any], bypass_cache: bool = False) -> Dict[str, Any]:
+        """챗봇 대화 제목을 생성합니다 (bypass_cache=True면 응답 캐시를 건너뜀)."""
         try:
             initial_state = self._create_initial_state(
                 request_data=request_data,
                 user_id=request_data.get("user_id"),
+                cache_bypass=bypass_cache,
             )
             result = await self.title_workflow.ainvoke(initial_state)
             return result.get("ai_result", {})
@@ -396,11 +447,12 @@ class LangGraphWorkflowService:
             self.logger.error(f"챗봇 제목 생성 실패: {e}")
             raise
 
-    async def validate_custom_side_job(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
-        """부업 검증 응답을 생성합니다."""
+    async def validate_custom_side_job(self, request_data: Dict[str, Any], bypass_cache: bool = False) -> Dict[str, Any]:
+        """부업 검증 응답을 생성합니다 (bypass_cache=True면 응답 캐시를 건너뜀)."""
         try:
             initial_state = self._create_initial_state(
-                request_data=request_data
+                request_data=request_data,
+                cache_bypass=bypass_cache
             )
             result = await self.validate_custom_side_job_workflow.ainvoke(initial_state)
             if isinstance(result, dict):
@@ -0,0 +1,28 @@
+"""RSS 피드별 크롤링 상태를 위한 도메인 엔티티."""
+
+from datetime import datetime
+from sqlalchemy import Column, String, DateTime, Integer, Float, JSON
+from packages.domain.entities.base import Base
+
+
+class CrawlFeedState(Base):
+    """피드별 조건부 요청(ETag/Last-Modified), 본문 변경 감지, 증분 크롤링 워터마크 및 health 상태 테이블."""
+
+    __tablename__ = "crawl_feed_states"
+
+    feed_url = Column(String(1000), primary_key=True)
+    etag = Column(String(500), nullable=True)  # 마지막 응답의 ETag
+    last_modified = Column(String(100), nullable=True)  # 마지막 응답의 Last-Modified
+    body_digest = Column(String(64), nullable=True)  # 마지막으로 파싱한 본문의 sha256
+    last_status = Column(String(20), nullable=True)  # parsed, not_modified, unchanged, error
+    last_checked_at = Column(DateTime, nullable=True)  # 마지막 요청 시각
+    last_changed_at = Column(DateTime, nullable=True)  # 본문이 마지막으로 바뀐 시각
+    watermark_entry_id = Column(String(1000), nullable=True)  # 마지막으로 처리한 가장 최근 항목의 GUID/링크
+    watermark_published_at = Column(DateTime, nullable=True)  # 그 항목의 게시 시각 (UTC)
+    consecutive_failures = Column(Integer, default=0, nullable=True)  # 연속 실패 횟수
+    latency_samples = Column(JSON, nullable=True)  # 최근 응답 시간 샘플 (ms)
+    latency_median_ms = Column(Float, nullable=True)  # 응답 시간 중앙값 (ms)
+    items_per_day = Column(Float, nullable=True)  # 관측한 게시 빈도
+    circuit_open_until = Column(DateTime, nullable=True)  # 서킷이 열려 있는 시각 (이때까지 건너뜀)
+    next_crawl_at = Column(DateTime, nullable=True)  # 적응형 다음 크롤링 시각
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
@@ -1,15 +1,23 @@
 """SNS 트렌드 정보를 위한 도메인 엔티티."""
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, JSON, Index
 from sqlalchemy.dialects.postgresql import UUID
+from pgvector.sqlalchemy import Vector
 from packages.domain.entities.base import Base
 
+# 임베딩 벡터 차원 (sentence-transformers/all-MiniLM-L6-v2, Settings.embedding_dimension과 동일)
+EMBEDDING_DIMENSION = 384
+
 
 class SNSTrend(Base):
     """SNS 트렌드 정보 테이블."""
     
     __tablename__ = "sns_trends"
+    __table_args__ = (
+        # 크롤링 중복 방지용 콘텐츠 식별 키 (INSERT ... ON CONFLICT 대상)
+        Index("ux_sns_trends_content_key", "content_key", unique=True),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     uuid = Column(UUID, unique=True, nullable=False)  # 실제 테이블에 있는 uuid 필드
@@ -18,6 +26,7 @@ class SNSTrend(Base):
     title = Column(String(500), nullable=False)
     content = Column(Text, nullable=False)
     url = Column(String(1000), nullable=True)
+    content_key = Column(String(64), nullable=True)  # sha256(정규화 URL + 제목 해시)
     tags = Column(JSON, nullable=True)  # 해시태그, 키워드 등
     engagement_metrics = Column(JSON, nullable=True)  # 좋아요, 댓글, 공유 수 등
     legal_implications = Column(Text, nullable=True)  # 법적 동향 정보
@@ -33,5 +42,5 @@ class TrendEmbedding(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     trend_uuid = Column(UUID, nullable=False, index=True)  # sns_trends.uuid 참조
-    embedding = Column(Text, nullable=False)  # pgvector의 vector 타입 (실제로는 Text로 저장)
+    embedding = Column(Vector(EMBEDDING_DIMENSION), nullable=False)  # pgvector의 vector 타입
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
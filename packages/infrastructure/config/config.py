@@ -2,7 +2,7 @@ import threading
 import time
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
@@ -51,12 +51,62 @@ class Settings(BaseSettings):
     embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2"  # 기본 임베딩 모델
     embedding_dimension: int = 384  # 벡터 차원
     vector_similarity_threshold: float = 0.7  # 유사도 임계값
+    vector_index_type: str = "hnsw"  # 벡터 인덱스 종류 (hnsw | ivfflat)
+    vector_hnsw_m: int = 16  # HNSW 노드당 최대 연결 수
+    vector_hnsw_ef_construction: int = 64  # HNSW 인덱스 생성 시 후보 리스트 크기
+    vector_hnsw_ef_search: int = 40  # HNSW 검색 시 후보 리스트 크기 (limit보다 작으면 limit 사용)
+    vector_ivfflat_lists: int = 100  # IVFFlat 클러스터 수
+    embedding_cache_enabled: bool = True  # 임베딩 캐시 사용 여부
+    embedding_cache_memory_size: int = 4096  # 프로세스 내 LRU 항목 수
+    embedding_cache_path: str = ".cache/embeddings.sqlite3"  # 디스크 캐시 경로 (빈 문자열이면 메모리만 사용)
+    embedding_cache_max_entries: int = 200000  # 디스크 캐시 최대 항목 수
+    embedding_batch_window_ms: float = 5.0  # 동시 임베딩 요청을 모으는 최대 대기 시간 (ms)
+    embedding_batch_max_size: int = 64  # 한 번에 임베딩할 최대 텍스트 수
     
+    # LLM 클라이언트 커넥션 풀 설정 ((model, base_url)별로 프로세스당 하나)
+    llm_max_connections: int = 50  # 최대 동시 커넥션 수
+    llm_max_keepalive_connections: int = 20  # 유지할 keep-alive 커넥션 수
+    llm_keepalive_expiry: float = 30.0  # 유휴 keep-alive 커넥션 유지 시간 (초)
+    llm_timeout: float = 120.0  # LLM 요청 타임아웃 (초)
+    
+    # LLM 응답 캐시 설정 (입력이 같으면 같은 응답을 써도 되는 노드, 완전 일치)
+    llm_cache_enabled: bool = True  # LLM 응답 캐시 사용 여부
+    llm_cache_memory_size: int = 2048  # 프로세스 내 LRU 항목 수
+    llm_cache_valkey_url: str = ""  # 공유 캐시 Valkey URL (예: redis://valkey:6379/1, 비어 있으면 메모리만 사용)
+    llm_cache_default_ttl: int = 86400  # 노드별 TTL이 없을 때 기본 TTL (초)
+    llm_cache_ttls: Dict[str, int] = {  # 노드 이름별 TTL (초, 환경 변수는 JSON)
+        "validate_custom_side_job": 7 * 86400,
+        "chat_title_generate": 86400,
+    }
+
+    # 사이드잡 생성 의미 기반 캐시 설정 (정규화 프로필 임베딩 유사도, 표현 방식별)
+    llm_semantic_cache_enabled: bool = True  # 의미 기반 캐시 사용 여부
+    llm_semantic_cache_threshold: float = 0.95  # 적중으로 보는 최소 코사인 유사도
+    llm_semantic_cache_thresholds: Dict[str, float] = {}  # 표현 방식별 임계값 (예: {"VIDEO": 0.97}, 환경 변수는 JSON)
+    llm_semantic_cache_ttl_minutes: int = 0  # 항목 유효 시간 (0이면 crawling_min_interval_minutes)
+    llm_semantic_cache_max_entries: int = 512  # 표현 방식별 최대 항목 수
+    llm_semantic_cache_shuffle: bool = True  # 재사용할 때 사이드잡 순서를 사용자별로 섞어 같은 목록이 그대로 보이지 않게 함
+
     # 크롤링 설정
     crawling_user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
     crawling_delay_min: int = 1  # 크롤링 간 최소 지연 시간 (초)
     crawling_delay_max: int = 3  # 크롤링 간 최대 지연 시간 (초)
     crawling_timeout: int = 30  # 크롤링 타임아웃 (초)
+    crawling_async: bool = True  # httpx 비동기 클라이언트로 피드 동시 수집
+    crawling_max_connections: int = 20  # 비동기 크롤링 커넥션 풀 크기
+    crawling_stream_batch_size: int = 100  # 크롤링 결과를 저장하는 마이크로 배치 크기
+    crawling_parse_workers: int = 0  # 항목 HTML 파싱 프로세스 수 (0이면 크롤링 프로세스에서 파싱, -1이면 CPU 코어 수)
+    crawling_parse_chunk_size: int = 64  # 파싱 프로세스에 한 번에 보내는 항목 수
+    crawling_html_parser: str = "auto"  # BeautifulSoup 파서 (auto: lxml이 설치돼 있으면 lxml, html.parser)
+    crawling_circuit_failure_threshold: int = 3  # 피드 서킷을 여는 연속 실패 횟수
+    crawling_circuit_base_backoff_minutes: int = 30  # 서킷 첫 대기 시간 (이후 실패마다 두 배)
+    crawling_circuit_max_backoff_hours: int = 48  # 서킷 최대 대기 시간
+    crawling_min_interval_minutes: int = 60  # 피드 최소 크롤링 주기
+    crawling_max_interval_hours: int = 24  # 피드 최대 크롤링 주기
+    crawling_feed_soft_time_limit: int = 90  # 피드별 크롤링 태스크 소프트 시간 제한 (초)
+    crawling_feed_time_limit: int = 120  # 피드별 크롤링 태스크 하드 시간 제한 (초)
+    crawling_feed_max_retries: int = 3  # 피드별 크롤링 태스크 최대 재시도 횟수
+    crawling_dispatch_lease_minutes: int = 30  # 디스패치한 피드를 다시 디스패치하지 않는 시간 (태스크가 끝나지 않으면 이후 다시 대상)
     
     # RSS 크롤링 설정 (News API 제거됨)
 
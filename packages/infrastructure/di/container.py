@@ -1,9 +1,9 @@
 """Dependency Injection 컨테이너."""
 
 from dependency_injector import containers, providers
-from packages.core.db.database import create_database_engine_from_config
+from packages.core.db.engine_registry import get_engine
 from packages.core.external.langgraph.workflow import LangGraphWorkflowService
-from packages.core.db.uow_sqlalchemy import SqlAlchemyUoW
+from packages.core.db.uow_sqlalchemy import SqlAlchemyUoW, AsyncSqlAlchemyUoW
 from packages.infrastructure.config.config import get_settings
 from packages.infrastructure.logging import get_logger
 
@@ -15,14 +15,24 @@ class Container(containers.DeclarativeContainer):
     config = providers.Singleton(get_settings)
     logger = providers.Singleton(get_logger, "app")
     
-    # 데이터베이스
-    database_engine = providers.Singleton(create_database_engine_from_config)
+    # 데이터베이스 (프로세스 공유 엔진, fork 후 자동 재생성)
+    database_engine = providers.Callable(get_engine)
     
     # Unit of Work
     uow = providers.Factory(SqlAlchemyUoW)
+    async_uow = providers.Factory(AsyncSqlAlchemyUoW)
     
     # LangGraph 워크플로우 (싱글톤으로 변경)
+    # API(이벤트 루프)용: 저장 노드는 AsyncSqlAlchemyUoW, 생성 노드는 ainvoke 사용
     langgraph_workflow = providers.Singleton(
+        LangGraphWorkflowService,
+        uow_factory=uow.provider,
+        async_uow_factory=async_uow.provider,
+        use_async_llm=True
+    )
+    
+    # Celery 워커용: 저장 노드가 동기 SqlAlchemyUoW 사용
+    worker_langgraph_workflow = providers.Singleton(
         LangGraphWorkflowService,
         uow_factory=uow.provider
     )
@@ -1,7 +1,7 @@
 """공통 노드 베이스 클래스 - 중복 제거 및 API 응답 최적화."""
 
 from abc import ABC, abstractmethod
-from contextlib import AbstractContextManager
+from contextlib import AbstractContextManager, AbstractAsyncContextManager
 from typing import Dict, List, TypeVar, Generic, Union, Optional
 from sqlalchemy import insert, update, Table
 from sqlalchemy.dialects.postgresql import insert
@@ -73,29 +73,56 @@ class BaseSaveNode(BaseNode[T]):
                 
                 # SqlAlchemyUoW는 컨텍스트 매니저로 자동 커밋됨
             
-            # 공통 필드들 유지하면서 saved_entities 업데이트
-            common_fields = {
-                "user_id": state.get("user_id"),
-                "profile_data": state.get("profile_data"),
-                "request_data": state.get("request_data"),
-                "sidejob_id": state.get("sidejob_id"),
-                "mission_id": state.get("mission_id")
-            }
+            return self._update_saved_state(state, saved_entities)
             
-            # None이 아닌 값만 포함
-            filtered_common_fields = {k: v for k, v in common_fields.items() if v is not None}
+        except Exception as e:
+            self.logger.error(f"{entity_key} 저장 실패: {e}")
+            raise
+    
+    async def asave_entities(self, state: T, entity_key: str, post_save_hook=None) -> T:
+        """엔티티들을 비동기로 저장합니다 (AsyncSqlAlchemyUoW 사용)."""
+        try:
+            entities = self._safe_get_nested(state, "ai_result", entity_key, default=[])
+            if not entities:
+                self.logger.warning(f"{entity_key}가 없습니다.")
+                return self._update_state(state, {"saved_entities": []})
             
-            updates = {
-                "saved_entities": saved_entities,
-                **filtered_common_fields
-            }
+            async with self.uow_factory() as uow:
+                saved_entities = await self._aprocess_entities(uow, entities, state)
+                
+                # 저장 후 후처리 훅 실행 (같은 트랜잭션에서)
+                if post_save_hook:
+                    await post_save_hook(uow, state, saved_entities)
+                
+                # AsyncSqlAlchemyUoW는 비동기 컨텍스트 매니저로 자동 커밋됨
             
-            return self._update_state(state, updates)
+            return self._update_saved_state(state, saved_entities)
             
         except Exception as e:
             self.logger.error(f"{entity_key} 저장 실패: {e}")
             raise
     
+    def _update_saved_state(self, state: T, saved_entities: List[Dict[str, Union[int, str, bool]]]) -> T:
+        """저장 결과로 상태 업데이트 - 동기/비동기 공통 로직."""
+        # 공통 필드들 유지하면서 saved_entities 업데이트
+        common_fields = {
+            "user_id": state.get("user_id"),
+            "profile_data": state.get("profile_data"),
+            "request_data": state.get("request_data"),
+            "sidejob_id": state.get("sidejob_id"),
+            "mission_id": state.get("mission_id")
+        }
+        
+        # None이 아닌 값만 포함
+        filtered_common_fields = {k: v for k, v in common_fields.items() if v is not None}
+        
+        updates = {
+            "saved_entities": saved_entities,
+            **filtered_common_fields
+        }
+        
+        return self._update_state(state, updates)
+    
     def _process_entities(self, uow: AbstractContextManager, entities: List[Dict[str, Union[int, str, bool]]], state: T) -> List[Dict[str, Union[int, str, bool]]]:
         """엔티티 처리 (INSERT/UPDATE)."""
         if not entities:
@@ -110,18 +137,36 @@ class BaseSaveNode(BaseNode[T]):
         result = uow.session.execute(stmt)
         
         inserted_ids = result.fetchall()
+        self._merge_inserted(entities, insert_data, inserted_ids)
+        
+        return entities
+    
+    async def _aprocess_entities(self, uow: AbstractAsyncContextManager, entities: List[Dict[str, Union[int, str, bool]]], state: T) -> List[Dict[str, Union[int, str, bool]]]:
+        """엔티티 비동기 처리 (INSERT/UPDATE)."""
+        if not entities:
+            return []
+        
+        return await self._ainsert_entities(uow, entities, state)
+    
+    async def _ainsert_entities(self, uow: AbstractAsyncContextManager, entities: List[Dict[str, Union[int, str, bool]]], state: T) -> List[Dict[str, Union[int, str, bool]]]:
+        """엔티티 비동기 삽입."""
+        insert_data = [self._prepare_data(entity, state) for entity in entities]
+        stmt = insert(self.table).values(insert_data).returning(self.table.c.id)
+        result = await uow.session.execute(stmt)
+        
+        inserted_ids = result.fetchall()
+        self._merge_inserted(entities, insert_data, inserted_ids)
         
-        # INSERT된 entities에 ID와 모든 필드 추가
+        return entities
+    
+    def _merge_inserted(self, entities, insert_data, inserted_ids) -> None:
+        """INSERT된 entities에 ID와 모든 필드 추가."""
         for i, entity in enumerate(entities):
             if i < len(inserted_ids):
                 # 원본 엔티티 데이터 유지하면서 ID와 prepared_data 추가
                 prepared_data = insert_data[i]
                 entity.update(prepared_data)
                 entity["id"] = inserted_ids[i][0]
-        
-        return entities
-
-    
     
     @abstractmethod
     def _prepare_data(self, entity: Dict[str, Union[int, str, bool]], state: T) -> Dict[str, Union[int, str, bool]]:
@@ -132,8 +177,23 @@ class BaseSaveNode(BaseNode[T]):
 class BaseGenerationNode(BaseNode[T]):
     """AI 생성 노드를 위한 베이스 클래스."""
     
+    # 프롬프트나 결과 후처리를 바꾸면 올려서 이전 응답 캐시를 무효화
+    prompt_version = "1"
+    
     def __init__(self, name: str):
         super().__init__(name)
+        # 완전 일치 응답 캐시 (입력이 같으면 같은 응답을 써도 되는 노드만 설정)
+        self.response_cache = None
+    
+    def _response_cache_key(self, state: T, inputs: Dict[str, Union[str, List[str]]]) -> Optional[str]:
+        """응답 캐시 키 (캐시를 쓰지 않거나 요청이 캐시 우회를 지정하면 None)."""
+        if self.response_cache is None:
+            return None
+        if state.get("cache_bypass"):
+            self.response_cache.record_bypass(self.name)
+            return None
+        model = getattr(self.llm, "model_name", None) or ""
+        return self.response_cache.make_key(self.name, model, self.prompt_version, inputs)
     
     def _update_generation_state(self, state: T, result) -> T:
         """생성 결과로 상태 업데이트 - 공통 로직."""
@@ -1,11 +1,10 @@
 """부업 가이드 챗봇 응답 생성을 위한 LangGraph 노드."""
 
 from typing import Dict, Union, List
-from packages.infrastructure.config.config import get_settings
+from packages.infrastructure.services.llm.llm_client_factory import get_llm_client_factory
 from packages.infrastructure.nodes.base_node import BaseGenerationNode
 from packages.infrastructure.prompts.chat_prompts import ChatPrompts
 from packages.infrastructure.nodes.states.langgraph_state import ChatState
-from langchain_naver import ChatClovaX
 
 
 class ChatGenerationNode(BaseGenerationNode[ChatState]):
@@ -13,46 +12,63 @@ class ChatGenerationNode(BaseGenerationNode[ChatState]):
 
     def __init__(self):
         super().__init__("chat_generate")
-        self.settings = get_settings()
 
-        self.llm = ChatClovaX(
-            api_key=self.settings.clova_x_api_key,
-            base_url=self.settings.clova_x_base_url,
-            model=self.settings.clova_x_model,
-            temperature=0.5,
-            max_tokens=512,
-            thinking={"effort": "none"},
-        )
+        # LLM 설정 (프로세스 공유 커넥션 풀을 쓰는 설정 뷰)
+        # stream_usage: 스트리밍(/ai/chat/stream)에서도 마지막 청크로 토큰 사용량을 받음
+        self.llm = get_llm_client_factory().get_llm(temperature=0.5, max_tokens=512, stream_usage=True)
 
         self.prompt_templates = ChatPrompts()
 
     def __call__(self, state: ChatState) -> ChatState:
+        """노드 실행 (동기, Celery 워커용)."""
         try:
-            prompt_data = self._prepare_prompt_data(state)
-            prompt = self.prompt_templates.create_prompt_template()
-
-            chain = prompt | self.llm
+            prompt_data, chain = self._build_chain(state)
             result = chain.invoke(prompt_data)
+            return self._update_generation_state(state, self._to_payload(result))
+        except Exception as e:
+            self.logger.error(f"챗봇 응답 생성 오류: {str(e)}")
+            raise
 
-            text = getattr(result, "content", None) or str(result)
-            meta = getattr(result, "response_metadata", {}) or {}
-            usage = (meta.get("token_usage") or {})  # {'prompt_tokens':..., 'completion_tokens':..., 'total_tokens':...}
-
-            payload = {
-                "message": text,    # 클라이언트가 쓸 본문
-                "usage": {          # 비용 모니터링용
-                    "prompt_tokens": usage.get("prompt_tokens"),
-                    "completion_tokens": usage.get("completion_tokens"),
-                    "total_tokens": usage.get("total_tokens"),
-                    "model": meta.get("model_name"),
-                }
-            }
-            updated_state = self._update_generation_state(state, payload)
-            return updated_state
+    async def acall(self, state: ChatState) -> ChatState:
+        """노드 실행 (비동기, LLM 응답을 기다리는 동안 이벤트 루프를 막지 않음)."""
+        try:
+            prompt_data, chain = self._build_chain(state)
+            result = await chain.ainvoke(prompt_data)
+            return self._update_generation_state(state, self._to_payload(result))
         except Exception as e:
             self.logger.error(f"챗봇 응답 생성 오류: {str(e)}")
             raise
 
+    def _build_chain(self, state: ChatState):
+        """프롬프트 데이터와 Chain 구성 (동기/비동기 공통)."""
+        prompt_data = self._prepare_prompt_data(state)
+        prompt = self.prompt_templates.create_prompt_template()
+        return prompt_data, prompt | self.llm
+
+    def _to_payload(self, result) -> Dict[str, Union[str, Dict]]:
+        """LLM 응답을 본문 + 토큰 사용량 payload로 변환."""
+        text = getattr(result, "content", None) or str(result)
+        meta = getattr(result, "response_metadata", {}) or {}
+        usage = (meta.get("token_usage") or {})  # {'prompt_tokens':..., 'completion_tokens':..., 'total_tokens':...}
+        if not usage:
+            # 스트리밍으로 합쳐진 응답은 usage_metadata에만 사용량이 있음
+            usage_metadata = getattr(result, "usage_metadata", None) or {}
+            usage = {
+                "prompt_tokens": usage_metadata.get("input_tokens"),
+                "completion_tokens": usage_metadata.get("output_tokens"),
+                "total_tokens": usage_metadata.get("total_tokens"),
+            }
+
+        return {
+            "message": text,    # 클라이언트가 쓸 본문
+            "usage": {          # 비용 모니터링용
+                "prompt_tokens": usage.get("prompt_tokens"),
+                "completion_tokens": usage.get("completion_tokens"),
+                "total_tokens": usage.get("total_tokens"),
+                "model": meta.get("model_name"),
+            }
+        }
+
     def _prepare_prompt_data(self, state: ChatState) -> Dict[str, Union[str, List[str]]]:
         request_data = self._safe_get(state, "request_data", {})
         history = request_data.get("history", [])
@@ -1,11 +1,12 @@
 """챗봇 대화 제목 생성을 위한 LangGraph 노드."""
 
+import time
 from typing import Dict, Union
-from packages.infrastructure.config.config import get_settings
+from packages.infrastructure.services.llm.llm_client_factory import get_llm_client_factory
+from packages.infrastructure.services.llm.llm_response_cache import get_llm_response_cache
 from packages.infrastructure.nodes.base_node import BaseGenerationNode
 from packages.infrastructure.prompts.chat_title_prompts import ChatTitlePrompts
 from packages.infrastructure.nodes.states.langgraph_state import TitleState
-from langchain_naver import ChatClovaX
 
 
 class ChatTitleGenerationNode(BaseGenerationNode[TitleState]):
@@ -13,45 +14,71 @@ class ChatTitleGenerationNode(BaseGenerationNode[TitleState]):
 
     def __init__(self):
         super().__init__("chat_title_generate")
-        self.settings = get_settings()
 
-        self.llm = ChatClovaX(
-            api_key=self.settings.clova_x_api_key,
-            base_url=self.settings.clova_x_base_url,
-            model=self.settings.clova_x_model,
-            temperature=0.3,
-            max_tokens=50,
-            thinking={"effort": "none"},
-        )
+        # LLM 설정 (프로세스 공유 커넥션 풀을 쓰는 설정 뷰)
+        self.llm = get_llm_client_factory().get_llm(temperature=0.3, max_tokens=50)
 
         self.prompt_templates = ChatTitlePrompts()
+        # 같은 첫 질문에는 같은 제목을 재사용
+        self.response_cache = get_llm_response_cache()
 
     def __call__(self, state: TitleState) -> TitleState:
+        """노드 실행 (동기, Celery 워커용)."""
         try:
-            prompt_data = self._prepare_prompt_data(state)
-            prompt = self.prompt_templates.create_prompt_template()
-
-            chain = prompt | self.llm
-            result = chain.invoke(prompt_data)
-
-            # result에서 텍스트 추출 및 정제
-            text = getattr(result, "content", None) or str(result)
-            title = text.strip()
-            # 특수문자 및 개행 제거
-            disallowed_chars = ['"', "'", "(`)", "()", "[]", "{}", "\n", "\r", "…"]
-            for ch in disallowed_chars:
-                title = title.replace(ch, "")
-            # 최대 15자 제한
-            if len(title) > 15:
-                title = title[:15]
-
-            payload = {"title": title}
-            updated_state = self._update_generation_state(state, payload)
-            return updated_state
+            prompt_data, chain = self._build_chain(state)
+            cache_key = self._response_cache_key(state, prompt_data)
+            if cache_key:
+                title = self.response_cache.get(self.name, cache_key)
+                if title is not None:
+                    return self._update_generation_state(state, {"title": title})
+
+            started = time.perf_counter()
+            title = self._clean_title(chain.invoke(prompt_data))
+            if cache_key and title:
+                self.response_cache.set(self.name, cache_key, title, time.perf_counter() - started)
+            return self._update_generation_state(state, {"title": title})
         except Exception as e:
             self.logger.error(f"챗봇 제목 생성 오류: {str(e)}")
             raise
 
+    async def acall(self, state: TitleState) -> TitleState:
+        """노드 실행 (비동기, LLM 응답을 기다리는 동안 이벤트 루프를 막지 않음)."""
+        try:
+            prompt_data, chain = self._build_chain(state)
+            cache_key = self._response_cache_key(state, prompt_data)
+            if cache_key:
+                title = await self.response_cache.aget(self.name, cache_key)
+                if title is not None:
+                    return self._update_generation_state(state, {"title": title})
+
+            started = time.perf_counter()
+            title = self._clean_title(await chain.ainvoke(prompt_data))
+            if cache_key and title:
+                await self.response_cache.aset(self.name, cache_key, title, time.perf_counter() - started)
+            return self._update_generation_state(state, {"title": title})
+        except Exception as e:
+            self.logger.error(f"챗봇 제목 생성 오류: {str(e)}")
+            raise
+
+    def _build_chain(self, state: TitleState):
+        """프롬프트 데이터와 Chain 구성 (동기/비동기 공통)."""
+        prompt_data = self._prepare_prompt_data(state)
+        prompt = self.prompt_templates.create_prompt_template()
+        return prompt_data, prompt | self.llm
+
+    def _clean_title(self, result) -> str:
+        """result에서 텍스트 추출 및 정제."""
+        text = getattr(result, "content", None) or str(result)
+        title = text.strip()
+        # 특수문자 및 개행 제거
+        disallowed_chars = ['"', "'", "(`)", "()", "[]", "{}", "\n", "\r", "…"]
+        for ch in disallowed_chars:
+            title = title.replace(ch, "")
+        # 최대 15자 제한
+        if len(title) > 15:
+            title = title[:15]
+        return title
+
     def _prepare_prompt_data(self, state: TitleState) -> Dict[str, Union[str]]:
         request_data = self._safe_get(state, "request_data", {})
         return {
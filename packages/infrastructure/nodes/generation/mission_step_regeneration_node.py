@@ -1,11 +1,10 @@
 """미션 스텝 생성을 위한 LangGraph 노드."""
 
 from typing import Dict, Union, List
-from packages.infrastructure.config.config import get_settings
+from packages.infrastructure.services.llm.llm_client_factory import get_llm_client_factory
 from packages.infrastructure.nodes.base_node import BaseGenerationNode
 from packages.infrastructure.prompts.mission_step_regenerate_prompts import MissionStepRegeneratePrompts
 from packages.presentation.api.dto.response.ai_response_models import MissionStepsAIResponse
-from langchain_naver import ChatClovaX
 from packages.infrastructure.nodes.states.langgraph_state import RegenerateMissionStepState
 
 class MissionStepRegenerationNode(BaseGenerationNode[RegenerateMissionStepState]):
@@ -13,48 +12,46 @@ class MissionStepRegenerationNode(BaseGenerationNode[RegenerateMissionStepState]
     
     def __init__(self):
         super().__init__("generate_mission_steps")
-        self.settings = get_settings()
         
-        # LLM 설정
-        self.llm = ChatClovaX(
-            api_key=self.settings.clova_x_api_key,
-            base_url=self.settings.clova_x_base_url,
-            model=self.settings.clova_x_model,
-            temperature=0.7,
-            max_tokens=1024,  # Set max tokens larger than 1024 to use tool calling
-            thinking={
-                "effort": "none"  # Set to "none" to disable thinking, as structured outputs are incompatible with thinking
-            },
-        )
-        
-        self.llm = self.llm.with_structured_output(MissionStepsAIResponse, method="json_schema")
+        # LLM 설정 (프로세스 공유 커넥션 풀을 쓰는 설정 뷰)
+        self.llm = get_llm_client_factory().get_llm(temperature=0.7, max_tokens=1024, schema=MissionStepsAIResponse)
         
         # 프롬프트 템플릿
         self.prompt_templates = MissionStepRegeneratePrompts()
     
-    async def __call__(self, state: RegenerateMissionStepState) -> RegenerateMissionStepState:
-        """노드 실행."""
+    def __call__(self, state: RegenerateMissionStepState) -> RegenerateMissionStepState:
+        """노드 실행 (동기, Celery 워커용)."""
         try:
+            prompt_data, chain = self._build_chain(state)
+            result = chain.invoke(prompt_data)
+            return self._handle_result(state, result)
             
-            # 프롬프트 데이터 준비
-            prompt_data = self._prepare_prompt_data(state)
-
-            # 프롬프트 생성 및 format_instructions 적용
-            prompt = self.prompt_templates.create_prompt_template()
-
-            # Chain 구성 및 실행
-            chain = prompt | self.llm
+        except Exception as e:
+            self.logger.error(f"미션 스텝 생성 중 오류: {str(e)}")
+            raise
+    
+    async def acall(self, state: RegenerateMissionStepState) -> RegenerateMissionStepState:
+        """노드 실행 (비동기, LLM 응답을 기다리는 동안 이벤트 루프를 막지 않음)."""
+        try:
+            prompt_data, chain = self._build_chain(state)
             result = await chain.ainvoke(prompt_data)
-
-            self.logger.info(f"미션 스텝 생성 완료: {len(result.mission_steps)}개")
-
-            # 공통 상태 업데이트 메서드 사용
-            return self._update_generation_state(state, result)
+            return self._handle_result(state, result)
             
         except Exception as e:
             self.logger.error(f"미션 스텝 생성 중 오류: {str(e)}")
             raise
     
+    def _build_chain(self, state: RegenerateMissionStepState):
+        """프롬프트 데이터와 Chain 구성 (동기/비동기 공통)."""
+        prompt_data = self._prepare_prompt_data(state)
+        prompt = self.prompt_templates.create_prompt_template()
+        return prompt_data, prompt | self.llm
+    
+    def _handle_result(self, state: RegenerateMissionStepState, result) -> RegenerateMissionStepState:
+        """생성 결과로 상태 업데이트 (동기/비동기 공통)."""
+        self.logger.info(f"미션 스텝 생성 완료: {len(result.mission_steps)}개")
+        return self._update_generation_state(state, result)
+    
     def _prepare_prompt_data(self, state: RegenerateMissionStepState) -> Dict[str, Union[str, List[str]]]:
         """프롬프트 데이터 준비."""
         request_data = self._safe_get(state, "request_data", {})
@@ -1,12 +1,11 @@
 """사이드잡 재생성을 위한 LangGraph 노드."""
 
 from typing import Dict, Union, List
-from packages.infrastructure.config.config import get_settings
+from packages.infrastructure.services.llm.llm_client_factory import get_llm_client_factory
 from packages.infrastructure.nodes.base_node import BaseGenerationNode
 from packages.infrastructure.prompts.regenerate_side_job_prompts import RegenerateSideJobPrompts
 from packages.presentation.api.dto.response.ai_response_models import SideJobsAIResponse
 from packages.infrastructure.nodes.states.langgraph_state import SideJobState
-from langchain_naver import ChatClovaX
 
 
 class RegenerateSideJobGenerationNode(BaseGenerationNode[SideJobState]):
@@ -14,50 +13,46 @@ class RegenerateSideJobGenerationNode(BaseGenerationNode[SideJobState]):
     
     def __init__(self):
         super().__init__("regenerate_side_jobs")
-        self.settings = get_settings()
         
-        # LLM 설정
-        self.llm = ChatClovaX(
-            api_key=self.settings.clova_x_api_key,
-            base_url=self.settings.clova_x_base_url,
-            model=self.settings.clova_x_model,
-            temperature=0.7,
-            max_tokens=1024,  # Set max tokens larger than 1024 to use tool calling
-            thinking={
-                "effort": "none"  # Set to "none" to disable thinking, as structured outputs are incompatible with thinking
-            },
-        )
-        
-        # Structured Output 설정
-        self.llm = self.llm.with_structured_output(SideJobsAIResponse, method="json_schema")
+        # LLM 설정 (프로세스 공유 커넥션 풀을 쓰는 설정 뷰)
+        self.llm = get_llm_client_factory().get_llm(temperature=0.7, max_tokens=1024, schema=SideJobsAIResponse)
         
         # 프롬프트 템플릿
         self.prompt_templates = RegenerateSideJobPrompts()
     
     def __call__(self, state: SideJobState) -> SideJobState:
-        """노드 실행."""
+        """노드 실행 (동기, Celery 워커용)."""
         try:
-            # 프롬프트 데이터 준비
-            prompt_data = self._prepare_prompt_data(state)
-            
-            # 프롬프트 생성
-            prompt = self.prompt_templates.create_prompt_template()
-            
-            # Chain 구성 및 실행
-            chain = prompt | self.llm
+            prompt_data, chain = self._build_chain(state)
             result = chain.invoke(prompt_data)
+            return self._handle_result(state, result)
             
-            self.logger.info(f"사이드잡 재생성 완료: {len(result.side_jobs)}개")
-            
-            # 공통 상태 업데이트 메서드 사용
-            updated_state = self._update_generation_state(state, result)
-            
-            return updated_state
+        except Exception as e:
+            self.logger.error(f"사이드잡 재생성 중 오류: {str(e)}")
+            raise
+    
+    async def acall(self, state: SideJobState) -> SideJobState:
+        """노드 실행 (비동기, LLM 응답을 기다리는 동안 이벤트 루프를 막지 않음)."""
+        try:
+            prompt_data, chain = self._build_chain(state)
+            result = await chain.ainvoke(prompt_data)
+            return self._handle_result(state, result)
             
         except Exception as e:
             self.logger.error(f"사이드잡 재생성 중 오류: {str(e)}")
             raise
     
+    def _build_chain(self, state: SideJobState):
+        """프롬프트 데이터와 Chain 구성 (동기/비동기 공통)."""
+        prompt_data = self._prepare_prompt_data(state)
+        prompt = self.prompt_templates.create_prompt_template()
+        return prompt_data, prompt | self.llm
+    
+    def _handle_result(self, state: SideJobState, result) -> SideJobState:
+        """생성 결과로 상태 업데이트 (동기/비동기 공통)."""
+        self.logger.info(f"사이드잡 재생성 완료: {len(result.side_jobs)}개")
+        return self._update_generation_state(state, result)
+    
     def _prepare_prompt_data(self, state: SideJobState) -> Dict[str, Union[str, List[str]]]:
         """프롬프트 데이터 준비."""
         profile_data = self._safe_get(state, "profile_data", {})
@@ -1,77 +1,161 @@
 """사이드잡 생성을 위한 LangGraph 노드."""
 
-from typing import Dict, Union, List
+import random
+import time
+from typing import Any, Dict, Union, List
 from packages.infrastructure.config.config import get_settings
+from packages.infrastructure.services.embedding.cached_embedding_service import get_embedding_service
+from packages.infrastructure.services.embedding.micro_batcher import get_embedding_batcher
+from packages.infrastructure.services.llm.llm_client_factory import get_llm_client_factory
+from packages.infrastructure.services.llm.semantic_response_cache import canonical_profile_text, get_semantic_response_cache
 from packages.infrastructure.nodes.base_node import BaseGenerationNode
 from packages.infrastructure.prompts.side_job_prompts import SideJobPrompts
 from packages.presentation.api.dto.response.ai_response_models import SideJobsAIResponse
 from packages.infrastructure.nodes.states.langgraph_state import SideJobState
-from langchain_naver import ChatClovaX
 
 
 class SideJobGenerationNode(BaseGenerationNode[SideJobState]):
     """사이드잡 생성을 위한 LangGraph 노드."""
     
+    # 표현 방식 매핑
+    STYLE_MAPPING = {
+        "글": "TEXT",
+        "그림": "IMAGE",
+        "영상": "VIDEO"
+    }
+    
     def __init__(self):
         super().__init__("generate_side_jobs")
-        self.settings = get_settings()
-        
-        # LLM 설정
-        self.llm = ChatClovaX(
-            api_key=self.settings.clova_x_api_key,
-            base_url=self.settings.clova_x_base_url,
-            model=self.settings.clova_x_model,
-            temperature=0.7,
-            max_tokens=1024,  # Set max tokens larger than 1024 to use tool calling
-            thinking={
-                "effort": "none"  # Set to "none" to disable thinking, as structured outputs are incompatible with thinking
-            },
-        )
         
-        # Structured Output 설정
-        self.llm = self.llm.with_structured_output(SideJobsAIResponse, method="json_schema")
+        # LLM 설정 (프로세스 공유 커넥션 풀을 쓰는 설정 뷰)
+        self.llm = get_llm_client_factory().get_llm(temperature=0.7, max_tokens=1024, schema=SideJobsAIResponse)
         
         # 프롬프트 템플릿
         self.prompt_templates = SideJobPrompts()
+        
+        # 비슷한 프로필(같은 표현 방식)의 최근 생성 결과 재사용
+        self.semantic_cache = get_semantic_response_cache()
     
     def __call__(self, state: SideJobState) -> SideJobState:
-        """노드 실행."""
+        """노드 실행 (동기, Celery 워커용)."""
         try:
-            # 프롬프트 데이터 준비
-            prompt_data = self._prepare_prompt_data(state)
+            prompt_data, chain = self._build_chain(state)
             
-            # 프롬프트 생성
-            prompt = self.prompt_templates.create_prompt_template()
-            self.logger.info(f"프롬프트: {prompt.format(**prompt_data)}")
-
-            # Chain 구성 및 실행
-            chain = prompt | self.llm
+            profile_vector = None
+            if self._use_semantic_cache(state):
+                profile_text = self._canonical_profile(state)
+                profile_vector = get_embedding_service().embed_texts_array([profile_text])[0]
+                cached = self.semantic_cache.lookup(self._cache_style(prompt_data), self.prompt_version, profile_vector)
+                if cached is not None:
+                    return self._handle_cached(state, cached)
+            
+            started = time.perf_counter()
             result = chain.invoke(prompt_data)
+            if profile_vector is not None:
+                self.semantic_cache.store(
+                    self._cache_style(prompt_data), self.prompt_version, profile_vector,
+                    result.model_dump(), time.perf_counter() - started
+                )
+            return self._handle_result(state, result)
             
-            self.logger.info(f"사이드잡 생성 완료: {len(result.side_jobs)}개")
+        except Exception as e:
+            self.logger.error(f"사이드잡 생성 중 오류: {str(e)}")
+            raise
+    
+    async def acall(self, state: SideJobState) -> SideJobState:
+        """노드 실행 (비동기, LLM 응답을 기다리는 동안 이벤트 루프를 막지 않음)."""
+        try:
+            prompt_data, chain = self._build_chain(state)
             
-            # 공통 상태 업데이트 메서드 사용
-            updated_state = self._update_generation_state(state, result)
+            profile_vector = None
+            if self._use_semantic_cache(state):
+                profile_text = self._canonical_profile(state)
+                profile_vector = (await get_embedding_batcher().embed_texts([profile_text]))[0]
+                cached = self.semantic_cache.lookup(self._cache_style(prompt_data), self.prompt_version, profile_vector)
+                if cached is not None:
+                    return self._handle_cached(state, cached)
             
-            return updated_state
+            started = time.perf_counter()
+            result = await chain.ainvoke(prompt_data)
+            if profile_vector is not None:
+                self.semantic_cache.store(
+                    self._cache_style(prompt_data), self.prompt_version, profile_vector,
+                    result.model_dump(), time.perf_counter() - started
+                )
+            return self._handle_result(state, result)
             
         except Exception as e:
             self.logger.error(f"사이드잡 생성 중 오류: {str(e)}")
             raise
     
+    def _build_chain(self, state: SideJobState):
+        """프롬프트 데이터와 Chain 구성 (동기/비동기 공통)."""
+        # 프롬프트 데이터 준비
+        prompt_data = self._prepare_prompt_data(state)
+        
+        # 프롬프트 생성
+        prompt = self.prompt_templates.create_prompt_template()
+        self.logger.info(f"프롬프트: {prompt.format(**prompt_data)}")
+        
+        return prompt_data, prompt | self.llm
+    
+    def _handle_result(self, state: SideJobState, result) -> SideJobState:
+        """생성 결과로 상태 업데이트 (동기/비동기 공통)."""
+        self.logger.info(f"사이드잡 생성 완료: {len(result.side_jobs)}개")
+        
+        # 공통 상태 업데이트 메서드 사용
+        return self._update_generation_state(state, result)
+    
+    def _handle_cached(self, state: SideJobState, cached: Dict[str, Any]) -> SideJobState:
+        """캐시된 생성 결과로 상태 업데이트 (설정에 따라 사용자별로 순서만 섞음)."""
+        result = SideJobsAIResponse.model_validate(cached)
+        if get_settings().llm_semantic_cache_shuffle and len(result.side_jobs) > 1:
+            random.Random(state.get("user_id")).shuffle(result.side_jobs)
+        self.logger.info(f"사이드잡 캐시 재사용: {len(result.side_jobs)}개")
+        return self._update_generation_state(state, result)
+    
+    def _use_semantic_cache(self, state: SideJobState) -> bool:
+        """의미 기반 캐시 사용 여부 (캐시 우회 요청이나 전체 재생성이면 항상 새로 생성)."""
+        if self.semantic_cache is None:
+            return False
+        if state.get("cache_bypass") or state.get("side_job_ids"):
+            self.semantic_cache.record_bypass()
+            return False
+        return True
+    
+    def _canonical_profile(self, state: SideJobState) -> str:
+        """임베딩할 정규화 프로필 문자열."""
+        profile_data = self._profile_data(state)
+        return canonical_profile_text(
+            profile_data.get("job", ""),
+            profile_data.get("hobbies", []),
+            profile_data.get("strength_type", "")
+        )
+    
+    def _cache_style(self, prompt_data: Dict[str, Union[str, List[str]]]) -> str:
+        """캐시 파티션 키 (매핑된 표현 방식)."""
+        return self._map_style(prompt_data.get("expression_style", ""))
+    
+    def _map_style(self, expression_style: str) -> str:
+        """표현 방식 매핑 (글/그림/영상 → TEXT/IMAGE/VIDEO)."""
+        return self.STYLE_MAPPING.get(expression_style, expression_style.upper())
+    
+    def _profile_data(self, state: SideJobState) -> Dict[str, Any]:
+        """중첩된 profile_data 구조 처리."""
+        raw_profile_data = self._safe_get(state, "profile_data", {})
+        
+        # profile_data가 중첩되어 있는 경우 처리
+        if "profile_data" in raw_profile_data:
+            return raw_profile_data["profile_data"]
+        return raw_profile_data
+    
     def _prepare_prompt_data(self, state: SideJobState) -> Dict[str, Union[str, List[str]]]:
         """프롬프트 데이터 준비."""
         # 상태 로깅
         self.logger.info("SideJobGenerationNode 실행 시작")
         
-        # 중첩된 profile_data 구조 처리
         raw_profile_data = self._safe_get(state, "profile_data", {})
-        
-        # profile_data가 중첩되어 있는 경우 처리
-        if "profile_data" in raw_profile_data:
-            profile_data = raw_profile_data["profile_data"]
-        else:
-            profile_data = raw_profile_data
+        profile_data = self._profile_data(state)
             
         trend_data = self._safe_get(state, "trend_data", {})
         
@@ -81,15 +165,7 @@ class SideJobGenerationNode(BaseGenerationNode[SideJobState]):
         self.logger.info(f"트렌드 데이터: {trend_data}")
         
         expression_style = profile_data.get("expression_style", "")
-        
-        # 표현 방식 매핑
-        style_mapping = {
-            "글": "TEXT",
-            "그림": "IMAGE", 
-            "영상": "VIDEO"
-        }
-        
-        mapped_style = style_mapping.get(expression_style, expression_style.upper())
+        mapped_style = self._map_style(expression_style)
         
         # 플랫폼 데이터 로더에서 데이터 가져오기
         expression_jobs = self.prompt_templates.platform_loader.get_expression_side_jobs(mapped_style)
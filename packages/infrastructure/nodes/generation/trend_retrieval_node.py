@@ -13,7 +13,7 @@ class TrendRetrievalNode(BaseNode[SideJobState]):
         super().__init__("retrieve_trends")
         self.trend_retriever = TrendRetrieverService()
     
-    def __call__(self, state: SideJobState) -> SideJobState:
+    async def __call__(self, state: SideJobState) -> SideJobState:
         """노드 실행."""
         self.logger.info("TrendRetrievalNode 실행 시작")
         
@@ -31,7 +31,7 @@ class TrendRetrievalNode(BaseNode[SideJobState]):
             search_queries = self._create_search_queries(profile_data)
             
             # 트렌드 검색 실행
-            relevant_trends = self._search_relevant_trends(search_queries)
+            relevant_trends = await self._search_relevant_trends(search_queries)
             
             # 상태 업데이트 (완전히 새로운 상태 객체 생성)
             trend_data = {
@@ -104,31 +104,22 @@ class TrendRetrievalNode(BaseNode[SideJobState]):
         
         return queries[:5]  # 최대 5개 쿼리로 제한
     
-    def _search_relevant_trends(self, search_queries: List[str]) -> List[Dict[str, any]]:
+    async def _search_relevant_trends(self, search_queries: List[str]) -> List[Dict[str, any]]:
         """검색 쿼리 기반 관련 트렌드 검색."""
-        all_trends = []
-
-        
         self.logger.info(f"검색 쿼리 목록: {search_queries}")
         
-        for query in search_queries:
-            try:
-                # 각 쿼리별로 트렌드 검색
-                self.logger.info(f"쿼리 '{query}' 검색 시작...")
-                trends = self.trend_retriever.search_trends_by_query(query, limit=3)
-                self.logger.info(f"쿼리 '{query}' 검색 결과: {len(trends)}개")
-                all_trends.extend(trends)
-            except Exception as e:
-                self.logger.warning(f"쿼리 '{query}' 검색 실패: {e}")
-                continue
-        
-        self.logger.info(f"전체 트렌드 수집: {len(all_trends)}개")
-        
-        # 중복 제거 및 정렬
-        unique_trends = self._deduplicate_trends(all_trends)
+        try:
+            # 모든 쿼리를 한 번에 임베딩/조회 (UUID 중복 제거 포함)
+            unique_trends = await self.trend_retriever.asearch_trends_by_queries(search_queries, limit_per_query=3)
+        except Exception as e:
+            self.logger.warning(f"다중 쿼리 검색 실패: {e}")
+            return []
         
         self.logger.info(f"중복 제거 후 트렌드: {len(unique_trends)}개")
         
+        # 최신순으로 정렬
+        unique_trends.sort(key=lambda x: x.get("created_at") or "", reverse=True)
+        
         return unique_trends[:10]  # 최대 10개 트렌드 반환
     
     def _create_trend_summary(self, trends: List[Dict[str, any]]) -> str:
@@ -150,19 +141,3 @@ class TrendRetrievalNode(BaseNode[SideJobState]):
             summary_parts.append(f"{platform}: {', '.join(trend_titles[:2])}")
         
         return f"최신 트렌드: {' | '.join(summary_parts)}"
-    
-    def _deduplicate_trends(self, trends: List[Dict[str, any]]) -> List[Dict[str, any]]:
-        """중복 트렌드 제거."""
-        seen_uuids = set()
-        unique_trends = []
-        
-        for trend in trends:
-            uuid = trend.get("uuid")
-            if uuid and uuid not in seen_uuids:
-                seen_uuids.add(uuid)
-                unique_trends.append(trend)
-        
-        # 최신순으로 정렬
-        unique_trends.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-        
-        return unique_trends
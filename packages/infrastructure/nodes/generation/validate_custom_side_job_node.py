@@ -1,9 +1,10 @@
 """사용자 정의 부업 검증을 위한 LangGraph 노드."""
 
-from packages.infrastructure.config.config import get_settings
+import time
+from packages.infrastructure.services.llm.llm_client_factory import get_llm_client_factory
+from packages.infrastructure.services.llm.llm_response_cache import get_llm_response_cache
 from packages.infrastructure.nodes.base_node import BaseGenerationNode
 from packages.infrastructure.nodes.states.langgraph_state import ValidateCustomSideJobState
-from langchain_naver import ChatClovaX
 
 
 class ValidateCustomSideJobNode(BaseGenerationNode[ValidateCustomSideJobState]):
@@ -11,49 +12,80 @@ class ValidateCustomSideJobNode(BaseGenerationNode[ValidateCustomSideJobState]):
 
     def __init__(self):
         super().__init__("validate_custom_side_job")
-        self.settings = get_settings()
-
-        # ClovaX 설정 (다른 노드들과 동일하게 맞춤)
-        self.llm = ChatClovaX(
-            api_key=self.settings.clova_x_api_key,
-            base_url=self.settings.clova_x_base_url,
-            model=self.settings.clova_x_model,
-            temperature=0.3,
-            max_tokens=512,
-            thinking={"effort": "none"},
-        )
+
+        # LLM 설정 (프로세스 공유 커넥션 풀을 쓰는 설정 뷰)
+        self.llm = get_llm_client_factory().get_llm(temperature=0.3, max_tokens=512)
+        # 자주 입력되는 부업(예: "유튜브 브이로그")은 캐시된 판정을 재사용
+        self.response_cache = get_llm_response_cache()
 
     def __call__(self, state: ValidateCustomSideJobState) -> ValidateCustomSideJobState:
-        """부업 검증 실행."""
+        """부업 검증 실행 (동기, Celery 워커용)."""
         try:
             self.logger.info("사용자 정의 부업 검증 시작")
-            prompt_data = self._prepare_prompt_data(state)
-            side_job = prompt_data.get("side_job", "")
-
+            side_job, prompt = self._build_prompt(state)
             if not side_job:
                 self.logger.warning("검증할 side_job이 없습니다.")
                 return {**state, "ai_result": False}
 
-            # 프롬프트 생성
-            prompt = (
-                f"'{side_job}'이라는 부업이 SNS(소셜 미디어)를 활용한 부업인지 여부를 판단해줘. "
-                f"오직 'True' 또는 'False'로만 답변해."
-            )
-            self.logger.info(f"프롬프트생성")
+            cache_key = self._response_cache_key(state, {"side_job": side_job})
+            if cache_key:
+                cached = self.response_cache.get(self.name, cache_key)
+                if cached is not None:
+                    return {**state, "ai_result": cached}
+
             # LLM 호출
-            result = self.llm.invoke(prompt)
-            answer = str(result).strip().lower()
+            started = time.perf_counter()
+            is_valid = self._judge(side_job, self.llm.invoke(prompt))
+            if cache_key:
+                self.response_cache.set(self.name, cache_key, is_valid, time.perf_counter() - started)
+            return {**state, "ai_result": is_valid}
+
+        except Exception as e:
+            self.logger.error(f"부업 검증 중 오류: {str(e)}")
+            return {**state, "ai_result": False}
+
+    async def acall(self, state: ValidateCustomSideJobState) -> ValidateCustomSideJobState:
+        """부업 검증 실행 (비동기, LLM 응답을 기다리는 동안 이벤트 루프를 막지 않음)."""
+        try:
+            self.logger.info("사용자 정의 부업 검증 시작")
+            side_job, prompt = self._build_prompt(state)
+            if not side_job:
+                self.logger.warning("검증할 side_job이 없습니다.")
+                return {**state, "ai_result": False}
 
-            # 결과 판별
-            is_valid = "true" in answer
+            cache_key = self._response_cache_key(state, {"side_job": side_job})
+            if cache_key:
+                cached = await self.response_cache.aget(self.name, cache_key)
+                if cached is not None:
+                    return {**state, "ai_result": cached}
 
-            self.logger.info(f"부업 검증 완료: '{side_job}' → {is_valid}")
+            # LLM 호출
+            started = time.perf_counter()
+            is_valid = self._judge(side_job, await self.llm.ainvoke(prompt))
+            if cache_key:
+                await self.response_cache.aset(self.name, cache_key, is_valid, time.perf_counter() - started)
             return {**state, "ai_result": is_valid}
 
         except Exception as e:
             self.logger.error(f"부업 검증 중 오류: {str(e)}")
             return {**state, "ai_result": False}
-        
+
+    def _build_prompt(self, state: ValidateCustomSideJobState):
+        """검증할 부업과 프롬프트 생성."""
+        side_job = self._prepare_prompt_data(state).get("side_job", "")
+        prompt = (
+            f"'{side_job}'이라는 부업이 SNS(소셜 미디어)를 활용한 부업인지 여부를 판단해줘. "
+            f"오직 'True' 또는 'False'로만 답변해."
+        )
+        return side_job, prompt
+
+    def _judge(self, side_job: str, result) -> bool:
+        """LLM 응답에서 결과 판별."""
+        answer = str(result).strip().lower()
+        is_valid = "true" in answer
+
+        self.logger.info(f"부업 검증 완료: '{side_job}' → {is_valid}")
+        return is_valid
 
     def _prepare_prompt_data(self, state: ValidateCustomSideJobState) -> dict:
         """BaseGenerationNode에서 요구하는 추상 메서드 구현"""
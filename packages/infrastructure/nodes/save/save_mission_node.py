@@ -21,6 +21,14 @@ class SaveMissionNode(BaseSaveNode[MissionState]):
             self.logger.error(f"미션 저장 실패: {e}")
             raise
     
+    async def asave_missions(self, state: MissionState) -> MissionState:
+        """미션을 비동기로 저장합니다."""
+        try:
+            return await self.asave_entities(state, "missions", self._aupdate_sidejob_selection)
+        except Exception as e:
+            self.logger.error(f"미션 저장 실패: {e}")
+            raise
+    
     def _prepare_data(self, entity: Dict[str, Union[int, str, bool, List]], state: MissionState) -> Dict[str, Union[int, str, bool]]:
         """저장할 데이터를 준비합니다."""
         # guide 필드를 JSON 문자열로 변환
@@ -42,18 +50,36 @@ class SaveMissionNode(BaseSaveNode[MissionState]):
     def _update_sidejob_selection(self, uow, state: MissionState, saved_entities):
         """사이드잡 선택 상태를 업데이트합니다."""
         try:
-            sidejob_id = state.get("sidejob_id")
-            if sidejob_id:
-                from packages.domain.entities.side_job import SideJob
-                from sqlalchemy import update
-                
-                stmt = (
-                    update(SideJob)
-                    .where(SideJob.c.id == sidejob_id)
-                    .values(is_selected=True)
-                )
+            stmt = self._sidejob_selection_stmt(state)
+            if stmt is not None:
                 uow.session.execute(stmt)
-                self.logger.info(f"사이드잡 {sidejob_id} 선택 상태 업데이트 완료")
+                self.logger.info(f"사이드잡 {state.get('sidejob_id')} 선택 상태 업데이트 완료")
         except Exception as e:
             self.logger.error(f"사이드잡 선택 상태 업데이트 실패: {e}")
             raise
+    
+    async def _aupdate_sidejob_selection(self, uow, state: MissionState, saved_entities):
+        """사이드잡 선택 상태를 비동기로 업데이트합니다."""
+        try:
+            stmt = self._sidejob_selection_stmt(state)
+            if stmt is not None:
+                await uow.session.execute(stmt)
+                self.logger.info(f"사이드잡 {state.get('sidejob_id')} 선택 상태 업데이트 완료")
+        except Exception as e:
+            self.logger.error(f"사이드잡 선택 상태 업데이트 실패: {e}")
+            raise
+    
+    def _sidejob_selection_stmt(self, state: MissionState):
+        """사이드잡 선택 상태 UPDATE 문을 생성합니다 (sidejob_id가 없으면 None)."""
+        sidejob_id = state.get("sidejob_id")
+        if not sidejob_id:
+            return None
+        
+        from packages.domain.entities.side_job import SideJob
+        from sqlalchemy import update
+        
+        return (
+            update(SideJob)
+            .where(SideJob.c.id == sidejob_id)
+            .values(is_selected=True)
+        )
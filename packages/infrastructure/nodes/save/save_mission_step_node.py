@@ -15,6 +15,10 @@ class SaveMissionStepNode(BaseSaveNode[MissionStepState]):
         """미션 단계를 저장합니다."""
         return self.save_entities(state, "mission_steps")
     
+    async def asave_mission_steps(self, state: MissionStepState) -> MissionStepState:
+        """미션 단계를 비동기로 저장합니다."""
+        return await self.asave_entities(state, "mission_steps")
+    
     def _prepare_data(self, entity: Dict[str, Union[int, str, bool]], state: MissionStepState) -> Dict[str, Union[int, str, bool]]:
         """저장할 데이터를 준비합니다."""
         return {
@@ -15,6 +15,16 @@ class SaveSideJobNode(BaseSaveNode[SideJobState]):
     
     def save_side_jobs(self, state: SideJobState) -> SideJobState:
         """사이드잡을 저장합니다."""
+        self._inject_side_job_ids(state)
+        return self.save_entities(state, "side_jobs")
+
+    async def asave_side_jobs(self, state: SideJobState) -> SideJobState:
+        """사이드잡을 비동기로 저장합니다."""
+        self._inject_side_job_ids(state)
+        return await self.asave_entities(state, "side_jobs")
+
+    def _inject_side_job_ids(self, state: SideJobState) -> None:
+        """ai_result의 side_jobs에 index와 재생성 대상 ID를 주입합니다."""
         self.logger.info(f"[SaveSideJobNode] userId: {state.get('user_id')}")
         side_job_ids = state.get("side_job_ids", None)
         self.logger.info(f"[SaveSideJobNode] 전달된 side_job_ids: {side_job_ids}")
@@ -31,8 +41,6 @@ class SaveSideJobNode(BaseSaveNode[SideJobState]):
         # 엔티티를 state에 넣어줘야 save_entities가 처리할 수 있음
         state["side_jobs"] = side_jobs
 
-        return self.save_entities(state, "side_jobs")
-
     def _prepare_data(self, entity: Dict[str, Union[int, str, bool]], state: SideJobState) -> Dict[str, Union[int, str, bool]]:
         """저장할 데이터를 준비합니다."""
         
@@ -13,6 +13,9 @@ class BaseState(TypedDict):
     
     # 저장된 결과 (API 응답용)
     saved_entities: Optional[List[Dict[str, Any]]]
+    
+    # True면 LLM 응답 캐시를 건너뛰고 새로 생성 (X-Cache-Bypass 헤더)
+    cache_bypass: Optional[bool]
 
 
 class SideJobState(BaseState):
@@ -0,0 +1,130 @@
+"""RSS 항목을 한 번만 파싱해 분류기들이 공유하는 정규화 레코드로 변환."""
+
+import importlib.util
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, NamedTuple, Optional, Tuple
+from bs4 import BeautifulSoup
+
+# 원본 HTML에서 미디어 포함 여부를 판단하는 패턴 (태그 제거 전 검사)
+_MEDIA_PATTERN = re.compile(
+    r'<img|<video|<audio|youtube\.com|youtu\.be|instagram\.com|tiktok\.com|vimeo\.com',
+    re.IGNORECASE
+)
+
+# 본문 최대 길이 (sns_trends.content 저장 및 키워드 검사 범위)
+MAX_CONTENT_LENGTH = 1000
+
+
+@dataclass(frozen=True)
+class NormalizedEntry:
+    """RSS 항목 정규화 결과 (불변).
+
+    Attributes:
+        title: 제목
+        link: 원문 링크
+        published: 게시 시각 (UTC, tz 없음)
+        content: HTML을 제거한 본문 (최대 1000자, 비어 있으면 제목)
+        content_lower: content 소문자
+        combined_lower: "제목 본문" 소문자 (키워드 검사 대상)
+        has_media: 원본 HTML에 이미지/영상/미디어 링크 포함 여부
+        feed_tags: 피드가 제공한 태그/카테고리 ("#태그" 형식)
+    """
+
+    title: str
+    link: str
+    published: Optional[datetime]
+    content: str
+    content_lower: str
+    combined_lower: str
+    has_media: bool
+    feed_tags: Tuple[str, ...]
+
+
+class ParsedHtml(NamedTuple):
+    """항목 HTML 파싱 결과 (프로세스 풀에서 주고받는 값)."""
+
+    text: str  # HTML을 제거한 본문 (최대 1000자)
+    has_media: bool  # 원본 HTML에 이미지/영상/미디어 링크 포함 여부
+
+
+def normalize_entry(entry: Any, published: Optional[datetime] = None,
+                    parsed: Optional[ParsedHtml] = None) -> NormalizedEntry:
+    """feedparser 항목을 정규화 레코드로 변환 (HTML 파싱·소문자 변환은 항목당 한 번).
+
+    parsed를 넘기면(프로세스 풀에서 미리 파싱한 결과) HTML을 다시 파싱하지 않습니다.
+    """
+    title = _as_text(entry.get('title', ''))
+    if parsed is None:
+        parsed = parse_html(entry_html(entry))
+
+    content = parsed.text or title
+    content_lower = content.lower()
+
+    return NormalizedEntry(
+        title=title,
+        link=_as_text(entry.get('link', '')),
+        published=published,
+        content=content,
+        content_lower=content_lower,
+        combined_lower=f"{title.lower()} {content_lower}",
+        has_media=parsed.has_media,
+        feed_tags=_feed_tags(entry),
+    )
+
+
+def entry_html(entry: Any) -> str:
+    """항목의 원본 HTML 본문 (summary, 없으면 description)."""
+    return _as_text(entry.get('summary', '') or entry.get('description', ''))
+
+
+def parse_html(raw_html: str, parser: str = 'html.parser') -> ParsedHtml:
+    """원본 HTML을 본문 텍스트와 미디어 포함 여부로 변환."""
+    return ParsedHtml(
+        text=_html_to_text(raw_html, parser)[:MAX_CONTENT_LENGTH],
+        has_media=bool(_MEDIA_PATTERN.search(raw_html)),
+    )
+
+
+def resolve_html_parser(name: str = 'auto') -> str:
+    """BeautifulSoup 파서 이름 결정 ('auto'나 'lxml'은 lxml이 설치된 경우에만 lxml)."""
+    if name in ('auto', 'lxml'):
+        return 'lxml' if importlib.util.find_spec('lxml') is not None else 'html.parser'
+    return name
+
+
+def _html_to_text(html: str, parser: str = 'html.parser') -> str:
+    """HTML 태그 제거."""
+    if not html:
+        return ""
+    if '<' not in html and '&' not in html:
+        # 태그/엔티티가 없는 평문은 파서를 거치지 않음
+        return html.strip()
+    text = BeautifulSoup(html, parser).get_text(strip=True)
+    # 특수 문자 정리
+    return text.encode('utf-8', errors='ignore').decode('utf-8')
+
+
+def _feed_tags(entry: Any) -> Tuple[str, ...]:
+    """피드가 제공한 태그와 카테고리."""
+    tags = []
+    for tag in entry.get('tags') or ():
+        term = tag.get('term') if hasattr(tag, 'get') else None
+        if term:
+            tags.append(f"#{term}")
+    for category in entry.get('categories') or ():
+        tags.append(f"#{category}")
+    return tuple(tags)
+
+
+def _as_text(value: Any) -> str:
+    """bytes/None 값을 문자열로 변환 (UTF-8 → latin-1 순으로 시도)."""
+    if value is None:
+        return ""
+    if isinstance(value, bytes):
+        try:
+            return value.decode('utf-8')
+        except UnicodeDecodeError:
+            return value.decode('latin-1')
+    return str(value)
@@ -0,0 +1,89 @@
+"""벤치마크/재현용 RSS 피드 녹화 코퍼스.
+
+코퍼스 디렉터리 구조::
+
+    corpus/
+      manifest.json     # {"feeds": [{"url", "trend_type", "file", "headers", "recorded_at"}, ...]}
+      0000.xml          # 녹화된 피드 본문 (응답 바이트 그대로)
+      0001.xml
+"""
+
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+import httpx
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+
+# 녹화 시 보존하는 응답 헤더
+_RECORDED_HEADERS = ("content-type", "etag", "last-modified")
+
+
+@dataclass
+class RecordedFeed:
+    """녹화된 피드 하나."""
+
+    url: str
+    trend_type: str
+    body: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+    options: Dict[str, Any] = field(default_factory=dict)  # 매니페스트의 추가 항목 (재현 옵션 등)
+
+
+def load_corpus(directory: str) -> List[RecordedFeed]:
+    """코퍼스 디렉터리의 녹화 피드 목록 로드."""
+    root = Path(directory)
+    manifest = json.loads((root / MANIFEST_NAME).read_text(encoding="utf-8"))
+
+    feeds = []
+    for item in manifest.get("feeds", []):
+        extra = {key: value for key, value in item.items()
+                 if key not in ("url", "trend_type", "file", "headers", "recorded_at")}
+        feeds.append(RecordedFeed(
+            url=item["url"],
+            trend_type=item.get("trend_type", "recorded"),
+            body=(root / item["file"]).read_bytes(),
+            headers=item.get("headers", {}),
+            options=extra
+        ))
+    return feeds
+
+
+def record_corpus(rss_feeds: Dict[str, List[str]], directory: str, timeout: float = 30,
+                  user_agent: str = "Mozilla/5.0") -> List[RecordedFeed]:
+    """실제 피드를 내려받아 코퍼스로 저장 (실패한 피드는 건너뜀)."""
+    root = Path(directory)
+    root.mkdir(parents=True, exist_ok=True)
+
+    recorded: List[RecordedFeed] = []
+    manifest: List[Dict[str, Any]] = []
+    with httpx.Client(timeout=timeout, follow_redirects=True, headers={"User-Agent": user_agent}) as client:
+        for trend_type, urls in rss_feeds.items():
+            for url in urls:
+                try:
+                    response = client.get(url)
+                    response.raise_for_status()
+                except Exception as e:
+                    logger.warning(f"피드 녹화 실패 ({url}): {e!r}")
+                    continue
+
+                file_name = f"{len(manifest):04d}.xml"
+                (root / file_name).write_bytes(response.content)
+                headers = {name: response.headers[name] for name in _RECORDED_HEADERS if name in response.headers}
+                manifest.append({
+                    "url": url,
+                    "trend_type": trend_type,
+                    "file": file_name,
+                    "headers": headers,
+                    "recorded_at": datetime.utcnow().isoformat()
+                })
+                recorded.append(RecordedFeed(url=url, trend_type=trend_type, body=response.content, headers=headers))
+
+    (root / MANIFEST_NAME).write_text(json.dumps({"feeds": manifest}, ensure_ascii=False, indent=2), encoding="utf-8")
+    logger.info(f"피드 코퍼스 녹화 완료: {len(recorded)}개 → {root}")
+    return recorded
@@ -0,0 +1,114 @@
+"""RSS 피드별 상태(health) 관리, 서킷 브레이커 및 적응형 크롤링 주기 계산."""
+
+import logging
+import statistics
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+from packages.infrastructure.config.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# 중앙값 계산에 보관하는 최근 응답 시간 샘플 수
+LATENCY_SAMPLES = 20
+
+
+class FeedRegistry:
+    """피드 상태 dict(crawl_feed_states 행)에 health 정보를 갱신하는 정책 객체.
+
+    - 연속 실패가 임계치에 도달하면 서킷을 열고, 이후 실패마다 대기 시간을 두 배로 늘립니다.
+      대기 시간이 지나면 한 번 시도(half-open)하고, 성공하면 서킷을 닫습니다.
+    - 관측한 게시 빈도(items/day)로 다음 크롤링 시각을 정합니다.
+      새 글이 하루 24개인 피드는 최소 주기로, 드물게 올라오는 피드는 최대 주기로 확인합니다.
+    """
+
+    def __init__(self, failure_threshold: Optional[int] = None, base_backoff: Optional[timedelta] = None,
+                 max_backoff: Optional[timedelta] = None, min_interval: Optional[timedelta] = None,
+                 max_interval: Optional[timedelta] = None):
+        settings = get_settings()
+        self.failure_threshold = failure_threshold or settings.crawling_circuit_failure_threshold
+        self.base_backoff = base_backoff or timedelta(minutes=settings.crawling_circuit_base_backoff_minutes)
+        self.max_backoff = max_backoff or timedelta(hours=settings.crawling_circuit_max_backoff_hours)
+        self.min_interval = min_interval or timedelta(minutes=settings.crawling_min_interval_minutes)
+        self.max_interval = max_interval or timedelta(hours=settings.crawling_max_interval_hours)
+
+    def record_success(self, state: Dict[str, Any], latency: Optional[float],
+                       observed_items_per_day: Optional[float] = None,
+                       now: Optional[datetime] = None) -> Dict[str, Any]:
+        """성공한 요청 반영 (서킷 닫기, 게시 빈도 갱신, 다음 크롤링 시각 계산)."""
+        now = now or datetime.utcnow()
+        self._add_latency(state, latency)
+
+        if observed_items_per_day is not None:
+            previous = state.get("items_per_day")
+            # 지수 이동 평균으로 한 번의 튀는 관측값을 완화
+            state["items_per_day"] = (
+                observed_items_per_day if previous is None else 0.5 * previous + 0.5 * observed_items_per_day
+            )
+
+        state["consecutive_failures"] = 0
+        state["circuit_open_until"] = None
+        state["next_crawl_at"] = now + self.crawl_interval(state.get("items_per_day"))
+        return state
+
+    def record_failure(self, state: Dict[str, Any], latency: Optional[float] = None,
+                       now: Optional[datetime] = None) -> Dict[str, Any]:
+        """실패한 요청 반영 (임계치 이상이면 지수 백오프로 서킷 열기)."""
+        now = now or datetime.utcnow()
+        self._add_latency(state, latency)
+
+        failures = (state.get("consecutive_failures") or 0) + 1
+        state["consecutive_failures"] = failures
+
+        if failures >= self.failure_threshold:
+            backoff = min(self.base_backoff * (2 ** (failures - self.failure_threshold)), self.max_backoff)
+            state["circuit_open_until"] = now + backoff
+            state["next_crawl_at"] = now + backoff
+            logger.warning(f"피드 서킷 열림: 연속 실패 {failures}회, {backoff} 후 재시도")
+        else:
+            state["next_crawl_at"] = now + self.min_interval
+        return state
+
+    def crawl_interval(self, items_per_day: Optional[float]) -> timedelta:
+        """게시 빈도에 따른 크롤링 주기 (새 글 하나가 나올 것으로 예상되는 시간, 최소/최대 주기로 제한)."""
+        if not items_per_day or items_per_day <= 0:
+            return self.max_interval
+        interval = timedelta(days=1 / items_per_day)
+        return max(self.min_interval, min(interval, self.max_interval))
+
+    def is_available(self, state: Optional[Dict[str, Any]], now: Optional[datetime] = None) -> bool:
+        """서킷이 닫혀 있거나 대기 시간이 지났는지 (half-open)."""
+        open_until = (state or {}).get("circuit_open_until")
+        return open_until is None or open_until <= (now or datetime.utcnow())
+
+    def is_due(self, state: Optional[Dict[str, Any]], now: Optional[datetime] = None) -> bool:
+        """크롤링할 차례인지 (상태가 없는 새 피드는 항상 대상)."""
+        now = now or datetime.utcnow()
+        if not self.is_available(state, now):
+            return False
+        next_crawl_at = (state or {}).get("next_crawl_at")
+        return next_crawl_at is None or next_crawl_at <= now
+
+    def due_feed_urls(self, feed_urls: Iterable[str], states: Dict[str, Dict[str, Any]],
+                      now: Optional[datetime] = None) -> List[str]:
+        """크롤링할 차례가 된 피드 URL 목록."""
+        now = now or datetime.utcnow()
+        return [url for url in feed_urls if self.is_due(states.get(url), now)]
+
+    @staticmethod
+    def observed_items_per_day(published_dates: List[datetime]) -> Optional[float]:
+        """피드에 실린 항목들의 게시 시각 범위로 게시 빈도 추정 (항목 2개 미만이면 None)."""
+        if len(published_dates) < 2:
+            return None
+        span_days = (max(published_dates) - min(published_dates)).total_seconds() / 86400
+        # 같은 시각에 몰린 항목 때문에 빈도가 무한대가 되지 않도록 최소 1시간 범위로 계산
+        return (len(published_dates) - 1) / max(span_days, 1 / 24)
+
+    @staticmethod
+    def _add_latency(state: Dict[str, Any], latency: Optional[float]) -> None:
+        """응답 시간 샘플 추가 및 중앙값 갱신 (ms)."""
+        if latency is None:
+            return
+        samples = list(state.get("latency_samples") or [])[-(LATENCY_SAMPLES - 1):]
+        samples.append(round(latency * 1000, 1))
+        state["latency_samples"] = samples
+        state["latency_median_ms"] = statistics.median(samples)
@@ -0,0 +1,169 @@
+"""RSS 피드별 크롤링 상태 저장소."""
+
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+from sqlalchemy import and_, or_, text
+from packages.core.db.engine_registry import get_engine
+from packages.core.db.uow_sqlalchemy import SqlAlchemyUoW
+from packages.domain.entities.crawl_feed_state import CrawlFeedState
+
+logger = logging.getLogger(__name__)
+
+# crawl_feed_states 컬럼 중 크롤러가 갱신하는 값
+STATE_FIELDS = (
+    "etag", "last_modified", "body_digest", "last_status", "last_checked_at", "last_changed_at",
+    "watermark_entry_id", "watermark_published_at",
+    "consecutive_failures", "latency_samples", "latency_median_ms", "items_per_day",
+    "circuit_open_until", "next_crawl_at",
+)
+
+# 테이블 생성 이후 추가된 컬럼 (기존 테이블 보정용)
+_ADDED_COLUMNS = (
+    ("watermark_entry_id", "VARCHAR(1000)"),
+    ("watermark_published_at", "TIMESTAMP WITHOUT TIME ZONE"),
+    ("consecutive_failures", "INTEGER DEFAULT 0"),
+    ("latency_samples", "JSON"),
+    ("latency_median_ms", "DOUBLE PRECISION"),
+    ("items_per_day", "DOUBLE PRECISION"),
+    ("circuit_open_until", "TIMESTAMP WITHOUT TIME ZONE"),
+    ("next_crawl_at", "TIMESTAMP WITHOUT TIME ZONE"),
+)
+
+
+class FeedStateStore:
+    """crawl_feed_states 테이블 읽기/쓰기.
+
+    상태 조회나 저장에 실패해도 크롤링은 계속되어야 하므로
+    예외를 올리지 않고 로그만 남깁니다 (조회 실패 시 전체 다운로드).
+    """
+
+    _table_ready = False
+    _table_lock = threading.Lock()
+
+    def load_states(self, feed_urls: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """피드 URL별 마지막 상태 조회."""
+        feed_urls = list(feed_urls)
+        if not feed_urls:
+            return {}
+
+        try:
+            self._ensure_table()
+            with SqlAlchemyUoW() as uow:
+                rows = uow.session.query(CrawlFeedState).filter(CrawlFeedState.feed_url.in_(feed_urls)).all()
+                return {
+                    row.feed_url: {field: getattr(row, field) for field in STATE_FIELDS}
+                    for row in rows
+                }
+        except Exception as e:
+            logger.warning(f"피드 상태 조회 실패 (전체 다운로드로 진행): {e}")
+            return {}
+
+    def save_states(self, states: Dict[str, Dict[str, Any]]) -> None:
+        """피드 URL별 상태 일괄 저장 (INSERT ... ON CONFLICT DO UPDATE)."""
+        if not states:
+            return
+
+        try:
+            from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+            self._ensure_table()
+            rows: List[Dict[str, Any]] = [
+                {"feed_url": feed_url, "updated_at": datetime.utcnow(),
+                 **{field: state.get(field) for field in STATE_FIELDS}}
+                for feed_url, state in states.items()
+            ]
+            stmt = pg_insert(CrawlFeedState).values(rows)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[CrawlFeedState.feed_url],
+                set_={column: stmt.excluded[column] for column in (*STATE_FIELDS, "updated_at")}
+            )
+            with SqlAlchemyUoW() as uow:
+                uow.session.execute(stmt)
+            logger.info(f"피드 상태 저장 완료: {len(rows)}개")
+        except Exception as e:
+            logger.warning(f"피드 상태 저장 실패: {e}")
+
+    def claim_feeds(self, feed_urls: Iterable[str], lease_until: datetime,
+                    now: Optional[datetime] = None) -> List[str]:
+        """크롤링할 차례인 피드의 next_crawl_at을 lease_until로 미뤄 선점하고, 선점한 URL 목록 반환.
+
+        조건 확인과 갱신을 한 문장(INSERT ... ON CONFLICT DO UPDATE ... WHERE)으로 처리하므로
+        디스패처가 겹쳐 실행돼도 같은 피드를 두 번 선점하지 않습니다. 크롤링이 끝나면
+        save_states가 실제 다음 크롤링 시각으로 덮어쓰고, 태스크가 죽으면 lease_until 이후 다시 대상이 됩니다.
+        실패하면 이번 디스패치를 건너뜁니다 (빈 목록).
+        """
+        feed_urls = list(feed_urls)
+        if not feed_urls:
+            return []
+
+        now = now or datetime.utcnow()
+        try:
+            from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+            self._ensure_table()
+            table = CrawlFeedState.__table__
+            stmt = pg_insert(CrawlFeedState).values([
+                {"feed_url": feed_url, "next_crawl_at": lease_until, "updated_at": now}
+                for feed_url in feed_urls
+            ])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[CrawlFeedState.feed_url],
+                set_={"next_crawl_at": stmt.excluded.next_crawl_at, "updated_at": stmt.excluded.updated_at},
+                where=and_(
+                    or_(table.c.next_crawl_at.is_(None), table.c.next_crawl_at <= now),
+                    or_(table.c.circuit_open_until.is_(None), table.c.circuit_open_until <= now)
+                )
+            ).returning(CrawlFeedState.feed_url)
+            with SqlAlchemyUoW() as uow:
+                claimed = set(uow.session.execute(stmt).scalars().all())
+            return [feed_url for feed_url in feed_urls if feed_url in claimed]
+        except Exception as e:
+            logger.warning(f"피드 선점 실패 (이번 디스패치 건너뜀): {e}")
+            return []
+
+    @classmethod
+    def _ensure_table(cls) -> None:
+        """crawl_feed_states 테이블이 없으면 생성하고 누락 컬럼 보정 (프로세스당 한 번)."""
+        if cls._table_ready:
+            return
+        with cls._table_lock:
+            if not cls._table_ready:
+                engine = get_engine()
+                CrawlFeedState.__table__.create(bind=engine, checkfirst=True)
+                with engine.begin() as conn:
+                    for column, column_type in _ADDED_COLUMNS:
+                        conn.execute(text(
+                            f"ALTER TABLE crawl_feed_states ADD COLUMN IF NOT EXISTS {column} {column_type}"
+                        ))
+                cls._table_ready = True
+
+
+class InMemoryFeedStateStore:
+    """프로세스 메모리에만 상태를 두는 FeedStateStore 대체 구현 (DB 없는 벤치마크/재현용)."""
+
+    def __init__(self):
+        self.states: Dict[str, Dict[str, Any]] = {}
+
+    def load_states(self, feed_urls: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """피드 URL별 마지막 상태 조회."""
+        return {url: dict(self.states[url]) for url in feed_urls if url in self.states}
+
+    def save_states(self, states: Dict[str, Dict[str, Any]]) -> None:
+        """피드 URL별 상태 저장."""
+        for feed_url, state in states.items():
+            self.states[feed_url] = dict(state)
+
+    def claim_feeds(self, feed_urls: Iterable[str], lease_until: datetime,
+                    now: Optional[datetime] = None) -> List[str]:
+        """크롤링할 차례인 피드의 next_crawl_at을 lease_until로 미뤄 선점."""
+        now = now or datetime.utcnow()
+        claimed = []
+        for feed_url in feed_urls:
+            state = self.states.setdefault(feed_url, {})
+            next_crawl_at, open_until = state.get("next_crawl_at"), state.get("circuit_open_until")
+            if (next_crawl_at is None or next_crawl_at <= now) and (open_until is None or open_until <= now):
+                state["next_crawl_at"] = lease_until
+                claimed.append(feed_url)
+        return claimed
@@ -0,0 +1,39 @@
+"""비동기 크롤링용 호스트별 요청 간격 제한기."""
+
+import asyncio
+import random
+from contextlib import asynccontextmanager
+from typing import Dict
+from urllib.parse import urlsplit
+
+
+class HostRateLimiter:
+    """같은 호스트(host:port)로의 요청은 한 번에 하나씩, 최소 delay_min~delay_max초 간격으로 보내고
+    서로 다른 호스트로의 요청은 동시에 진행시키는 제한기.
+
+    이벤트 루프 하나(크롤링 한 번) 안에서만 사용합니다.
+    """
+
+    def __init__(self, delay_min: float = 1.0, delay_max: float = 3.0):
+        self.delay_min = delay_min
+        self.delay_max = max(delay_min, delay_max)
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._last_request: Dict[str, float] = {}
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        """호스트 순번이 올 때까지 기다린 뒤 요청 구간을 점유."""
+        host = urlsplit(url).netloc.lower()
+        lock = self._locks.setdefault(host, asyncio.Lock())
+
+        async with lock:
+            loop = asyncio.get_running_loop()
+            last = self._last_request.get(host)
+            if last is not None:
+                wait = last + random.uniform(self.delay_min, self.delay_max) - loop.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            try:
+                yield
+            finally:
+                self._last_request[host] = loop.time()
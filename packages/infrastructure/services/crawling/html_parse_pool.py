@@ -0,0 +1,96 @@
+"""RSS 항목 HTML 파싱을 여러 코어로 나누는 프로세스 풀 단계.
+
+BeautifulSoup 파싱은 CPU 작업이라 스레드로는 코어 하나를 넘지 못하므로,
+대량 크롤링에서는 원본 HTML을 묶음(chunk) 단위로 프로세스 풀에 보내고
+정규화된 텍스트와 미디어 여부만 돌려받습니다.
+"""
+
+import logging
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence
+from packages.infrastructure.config.config import get_settings
+from packages.infrastructure.services.crawling.entry_normalizer import ParsedHtml, parse_html, resolve_html_parser
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_chunk(htmls: Sequence[str], parser: str) -> List[ParsedHtml]:
+    """워커 프로세스 진입점: HTML 묶음 파싱."""
+    return [parse_html(html, parser) for html in htmls]
+
+
+class HtmlParsePool:
+    """ProcessPoolExecutor 기반 HTML 파싱 풀.
+
+    - 항목 수가 min_batch 미만이면 프로세스 간 전송 비용이 더 크므로 현재 프로세스에서 파싱합니다.
+    - 풀 생성이나 실행에 실패하면(예: 자식 프로세스를 만들 수 없는 환경) 경고 후 현재 프로세스에서 파싱합니다.
+    - 여러 스레드(비동기 크롤링의 피드별 파싱)가 동시에 써도 되며, fork된 자식 프로세스에서는 풀을 다시 만듭니다.
+    """
+
+    def __init__(self, workers: Optional[int] = None, chunk_size: int = 64,
+                 parser: str = "auto", min_batch: Optional[int] = None):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = max(1, chunk_size)
+        self.parser = resolve_html_parser(parser)
+        self.min_batch = self.chunk_size if min_batch is None else min_batch
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+        self._disabled = False
+
+    def parse_many(self, htmls: Sequence[str]) -> List[ParsedHtml]:
+        """HTML 목록을 입력 순서대로 파싱."""
+        if len(htmls) < self.min_batch or self._disabled:
+            return _parse_chunk(htmls, self.parser)
+
+        chunks = [htmls[i:i + self.chunk_size] for i in range(0, len(htmls), self.chunk_size)]
+        try:
+            executor = self._get_executor()
+            futures = [executor.submit(_parse_chunk, chunk, self.parser) for chunk in chunks]
+            return [parsed for future in futures for parsed in future.result()]
+        except Exception as e:
+            logger.warning(f"HTML 파싱 프로세스 풀 사용 불가, 현재 프로세스에서 파싱: {e!r}")
+            self._disabled = True
+            self.shutdown()
+            return _parse_chunk(htmls, self.parser)
+
+    def shutdown(self) -> None:
+        """풀 종료."""
+        with self._lock:
+            if self._executor is not None and self._pid == os.getpid():
+                self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self._pid = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """현재 프로세스의 풀 반환 (없으면 생성)."""
+        with self._lock:
+            if self._executor is None or self._pid != os.getpid():
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+                self._pid = os.getpid()
+                logger.info(f"HTML 파싱 프로세스 풀 생성: 워커 {self.workers}개, 파서 {self.parser}")
+            return self._executor
+
+
+_shared_pool: Optional[HtmlParsePool] = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_html_parse_pool() -> Optional[HtmlParsePool]:
+    """설정(crawling_parse_workers)에 따른 프로세스 공유 파싱 풀 (0이면 None, 현재 프로세스에서 파싱)."""
+    global _shared_pool
+    settings = get_settings()
+    if settings.crawling_parse_workers == 0:
+        return None
+
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = HtmlParsePool(
+                workers=settings.crawling_parse_workers if settings.crawling_parse_workers > 0 else None,
+                chunk_size=settings.crawling_parse_chunk_size,
+                parser=settings.crawling_html_parser
+            )
+        return _shared_pool
+
@@ -0,0 +1,80 @@
+"""여러 키워드/패턴을 한 번의 텍스트 스캔으로 찾는 분류용 매처."""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+
+
+@dataclass(frozen=True)
+class KeywordHits:
+    """매칭 결과 (발견된 용어와 그 카테고리)."""
+
+    terms: FrozenSet[str]
+    categories: FrozenSet[str]
+
+    def has(self, category: str) -> bool:
+        """카테고리 포함 여부."""
+        return category in self.categories
+
+
+class KeywordMatcher:
+    """모든 용어를 하나의 미리 컴파일된 alternation 정규식으로 묶은 매처.
+
+    - 리터럴 키워드는 대소문자 구분 없는 부분 문자열로 매칭합니다 (기존 `keyword in text`와 동일).
+    - 정규식 패턴은 이름을 붙여 같은 alternation에 포함합니다.
+    - 더 긴 용어가 먼저 매칭되면 그 안에 포함된 짧은 리터럴(예: 'digital marketing' 안의
+      'marketing')은 스캔에서 가려지므로, 생성 시 포함 관계를 계산해 함께 적중 처리합니다.
+
+    크롤러당 한 번 생성하고 항목마다 match()만 호출합니다.
+    """
+
+    def __init__(self, keywords: Iterable[Tuple[str, Iterable[str]]],
+                 patterns: Iterable[Tuple[str, str, Iterable[str]]] = ()):
+        """
+        Args:
+            keywords: (키워드, 카테고리들) 목록. 같은 키워드가 여러 번 나오면 카테고리를 합칩니다.
+            patterns: (이름, 정규식, 카테고리들) 목록.
+        """
+        categories: Dict[str, set] = {}
+        for keyword, keyword_categories in keywords:
+            categories.setdefault(keyword.lower(), set()).update(keyword_categories)
+        literals = list(categories)
+
+        pattern_list = list(patterns)
+        for name, _, pattern_categories in pattern_list:
+            categories.setdefault(name, set()).update(pattern_categories)
+
+        # 긴 리터럴부터 시도하도록 정렬 (짧은 용어가 긴 용어를 가리지 않게)
+        literals.sort(key=len, reverse=True)
+        alternatives: List[str] = []
+        self._group_terms: Dict[str, FrozenSet[str]] = {}
+        for index, literal in enumerate(literals):
+            group = f"k{index}"
+            alternatives.append(f"(?P<{group}>{re.escape(literal)})")
+            # 이 리터럴 안에 포함된 다른 리터럴도 함께 적중
+            self._group_terms[group] = frozenset(other for other in literals if other in literal)
+        for index, (name, regex, _) in enumerate(pattern_list):
+            group = f"p{index}"
+            alternatives.append(f"(?P<{group}>{regex})")
+            self._group_terms[group] = frozenset((name,))
+
+        self._regex = re.compile("|".join(alternatives), re.IGNORECASE) if alternatives else None
+        self._categories: Dict[str, FrozenSet[str]] = {term: frozenset(cats) for term, cats in categories.items()}
+        self._group_categories: Dict[str, FrozenSet[str]] = {
+            group: frozenset().union(*(self._categories[term] for term in terms))
+            for group, terms in self._group_terms.items()
+        }
+
+    def match(self, text: str) -> KeywordHits:
+        """텍스트를 한 번 스캔해 모든 적중 용어와 카테고리 반환."""
+        if self._regex is None or not text:
+            return KeywordHits(frozenset(), frozenset())
+
+        groups = {match.lastgroup for match in self._regex.finditer(text)}
+        if not groups:
+            return KeywordHits(frozenset(), frozenset())
+
+        return KeywordHits(
+            terms=frozenset().union(*(self._group_terms[group] for group in groups)),
+            categories=frozenset().union(*(self._group_categories[group] for group in groups))
+        )
@@ -0,0 +1,199 @@
+"""녹화된 피드 코퍼스를 로컬 HTTP로 재생하는 크롤러 벤치마크/회귀 검증용 서버.
+
+실제 사이트 대신 127.0.0.1에서 피드를 응답하며, 지연/오류/304 응답을 설정할 수 있습니다.
+벤치마크 프로세스의 CPU 측정에 섞이지 않도록 별도 프로세스에서 실행됩니다.
+GET /stats는 지금까지 응답한 상태 코드별 개수를 JSON으로 돌려줍니다 (크롤러 집계와 대조용).
+
+매니페스트 항목별 재생 옵션 (전역 설정보다 우선)::
+
+    {"url": ..., "file": ..., "latency_ms": 200, "error_rate": 0.5, "not_modified_rate": 0.0, "status": 503}
+"""
+
+import hashlib
+import json
+import logging
+import multiprocessing
+import random
+import threading
+import time
+from dataclasses import asdict, dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.request import urlopen
+from packages.infrastructure.services.crawling.feed_corpus import RecordedFeed
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ReplayConfig:
+    """전역 재생 옵션."""
+
+    latency_ms: float = 0.0  # 응답 전 지연
+    error_rate: float = 0.0  # 503 응답 확률
+    not_modified_rate: float = 0.0  # 조건부 헤더와 무관하게 304를 돌려줄 확률
+    honor_conditional: bool = True  # If-None-Match가 ETag와 같으면 304
+    seed: int = 0  # 오류/304 난수 시드 (재현 가능한 실행)
+
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    """/feeds/<번호> 요청에 녹화된 본문을 응답."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        feeds: List[RecordedFeed] = self.server.feeds
+        config: ReplayConfig = self.server.config
+
+        if self.path.rstrip("/") == "/stats":
+            body = json.dumps(self.server.status_counts()).encode("utf-8")
+            self._send(200, body, {"Content-Type": "application/json"}, count=False)
+            return
+
+        try:
+            index = int(self.path.rstrip("/").rsplit("/", 1)[-1])
+            feed = feeds[index]
+        except (ValueError, IndexError):
+            self._send(404)
+            return
+
+        options = feed.options
+        latency_ms = options.get("latency_ms", config.latency_ms)
+        if latency_ms:
+            time.sleep(latency_ms / 1000)
+
+        error_roll, not_modified_roll = self.server.roll(), self.server.roll()
+        if options.get("status") or error_roll < options.get("error_rate", config.error_rate):
+            self._send(int(options.get("status") or 503))
+            return
+
+        etag = '"' + hashlib.sha1(feed.body).hexdigest()[:16] + '"'
+        conditional_hit = config.honor_conditional and self.headers.get("If-None-Match") == etag
+        if conditional_hit or not_modified_roll < options.get("not_modified_rate", config.not_modified_rate):
+            self._send(304, headers={"ETag": etag})
+            return
+
+        headers = {"ETag": etag, "Content-Type": feed.headers.get("content-type", "application/rss+xml")}
+        if feed.headers.get("last-modified"):
+            headers["Last-Modified"] = feed.headers["last-modified"]
+        self._send(200, feed.body, headers)
+
+    def _send(self, status: int, body: bytes = b"", headers: Optional[Dict[str, str]] = None,
+              count: bool = True) -> None:
+        if count:
+            self.server.count_status(status)
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """요청 로그 출력 안 함."""
+        pass
+
+
+class _ReplayHTTPServer(ThreadingHTTPServer):
+    """코퍼스와 재생 옵션을 가진 HTTP 서버."""
+
+    daemon_threads = True
+
+    def __init__(self, feeds: List[RecordedFeed], config: ReplayConfig, rng: random.Random, rng_lock: threading.Lock,
+                 counts: Dict[int, int]):
+        super().__init__(("127.0.0.1", 0), _ReplayHandler)
+        self.feeds = feeds
+        self.config = config
+        self._rng = rng
+        self._rng_lock = rng_lock
+        # 모든 포트가 공유하는 상태 코드별 응답 수 (rng_lock으로 보호)
+        self._counts = counts
+
+    def roll(self) -> float:
+        with self._rng_lock:
+            return self._rng.random()
+
+    def count_status(self, status: int) -> None:
+        with self._rng_lock:
+            self._counts[status] = self._counts.get(status, 0) + 1
+
+    def status_counts(self) -> Dict[str, int]:
+        with self._rng_lock:
+            return {str(status): count for status, count in self._counts.items()}
+
+
+def _serve(feeds: List[RecordedFeed], config: dict, port_count: int, ports_queue, stop_event) -> None:
+    """자식 프로세스 진입점: port_count개의 포트로 서버를 띄우고 종료 신호까지 대기."""
+    replay_config = ReplayConfig(**config)
+    rng, rng_lock, counts = random.Random(replay_config.seed), threading.Lock(), {}
+    servers = [_ReplayHTTPServer(feeds, replay_config, rng, rng_lock, counts) for _ in range(port_count)]
+    for server in servers:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    ports_queue.put([server.server_address[1] for server in servers])
+    stop_event.wait()
+    for server in servers:
+        server.shutdown()
+
+
+class FeedReplayServer:
+    """녹화 피드 재생 서버 (컨텍스트 매니저).
+
+    크롤러는 호스트(host:port)별로 요청 간격을 지키므로, 동시성을 재현하도록
+    여러 포트에 피드를 나눠 배치합니다 (포트 하나 = 사이트 하나).
+    """
+
+    def __init__(self, feeds: List[RecordedFeed], config: Optional[ReplayConfig] = None, port_count: int = 8):
+        self.feeds = feeds
+        self.config = config or ReplayConfig()
+        self.port_count = max(1, min(port_count, len(feeds) or 1))
+        self.ports: List[int] = []
+        self._process = None
+        self._stop_event = None
+
+    def start(self) -> "FeedReplayServer":
+        """재생 서버 프로세스 시작."""
+        context = multiprocessing.get_context("spawn")
+        ports_queue = context.Queue()
+        self._stop_event = context.Event()
+        self._process = context.Process(
+            target=_serve,
+            args=(self.feeds, asdict(self.config), self.port_count, ports_queue, self._stop_event),
+            daemon=True
+        )
+        self._process.start()
+        self.ports = ports_queue.get(timeout=30)
+        logger.info(f"피드 재생 서버 시작: 피드 {len(self.feeds)}개, 포트 {self.ports}")
+        return self
+
+    def stop(self) -> None:
+        """재생 서버 프로세스 종료."""
+        if self._process is not None:
+            self._stop_event.set()
+            self._process.join(timeout=10)
+            if self._process.is_alive():
+                self._process.terminate()
+            self._process = None
+
+    def status_counts(self) -> Dict[str, int]:
+        """지금까지 응답한 상태 코드별 개수 (예: {"200": 12, "304": 12})."""
+        with urlopen(f"http://127.0.0.1:{self.ports[0]}/stats", timeout=10) as response:
+            return json.loads(response.read())
+
+    def url_for(self, index: int) -> str:
+        """index번째 피드의 재생 URL."""
+        return f"http://127.0.0.1:{self.ports[index % len(self.ports)]}/feeds/{index}"
+
+    def rss_feeds(self) -> Dict[str, List[str]]:
+        """RSSCrawler(rss_feeds=...)에 넘길 trend_type별 재생 URL 목록."""
+        feeds: Dict[str, List[str]] = {}
+        for index, feed in enumerate(self.feeds):
+            feeds.setdefault(feed.trend_type, []).append(self.url_for(index))
+        return feeds
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
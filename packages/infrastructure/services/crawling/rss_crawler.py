@@ -1,24 +1,93 @@
 """SNS 트렌드에 특화된 RSS 피드 크롤러."""
 
+import asyncio
+import hashlib
 import logging
+import time
 import feedparser
-import re
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
+import httpx
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Optional, Tuple, Iterator, AsyncIterator
 from dateutil import parser as date_parser
 from packages.infrastructure.services.crawling.base_crawler import BaseCrawler
+from packages.infrastructure.services.crawling.entry_normalizer import (
+    NormalizedEntry, ParsedHtml, entry_html, normalize_entry, parse_html, resolve_html_parser
+)
+from packages.infrastructure.services.crawling.feed_registry import FeedRegistry
+from packages.infrastructure.services.crawling.feed_state_store import FeedStateStore
+from packages.infrastructure.services.crawling.host_rate_limiter import HostRateLimiter
+from packages.infrastructure.services.crawling.html_parse_pool import HtmlParsePool, get_html_parse_pool
+from packages.infrastructure.services.crawling.keyword_matcher import KeywordHits, KeywordMatcher
 
 logger = logging.getLogger(__name__)
 
+# SNS 관련성 판단 정규식 패턴 (이름, 정규식)
+# 해시태그/멘션은 기호만 소비(lookahead)해서 뒤따르는 '#instagram'의 키워드도 함께 매칭되게 함
+_SOCIAL_PATTERNS = (
+    ("hashtag", r'#(?=\w)'),
+    ("mention", r'@(?=\w)'),
+    ("social_media", r'social\s+media'),
+    ("digital_marketing", r'digital\s+marketing'),
+    ("content_creator", r'content\s+creator'),
+)
+
+# 트렌드 타입 판단 규칙 (우선순위 순서, 타입 → 키워드)
+_TREND_TYPE_RULES = (
+    ('instagram_trend', ('instagram', 'insta')),
+    ('tiktok_trend', ('tiktok', '틱톡')),
+    ('youtube_trend', ('youtube', '유튜브')),
+    ('facebook_trend', ('facebook', '페이스북')),
+    ('twitter_trend', ('twitter', '트위터')),
+    ('linkedin_trend', ('linkedin', '링크드인')),
+    ('influencer_trend', ('influencer', '인플루언서')),
+    ('marketing_trend', ('marketing', '마케팅')),
+    ('startup_trend', ('startup', '스타트업', '부업', '사이드잡')),
+)
+
+# 법적 시사점 판단 키워드
+_LEGAL_KEYWORDS = (
+    'privacy', 'gdpr', 'data protection', 'regulation', 'compliance',
+    'privacy law', '개인정보', '규제', '정책', '법률', '규정'
+)
+
+# 매처 카테고리
+SNS_CATEGORY = "sns"
+TAG_CATEGORY = "tag"
+LEGAL_CATEGORY = "legal"
+
+
+def build_trend_matcher(sns_keywords: List[str]) -> KeywordMatcher:
+    """SNS 관련성/태그/트렌드 타입/법적 키워드를 하나로 묶은 매처 생성."""
+    keywords = [(keyword, (SNS_CATEGORY, TAG_CATEGORY)) for keyword in sns_keywords]
+    keywords += [(keyword, (SNS_CATEGORY,)) for keyword in ('influencer', 'viral', 'trending')]
+    keywords += [(keyword, (trend_type,)) for trend_type, type_keywords in _TREND_TYPE_RULES for keyword in type_keywords]
+    keywords += [(keyword, (LEGAL_CATEGORY,)) for keyword in _LEGAL_KEYWORDS]
+    patterns = [(name, regex, (SNS_CATEGORY,)) for name, regex in _SOCIAL_PATTERNS]
+    return KeywordMatcher(keywords, patterns)
+
 
 class RSSCrawler(BaseCrawler):
     """SNS 트렌드에 특화된 RSS 피드 크롤러."""
     
-    def __init__(self):
+    def __init__(self, rss_feeds: Optional[Dict[str, List[str]]] = None,
+                 state_store: Optional[FeedStateStore] = None,
+                 registry: Optional[FeedRegistry] = None,
+                 parse_pool: Optional[HtmlParsePool] = None):
         super().__init__()
         self.platform = "rss"
+        # 피드별 조건부 요청/변경 감지/워터마크/health 상태 (None이면 매번 전체 다운로드)
+        self.state_store = state_store
+        self.registry = registry or FeedRegistry()
+        # 항목 HTML 파싱 (풀이 없으면 크롤링 프로세스에서 파싱)
+        self.parse_pool = parse_pool or get_html_parse_pool()
+        self.html_parser = resolve_html_parser(self.settings.crawling_html_parser)
+        self.full_crawl = False
+        self.selected_feed_urls: Optional[set] = None
+        self.feed_states: Dict[str, Dict[str, Any]] = {}
+        self.pending_feed_states: Dict[str, Dict[str, Any]] = {}
+        self.feed_stats: Dict[str, Dict[str, Any]] = {}
         # SNS 트렌드 관련 RSS 피드들 (작동하는 것들만)
-        self.rss_feeds = {
+        self.rss_feeds = rss_feeds or {
             "social_media_trends": [
                 "https://blog.hootsuite.com/feed/",
                 "https://sproutsocial.com/insights/feed/",
@@ -51,269 +120,382 @@ class RSSCrawler(BaseCrawler):
             '부업', '사이드잡', '인플루언서', '크리에이터', '콘텐츠',
             '소셜미디어', '마케팅', '트렌드', '바이럴'
         ]
+        # 모든 분류기가 공유하는 키워드 매처 (항목당 텍스트 한 번 스캔)
+        self.matcher = build_trend_matcher(self.sns_keywords)
 
-    def crawl(self) -> List[Dict[str, Any]]:
-        """SNS 트렌드에 특화된 RSS 크롤링."""
-        all_trends = []
+    def crawl(self, full: bool = False, feed_urls: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """SNS 트렌드에 특화된 RSS 크롤링 (동기, 피드 순차 처리).
         
-        for trend_type, urls in self.rss_feeds.items():
-            for url in urls:
-                self._delay()
-                try:
-                    feed = feedparser.parse(url)
-                    if feed.bozo:
-                        logger.warning(f"RSS 피드 파싱 오류: {url} - {getattr(feed, 'bozo_exception', 'Unknown error')}")
-                        continue
-                    
-                    for entry in feed.entries:
-                        # 최근 7일 이내의 게시물만 필터링
-                        published_date = self._parse_date(entry.published)
-                        if published_date:
-                            # timezone 정보가 있는 경우와 없는 경우 모두 처리
-                            now = datetime.utcnow()
-                            if published_date.tzinfo is None:
-                                # timezone 정보가 없는 경우 UTC로 가정
-                                published_date = published_date.replace(tzinfo=None)
-                            else:
-                                # timezone 정보가 있는 경우 UTC로 변환
-                                published_date = published_date.astimezone().replace(tzinfo=None)
-                            
-                            if published_date > now - timedelta(days=7):
-                                # SNS 트렌드 관련성 체크
-                                if self._is_sns_related(entry):
-                                    trend = self._create_trend_data(entry, trend_type, published_date)
-                                    if trend:
-                                        all_trends.append(trend)
-                                    
-                except Exception as e:
-                    logger.error(f"RSS 피드 크롤링 실패 ({url}): {e}")
-                    continue
+        Args:
+            full: True면 조건부 요청/변경 감지/워터마크/서킷을 무시하고 전체 재수집 (재구축용)
+            feed_urls: 지정하면 해당 피드만 크롤링 (예: 크롤링할 차례가 된 피드)
+        """
+        return list(self.iter_trends(full, feed_urls))
+
+    async def acrawl(self, full: bool = False, feed_urls: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """SNS 트렌드에 특화된 RSS 크롤링 (비동기, 피드 동시 처리).
         
-        logger.info(f"SNS 트렌드 RSS 크롤링 완료: {len(all_trends)}개")
-        return all_trends
+        전역 지연 대신 호스트별 요청 간격으로 예의를 지키며,
+        전체 소요 시간은 모든 피드의 합이 아니라 가장 느린 피드 수준이 됩니다.
+        
+        Args:
+            full: True면 조건부 요청/변경 감지/워터마크/서킷을 무시하고 전체 재수집 (재구축용)
+            feed_urls: 지정하면 해당 피드만 크롤링 (예: 크롤링할 차례가 된 피드)
+        """
+        return [trend async for trend in self.aiter_trends(full, feed_urls)]
 
-    def _is_sns_related(self, entry) -> bool:
-        """SNS 트렌드 관련성 체크."""
-        try:
-            # 제목과 내용을 합쳐서 키워드 검사
-            title = entry.get('title', '')
-            if isinstance(title, bytes):
-                title = title.decode('utf-8', errors='ignore')
-            title = title.lower()
-            
-            content = self._extract_content(entry).lower()
-            combined_text = f"{title} {content}"
+    def iter_trends(self, full: bool = False, feed_urls: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+        """피드를 순차 처리하며 트렌드를 하나씩 내보내는 제너레이터."""
+        count = 0
+        self._begin_run(full, feed_urls)
+        
+        for trend_type, url in self._iter_feeds():
+            if self._circuit_open(url):
+                continue
+            self._delay()
+            started = time.monotonic()
+            try:
+                # 크롤러 세션(User-Agent, 커넥션 재사용)으로 받은 본문을 feedparser에 전달
+                response = self._safe_request(url, headers=self._conditional_headers(url))
+                latency = time.monotonic() - started
+                if response is None:
+                    self._record_failure(url, latency)
+                    continue
+                trends = self._handle_response(
+                    url, trend_type, response.status_code, response.headers, response.content, latency
+                )
+                                    
+            except Exception as e:
+                logger.error(f"RSS 피드 크롤링 실패 ({url}): {e}")
+                self._record_failure(url, time.monotonic() - started)
+                continue
             
-            # SNS 키워드가 포함되어 있는지 확인
-            for keyword in self.sns_keywords:
-                if keyword.lower() in combined_text:
-                    return True
+            count += len(trends)
+            yield from trends
+        
+        logger.info(f"SNS 트렌드 RSS 크롤링 완료: {count}개 (피드 {self.feed_stats_summary()})")
+
+    async def aiter_trends(self, full: bool = False, feed_urls: Optional[List[str]] = None,
+                           max_buffered: int = 200) -> AsyncIterator[Dict[str, Any]]:
+        """피드를 동시 처리하며 완료되는 순서대로 트렌드를 내보내는 비동기 이터레이터.
+        
+        피드 작업들은 최대 max_buffered개짜리 큐에 결과를 넣고, 소비자가 느려 큐가 차면
+        다음 결과를 넣을 때까지 대기합니다 (backpressure). 소비자가 중간에 멈추면
+        남은 피드 작업은 취소됩니다.
+        """
+        count = 0
+        rate_limiter = HostRateLimiter(self.settings.crawling_delay_min, self.settings.crawling_delay_max)
+        await asyncio.to_thread(self._begin_run, full, feed_urls)
+        
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max_buffered)
+        done = object()
+        
+        async with self._create_async_client() as client:
+            async def produce(url: str, trend_type: str) -> None:
+                try:
+                    for trend in await self._afetch_and_parse(client, rate_limiter, url, trend_type):
+                        await queue.put(trend)
+                except asyncio.CancelledError:
+                    # 소비자가 멈춰 취소된 경우 완료 표시를 넣지 않음
+                    # (꽉 찬 큐에서 기다리면 아래 gather가 끝나지 않음)
+                    raise
+                except Exception as e:
+                    logger.error(f"RSS 피드 처리 실패 ({url}): {e!r}")
+                await queue.put(done)
             
-            # 해시태그나 소셜미디어 관련 패턴 검사
-            social_patterns = [
-                r'#\w+',  # 해시태그
-                r'@\w+',  # 멘션
-                r'social\s+media',
-                r'digital\s+marketing',
-                r'content\s+creator',
-                r'influencer',
-                r'viral',
-                r'trending'
+            tasks = [
+                asyncio.create_task(produce(url, trend_type))
+                for trend_type, url in self._iter_feeds() if not self._circuit_open(url)
             ]
-            
-            for pattern in social_patterns:
-                if re.search(pattern, combined_text, re.IGNORECASE):
-                    return True
-            
-            return False
+            remaining = len(tasks)
+            try:
+                while remaining:
+                    item = await queue.get()
+                    if item is done:
+                        remaining -= 1
+                        continue
+                    count += 1
+                    yield item
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+        
+        logger.info(f"SNS 트렌드 RSS 비동기 크롤링 완료: {count}개 (피드 {self.feed_stats_summary()})")
+
+    def save_feed_states(self) -> None:
+        """이번 실행에서 갱신된 피드 상태 저장.
+        
+        트렌드 저장이 끝난 뒤 호출해야 합니다. 저장 전에 기록하면 저장 실패 시
+        다음 실행에서 본문이 '변경 없음'으로 판단되어 해당 글이 누락됩니다.
+        """
+        if self.state_store is not None and self.pending_feed_states:
+            self.state_store.save_states(self.pending_feed_states)
+        self.pending_feed_states = {}
+
+    def feed_stats_summary(self) -> Dict[str, int]:
+        """이번 실행의 피드 상태별 개수 (parsed, not_modified, unchanged, error, circuit_open)."""
+        summary: Dict[str, int] = {}
+        for stats in self.feed_stats.values():
+            summary[stats["status"]] = summary.get(stats["status"], 0) + 1
+        return summary
+
+    def feed_urls(self) -> List[str]:
+        """등록된 모든 피드 URL."""
+        return [url for urls in self.rss_feeds.values() for url in urls]
+
+    def _iter_feeds(self):
+        """(trend_type, url) 목록 (선택된 피드가 있으면 그 피드만)."""
+        for trend_type, urls in self.rss_feeds.items():
+            for url in urls:
+                if self.selected_feed_urls is None or url in self.selected_feed_urls:
+                    yield trend_type, url
+
+    def _create_async_client(self) -> httpx.AsyncClient:
+        """커넥션 풀을 공유하는 httpx 비동기 클라이언트 생성."""
+        return httpx.AsyncClient(
+            headers={'User-Agent': self.settings.crawling_user_agent},
+            timeout=httpx.Timeout(self.settings.crawling_timeout),
+            limits=httpx.Limits(
+                max_connections=self.settings.crawling_max_connections,
+                max_keepalive_connections=self.settings.crawling_max_connections
+            ),
+            follow_redirects=True
+        )
+
+    async def _afetch_and_parse(self, client: httpx.AsyncClient, rate_limiter: "HostRateLimiter",
+                                url: str, trend_type: str) -> List[Dict[str, Any]]:
+        """피드 하나를 내려받아 파싱 (피드별 타임아웃 적용, 실패 시 빈 목록)."""
+        started = None
+        try:
+            async with rate_limiter.slot(url):
+                started = time.monotonic()
+                response = await asyncio.wait_for(
+                    client.get(url, headers=self._conditional_headers(url)),
+                    timeout=self.settings.crawling_timeout
+                )
+            latency = time.monotonic() - started
+            # httpx는 3xx도 예외로 처리하므로 조건부 요청의 304는 _handle_response로 넘김
+            if response.status_code != 304:
+                response.raise_for_status()
+
+            # feedparser/BeautifulSoup은 CPU 작업이므로 이벤트 루프 밖에서 실행
+            return await asyncio.to_thread(
+                self._handle_response, url, trend_type, response.status_code, response.headers,
+                response.content, latency
+            )
             
         except Exception as e:
-            logger.error(f"SNS 관련성 체크 실패: {e}")
+            logger.error(f"RSS 피드 크롤링 실패 ({url}): {e!r}")
+            self._record_failure(url, time.monotonic() - started if started is not None else None)
+            return []
+
+    def _begin_run(self, full: bool = False, feed_urls: Optional[List[str]] = None) -> None:
+        """실행별 통계 초기화 및 저장된 피드 상태 조회."""
+        self.full_crawl = full
+        self.selected_feed_urls = set(feed_urls) if feed_urls else None
+        self.feed_stats = {}
+        self.pending_feed_states = {}
+        if self.state_store is not None:
+            self.feed_states = self.state_store.load_states(url for _, url in self._iter_feeds())
+
+    def _conditional_headers(self, url: str) -> Dict[str, str]:
+        """저장된 ETag/Last-Modified로 조건부 요청 헤더 구성."""
+        if self.full_crawl:
+            return {}
+        state = self.feed_states.get(url) or {}
+        headers = {}
+        if state.get("etag"):
+            headers["If-None-Match"] = state["etag"]
+        if state.get("last_modified"):
+            headers["If-Modified-Since"] = state["last_modified"]
+        return headers
+
+    def _circuit_open(self, url: str) -> bool:
+        """서킷이 열린 피드인지 확인 (전체 재수집 시에는 무시)."""
+        if self.full_crawl or self.registry.is_available(self.feed_states.get(url)):
             return False
+        self._record_feed(url, "circuit_open")
+        return True
 
-    def _create_trend_data(self, entry, trend_type: str, published_date: datetime) -> Dict[str, Any]:
-        """트렌드 데이터 생성."""
-        try:
-            content = self._extract_content(entry)
-            tags = self._extract_tags(entry)
+    def _record_failure(self, url: str, latency: Optional[float] = None) -> None:
+        """요청 실패를 피드 상태(health)와 통계에 반영."""
+        state = {**(self.feed_states.get(url) or {}), "last_checked_at": datetime.utcnow(), "last_status": "error"}
+        self.pending_feed_states[url] = self.registry.record_failure(state, latency)
+        self._record_feed(url, "error")
+
+    def _handle_response(self, url: str, trend_type: str, status_code: int,
+                         headers, content: bytes, latency: Optional[float] = None) -> List[Dict[str, Any]]:
+        """응답 처리: 304이거나 본문 digest가 같으면 파싱을 건너뜀."""
+        previous = self.feed_states.get(url) or {}
+        now = datetime.utcnow()
+        state = {**previous, "last_checked_at": now}
+        
+        if status_code == 304:
+            # 변경 없음도 정상 응답이므로 성공으로 기록 (연속 실패 초기화, 서킷 닫기)
+            state["last_status"] = "not_modified"
+            self.pending_feed_states[url] = self.registry.record_success(state, latency, now=now)
+            self._record_feed(url, "not_modified")
+            return []
+        
+        state["etag"] = headers.get("etag")
+        state["last_modified"] = headers.get("last-modified")
+        digest = hashlib.sha256(content).hexdigest()
+        
+        if not self.full_crawl and digest == previous.get("body_digest"):
+            state["last_status"] = "unchanged"
+            self.pending_feed_states[url] = self.registry.record_success(state, latency, now=now)
+            self._record_feed(url, "unchanged", size=len(content))
+            return []
+        
+        watermark = None if self.full_crawl else previous
+        trends, feed_meta, skipped = self._parse_feed(content, url, trend_type, watermark)
+        observed_items_per_day = feed_meta.pop("observed_items_per_day", None)
+        state.update(body_digest=digest, last_status="parsed", last_changed_at=now, **feed_meta)
+        self.pending_feed_states[url] = self.registry.record_success(state, latency, observed_items_per_day, now)
+        self._record_feed(url, "parsed", size=len(content), entries=len(trends), skipped=skipped)
+        return trends
+
+    def _record_feed(self, url: str, status: str, size: int = 0, entries: int = 0, skipped: int = 0) -> None:
+        """피드별 처리 결과 기록 (skipped: 워터마크 이전이라 건너뛴 항목 수)."""
+        self.feed_stats[url] = {"status": status, "bytes": size, "entries": entries, "skipped": skipped}
+        logger.debug(f"피드 처리 결과 ({url}): {status}, {size}바이트, {entries}개, 워터마크 이전 {skipped}개")
+
+    def _parse_feed(self, content: bytes, url: str, trend_type: str,
+                    watermark: Optional[Dict[str, Any]] = None) -> Tuple[List[Dict[str, Any]], Dict[str, Any], int]:
+        """내려받은 피드 본문을 파싱하여 트렌드 데이터 목록으로 변환.
+        
+        watermark(마지막으로 본 항목 ID/게시 시각)가 있으면 그보다 새 항목만 처리합니다.
+        
+        Returns:
+            (트렌드 목록, 피드 메타(새 워터마크 필드, observed_items_per_day), 워터마크 이전이라 건너뛴 항목 수)
+        """
+        trends = []
+        skipped = 0
+        candidates = []
+        
+        feed = feedparser.parse(content)
+        if feed.bozo and not feed.entries:
+            logger.warning(f"RSS 피드 파싱 오류: {url} - {getattr(feed, 'bozo_exception', 'Unknown error')}")
+            return trends, {}, skipped
+        
+        watermark = watermark or {}
+        mark_id = watermark.get("watermark_entry_id")
+        mark_published = watermark.get("watermark_published_at")
+        latest_id, latest_published = None, None
+        published_dates = []
+        
+        now = datetime.utcnow()
+        for entry in feed.entries:
+            entry_id = entry.get('id') or entry.get('link')
+            raw_date = entry.get('published') or entry.get('updated')
             
-            # SNS 트렌드 타입 결정
-            sns_trend_type = self._determine_sns_trend_type(entry, trend_type)
+            # 최근 7일 이내의 게시물만 필터링
+            published_date = self._parse_date(raw_date)
+            if published_date:
+                # timezone 정보가 있는 경우와 없는 경우 모두 처리
+                if published_date.tzinfo is None:
+                    # timezone 정보가 없는 경우 UTC로 가정
+                    published_date = published_date.replace(tzinfo=None)
+                else:
+                    # timezone 정보가 있는 경우 UTC로 변환
+                    published_date = published_date.astimezone(timezone.utc).replace(tzinfo=None)
+                
+                # 워터마크 후보는 날짜가 있는 항목 중 가장 최근 것
+                if raw_date:
+                    published_dates.append(published_date)
+                    if latest_published is None or published_date > latest_published:
+                        latest_id, latest_published = entry_id, published_date
+                
+                # 이미 처리한 항목 (날짜가 없는 항목은 ID로만 판단)
+                if (entry_id and entry_id == mark_id) or (raw_date and mark_published and published_date <= mark_published):
+                    skipped += 1
+                    continue
+                
+                if published_date > now - timedelta(days=7):
+                    candidates.append((entry, published_date))
+        
+        # 대상 항목의 HTML을 한 번에 파싱 (파싱 풀이 있으면 여러 코어로 분산)
+        parsed_htmls = self._parse_htmls([entry_html(entry) for entry, _ in candidates])
+        for (entry, published_date), parsed in zip(candidates, parsed_htmls):
+            # 항목당 한 번만 HTML 파싱/키워드 스캔 후 모든 분류기가 공유
+            record = normalize_entry(entry, published_date, parsed)
+            hits = self.matcher.match(record.combined_lower)
             
+            # SNS 트렌드 관련성 체크
+            if self._is_sns_related(hits):
+                trend = self._create_trend_data(record, hits, trend_type)
+                if trend:
+                    trends.append(trend)
+        
+        feed_meta = {"observed_items_per_day": FeedRegistry.observed_items_per_day(published_dates)}
+        # 워터마크는 앞으로만 이동
+        if latest_published is not None and (mark_published is None or latest_published > mark_published):
+            feed_meta.update(watermark_entry_id=latest_id, watermark_published_at=latest_published)
+        return trends, feed_meta, skipped
+
+    def _parse_htmls(self, htmls: List[str]) -> List[ParsedHtml]:
+        """항목 HTML 목록을 본문 텍스트/미디어 여부로 변환 (입력 순서 유지)."""
+        if self.parse_pool is not None:
+            return self.parse_pool.parse_many(htmls)
+        return [parse_html(html, self.html_parser) for html in htmls]
+
+    def _is_sns_related(self, hits: KeywordHits) -> bool:
+        """SNS 트렌드 관련성 체크 (SNS 키워드 또는 해시태그/멘션/소셜미디어 표현)."""
+        return hits.has(SNS_CATEGORY)
+
+    def _create_trend_data(self, record: NormalizedEntry, hits: KeywordHits, trend_type: str) -> Dict[str, Any]:
+        """트렌드 데이터 생성."""
+        try:
             return {
                 "platform": self.platform,
-                "trend_type": sns_trend_type,
-                "title": entry.get('title', ''),
-                "content": content,
-                "url": entry.get('link', ''),
-                "tags": tags,
-                "engagement_metrics": self._extract_engagement_metrics(entry),
-                "legal_implications": self._extract_legal_implications(entry),
-                "created_at": published_date
+                "trend_type": self._determine_sns_trend_type(hits, trend_type),
+                "title": record.title,
+                "content": record.content,
+                "url": record.link,
+                "tags": self._extract_tags(record, hits),
+                "engagement_metrics": self._extract_engagement_metrics(record),
+                "legal_implications": self._extract_legal_implications(record, hits),
+                "created_at": record.published
             }
             
         except Exception as e:
             logger.error(f"트렌드 데이터 생성 실패: {e}")
             return None
 
-    def _determine_sns_trend_type(self, entry, original_type: str) -> str:
-        """SNS 트렌드 타입 결정."""
-        try:
-            title = entry.get('title', '').lower()
-            content = self._extract_content(entry).lower()
-            combined_text = f"{title} {content}"
-            
-            # 플랫폼별 트렌드 타입
-            if any(platform in combined_text for platform in ['instagram', 'insta']):
-                return 'instagram_trend'
-            elif any(platform in combined_text for platform in ['tiktok', '틱톡']):
-                return 'tiktok_trend'
-            elif any(platform in combined_text for platform in ['youtube', '유튜브']):
-                return 'youtube_trend'
-            elif any(platform in combined_text for platform in ['facebook', '페이스북']):
-                return 'facebook_trend'
-            elif any(platform in combined_text for platform in ['twitter', '트위터']):
-                return 'twitter_trend'
-            elif any(platform in combined_text for platform in ['linkedin', '링크드인']):
-                return 'linkedin_trend'
-            elif any(keyword in combined_text for keyword in ['influencer', '인플루언서']):
-                return 'influencer_trend'
-            elif any(keyword in combined_text for keyword in ['marketing', '마케팅']):
-                return 'marketing_trend'
-            elif any(keyword in combined_text for keyword in ['startup', '스타트업', '부업', '사이드잡']):
-                return 'startup_trend'
-            else:
-                return 'general_sns_trend'
-                
-        except Exception as e:
-            logger.error(f"SNS 트렌드 타입 결정 실패: {e}")
-            return 'general_sns_trend'
+    def _determine_sns_trend_type(self, hits: KeywordHits, original_type: str) -> str:
+        """SNS 트렌드 타입 결정 (플랫폼 → 인플루언서 → 마케팅 → 스타트업 순)."""
+        for sns_trend_type, _ in _TREND_TYPE_RULES:
+            if hits.has(sns_trend_type):
+                return sns_trend_type
+        return 'general_sns_trend'
 
-    def _extract_content(self, entry) -> str:
-        """RSS 항목에서 내용 추출."""
-        try:
-            # summary 또는 description에서 내용 추출
-            content = entry.get('summary', '') or entry.get('description', '')
-            
-            # UTF-8 인코딩 문제 해결
-            if isinstance(content, bytes):
-                try:
-                    content = content.decode('utf-8')
-                except UnicodeDecodeError:
-                    try:
-                        content = content.decode('latin-1')
-                    except UnicodeDecodeError:
-                        content = content.decode('utf-8', errors='ignore')
-            
-            # HTML 태그 제거
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(content, 'html.parser')
-            text_content = soup.get_text(strip=True)
-            
-            # 특수 문자 정리
-            if text_content:
-                text_content = text_content.encode('utf-8', errors='ignore').decode('utf-8')
-                return text_content[:1000]
-            else:
-                title = entry.get('title', '')
-                if isinstance(title, bytes):
-                    title = title.decode('utf-8', errors='ignore')
-                return title
-            
-        except Exception as e:
-            logger.error(f"내용 추출 실패: {e}")
-            title = entry.get('title', '')
-            if isinstance(title, bytes):
-                title = title.decode('utf-8', errors='ignore')
-            return title
-
-    def _extract_tags(self, entry) -> List[str]:
-        """RSS 항목에서 태그 추출."""
-        try:
-            tags = []
-            
-            # RSS 태그에서 추출
-            if hasattr(entry, 'tags'):
-                for tag in entry.tags:
-                    tags.append(f"#{tag.term}")
-            
-            # 카테고리에서 추출
-            if hasattr(entry, 'categories'):
-                for category in entry.categories:
-                    tags.append(f"#{category}")
-            
-            # SNS 관련 태그 추가
-            title = entry.get('title', '').lower()
-            content = self._extract_content(entry).lower()
-            combined_text = f"{title} {content}"
-            
-            for keyword in self.sns_keywords:
-                if keyword.lower() in combined_text:
-                    tags.append(f"#{keyword}")
-            
-            return list(set(tags))[:10]  # 중복 제거 후 최대 10개
-            
-        except Exception as e:
-            logger.error(f"태그 추출 실패: {e}")
-            return []
+    def _extract_tags(self, record: NormalizedEntry, hits: KeywordHits) -> List[str]:
+        """RSS 태그/카테고리와 본문 SNS 키워드로 태그 구성."""
+        tags = list(record.feed_tags)
+        
+        # SNS 관련 태그 추가
+        if hits.has(TAG_CATEGORY):
+            tags.extend(f"#{keyword}" for keyword in self.sns_keywords if keyword.lower() in hits.terms)
+        
+        return list(set(tags))[:10]  # 중복 제거 후 최대 10개
 
-    def _extract_engagement_metrics(self, entry) -> Dict[str, Any]:
+    def _extract_engagement_metrics(self, record: NormalizedEntry) -> Dict[str, Any]:
         """참여도 지표 추출 (RSS에서는 제한적)."""
-        try:
-            # RSS에서는 직접적인 참여도 지표가 제한적
-            # 대신 제목 길이나 내용 길이로 간접 추정
-            title_length = len(entry.get('title', ''))
-            content_length = len(self._extract_content(entry))
-            
-            return {
-                "title_length": title_length,
-                "content_length": content_length,
-                "has_media": self._has_media_content(entry)
-            }
-            
-        except Exception as e:
-            logger.error(f"참여도 지표 추출 실패: {e}")
-            return {}
-
-    def _has_media_content(self, entry) -> bool:
-        """미디어 콘텐츠 포함 여부 확인."""
-        try:
-            content = self._extract_content(entry)
-            media_patterns = [
-                r'<img', r'<video', r'<audio', r'youtube\.com', r'youtu\.be',
-                r'instagram\.com', r'tiktok\.com', r'vimeo\.com'
-            ]
-            
-            for pattern in media_patterns:
-                if re.search(pattern, content, re.IGNORECASE):
-                    return True
-            
-            return False
-            
-        except Exception as e:
-            logger.error(f"미디어 콘텐츠 확인 실패: {e}")
-            return False
+        # RSS에서는 직접적인 참여도 지표가 제한적
+        # 대신 제목 길이나 내용 길이로 간접 추정
+        return {
+            "title_length": len(record.title),
+            "content_length": len(record.content),
+            "has_media": record.has_media
+        }
 
-    def _extract_legal_implications(self, entry) -> str:
+    def _extract_legal_implications(self, record: NormalizedEntry, hits: KeywordHits) -> Optional[str]:
         """법적 시사점 추출."""
-        try:
-            content = self._extract_content(entry)
-            
-            # 법적 키워드가 포함된 경우
-            legal_keywords = [
-                'privacy', 'gdpr', 'data protection', 'regulation', 'compliance',
-                'privacy law', '개인정보', '규제', '정책', '법률', '규정'
-            ]
-            
-            for keyword in legal_keywords:
-                if keyword.lower() in content.lower():
-                    return f"법적 시사점: {content[:200]}..."
-            
-            return None
-            
-        except Exception as e:
-            logger.error(f"법적 시사점 추출 실패: {e}")
-            return None
+        # 법적 키워드가 포함된 경우
+        if hits.has(LEGAL_CATEGORY):
+            return f"법적 시사점: {record.content[:200]}..."
+        return None
 
     def _parse_date(self, date_string: str) -> datetime:
         """날짜 문자열을 datetime 객체로 파싱."""
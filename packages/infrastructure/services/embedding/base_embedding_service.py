@@ -42,6 +42,18 @@ class BaseEmbeddingService(ABC):
             logger.error(f"텍스트 임베딩 실패: {e}")
             raise
     
+    def embed_texts_array(self, texts: List[str]) -> np.ndarray:
+        """여러 텍스트를 (len(texts), dimension) float32 행렬로 변환."""
+        if not self.model:
+            self.load_model()
+        
+        try:
+            embeddings = self.model.encode(texts, convert_to_numpy=True)
+            return np.asarray(embeddings, dtype=np.float32)
+        except Exception as e:
+            logger.error(f"텍스트 임베딩 실패: {e}")
+            raise
+    
     def create_embedding_data(self, trend_data: Dict[str, Any]) -> Dict[str, Any]:
         """트렌드 데이터로부터 임베딩 데이터 생성."""
         try:
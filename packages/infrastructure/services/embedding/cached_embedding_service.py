@@ -0,0 +1,257 @@
+"""콘텐츠 해시 기반 영속 임베딩 캐시."""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from packages.infrastructure.config.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class CachedEmbeddingService:
+    """임베딩 서비스를 감싸는 2단 캐시 (프로세스 내 LRU → SQLite 디스크 저장소).
+
+    키는 (모델 이름, 텍스트 blake2b 해시)이며, 값은 float32 벡터 바이트입니다.
+    SimpleEmbeddingService, SentenceTransformerEmbeddingService 등
+    embed_texts / embed_texts_array를 제공하는 어떤 서비스든 감쌀 수 있습니다.
+    """
+
+    def __init__(self, embedding_service, memory_size: int = 4096,
+                 disk_path: Optional[str] = None, disk_max_entries: int = 200_000):
+        self.embedding_service = embedding_service
+        self.model_name = getattr(embedding_service, "model_name", embedding_service.__class__.__name__)
+        self.dimension = embedding_service.dimension
+        self.memory_size = memory_size
+        self.disk_path = disk_path
+        self.disk_max_entries = disk_max_entries
+
+        self._memory: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+        self._disk_writes_since_prune = 0
+
+        # 적중/미스 카운터
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def embed_text(self, text: str) -> List[float]:
+        """단일 텍스트 임베딩 (캐시 사용)."""
+        return self.embed_texts_array([text])[0].tolist()
+
+    def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """여러 텍스트 임베딩 (캐시 사용)."""
+        return self.embed_texts_array(texts).tolist()
+
+    def embed_texts_array(self, texts: List[str]) -> np.ndarray:
+        """여러 텍스트를 (len(texts), dimension) float32 행렬로 변환 (캐시 사용)."""
+        result = np.empty((len(texts), self.dimension), dtype=np.float32)
+        keys = [self._cache_key(text) for text in texts]
+
+        # 1) 메모리 LRU 조회
+        pending: Dict[bytes, List[int]] = {}
+        with self._lock:
+            for row, key in enumerate(keys):
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    result[row] = vector
+                    self.memory_hits += 1
+                else:
+                    pending.setdefault(key, []).append(row)
+
+        if not pending:
+            return result
+
+        # 2) 디스크 저장소 조회 (적중/미스는 메모리 적중과 같은 단위인 행 기준으로 집계)
+        disk_rows = 0
+        for key, vector in self._disk_get_many(list(pending)).items():
+            for row in pending.pop(key):
+                result[row] = vector
+                disk_rows += 1
+            self._memory_put(key, vector)
+        with self._lock:
+            self.disk_hits += disk_rows
+
+        # 3) 남은 텍스트만 한 번에 임베딩
+        if pending:
+            missing_keys = list(pending)
+            missing_texts = [texts[pending[key][0]] for key in missing_keys]
+            vectors = self._embed_uncached(missing_texts)
+            with self._lock:
+                self.misses += sum(len(rows) for rows in pending.values())
+
+            for key, vector in zip(missing_keys, vectors):
+                for row in pending[key]:
+                    result[row] = vector
+                self._memory_put(key, vector)
+            self._disk_put_many(list(zip(missing_keys, vectors)))
+
+        return result
+
+    def stats(self) -> Dict[str, float]:
+        """캐시 적중/미스 통계."""
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_ratio": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+            "memory_entries": len(self._memory),
+        }
+
+    def _cache_key(self, text: str) -> bytes:
+        """(모델 이름, 콘텐츠 해시) 키."""
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(self.model_name.encode("utf-8"))
+        hasher.update(b"\x00")
+        hasher.update(text.encode("utf-8", errors="ignore"))
+        return hasher.digest()
+
+    def _embed_uncached(self, texts: List[str]) -> np.ndarray:
+        """감싼 서비스로 실제 임베딩 수행."""
+        if hasattr(self.embedding_service, "embed_texts_array"):
+            return self.embedding_service.embed_texts_array(texts)
+        return np.asarray(self.embedding_service.embed_texts(texts), dtype=np.float32)
+
+    def _memory_put(self, key: bytes, vector: np.ndarray) -> None:
+        """메모리 LRU 저장 (크기 초과 시 가장 오래된 항목 제거)."""
+        with self._lock:
+            self._memory[key] = np.array(vector, dtype=np.float32, copy=True)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """디스크 저장소 연결 (fork 후에는 재연결)."""
+        if not self.disk_path:
+            return None
+
+        if self._conn is not None and self._conn_pid == os.getpid():
+            return self._conn
+
+        try:
+            Path(self.disk_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.disk_path, timeout=5, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS embedding_cache (
+                    key BLOB PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    vector BLOB NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_embedding_cache_accessed_at ON embedding_cache (accessed_at)")
+            conn.commit()
+            self._conn = conn
+            self._conn_pid = os.getpid()
+            return conn
+        except Exception as e:
+            logger.warning(f"임베딩 디스크 캐시 비활성화 (연결 실패): {e}")
+            self.disk_path = None
+            return None
+
+    def _disk_get_many(self, keys: List[bytes]) -> Dict[bytes, np.ndarray]:
+        """디스크 저장소에서 여러 키 조회."""
+        found: Dict[bytes, np.ndarray] = {}
+        with self._lock:
+            conn = self._connection()
+            if conn is None or not keys:
+                return found
+
+            try:
+                # SQLite 바인딩 변수 제한(999)을 고려해 나눠서 조회
+                for i in range(0, len(keys), 500):
+                    chunk = keys[i:i + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = conn.execute(
+                        f"SELECT key, vector FROM embedding_cache WHERE key IN ({placeholders})",
+                        chunk
+                    ).fetchall()
+                    for key, blob in rows:
+                        vector = np.frombuffer(blob, dtype=np.float32)
+                        if vector.shape[0] == self.dimension:
+                            found[key] = vector
+
+                if found:
+                    now = time.time()
+                    conn.executemany(
+                        "UPDATE embedding_cache SET accessed_at = ? WHERE key = ?",
+                        [(now, key) for key in found]
+                    )
+                    conn.commit()
+            except Exception as e:
+                logger.warning(f"임베딩 디스크 캐시 조회 실패: {e}")
+
+        return found
+
+    def _disk_put_many(self, items: List[Tuple[bytes, np.ndarray]]) -> None:
+        """디스크 저장소에 여러 벡터 저장 (용량 초과 시 오래 안 쓴 항목부터 제거)."""
+        with self._lock:
+            conn = self._connection()
+            if conn is None or not items:
+                return
+
+            try:
+                now = time.time()
+                conn.executemany(
+                    "INSERT OR REPLACE INTO embedding_cache (key, model, vector, accessed_at) VALUES (?, ?, ?, ?)",
+                    [(key, self.model_name, np.asarray(vector, dtype=np.float32).tobytes(), now) for key, vector in items]
+                )
+                conn.commit()
+
+                self._disk_writes_since_prune += len(items)
+                if self._disk_writes_since_prune >= 1000:
+                    self._prune_disk(conn)
+            except Exception as e:
+                logger.warning(f"임베딩 디스크 캐시 저장 실패: {e}")
+
+    def _prune_disk(self, conn: sqlite3.Connection) -> None:
+        """디스크 저장소 크기를 disk_max_entries 이하로 유지."""
+        self._disk_writes_since_prune = 0
+        count = conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0]
+        overflow = count - self.disk_max_entries
+        if overflow > 0:
+            conn.execute(
+                "DELETE FROM embedding_cache WHERE key IN "
+                "(SELECT key FROM embedding_cache ORDER BY accessed_at LIMIT ?)",
+                (overflow,)
+            )
+            conn.commit()
+            logger.info(f"임베딩 디스크 캐시 정리: {overflow}개 제거")
+
+
+# 전역 인스턴스
+_embedding_service = None
+_embedding_service_lock = threading.Lock()
+
+
+def get_embedding_service():
+    """프로세스 공유 임베딩 서비스 반환 (설정에 따라 캐시로 감쌈)."""
+    global _embedding_service
+    if _embedding_service is None:
+        with _embedding_service_lock:
+            if _embedding_service is None:
+                from packages.infrastructure.services.embedding.simple_embedding_service import SimpleEmbeddingService
+
+                settings = get_settings()
+                service = SimpleEmbeddingService()
+                if settings.embedding_cache_enabled:
+                    service = CachedEmbeddingService(
+                        service,
+                        memory_size=settings.embedding_cache_memory_size,
+                        disk_path=settings.embedding_cache_path or None,
+                        disk_max_entries=settings.embedding_cache_max_entries
+                    )
+                _embedding_service = service
+    return _embedding_service
@@ -0,0 +1,154 @@
+"""동시 임베딩 요청을 모아 한 번에 처리하는 asyncio 마이크로 배처."""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+import numpy as np
+from packages.infrastructure.config.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingMicroBatcher:
+    """embed_text 호출을 최대 window_ms 동안 또는 max_batch_size개까지 모아
+    워커 스레드에서 한 번의 배치 임베딩으로 처리하는 배처.
+
+    모델 추론은 전용 스레드에서 실행되므로 이벤트 루프를 막지 않으며,
+    동시 요청이 많을수록 배치 효율이 올라갑니다.
+    """
+
+    def __init__(self, embedding_service, window_ms: float = 5.0, max_batch_size: int = 64,
+                 executor: Optional[ThreadPoolExecutor] = None):
+        self.embedding_service = embedding_service
+        self.window = window_ms / 1000.0
+        self.max_batch_size = max_batch_size
+        self._executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="embedding-batcher")
+
+        # 이벤트 루프별 큐/워커 (Celery처럼 루프가 바뀌는 환경 대응)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+        # 지표
+        self._metrics_lock = threading.Lock()
+        self.batches = 0
+        self.items = 0
+        self.queue_wait_total = 0.0
+        self.queue_wait_max = 0.0
+
+    async def embed_text(self, text: str) -> List[float]:
+        """단일 텍스트 임베딩 (다른 동시 요청과 함께 배치 처리)."""
+        vector = await self._submit(text)
+        return vector.tolist()
+
+    async def embed_texts(self, texts: List[str]) -> np.ndarray:
+        """여러 텍스트 임베딩 ((len(texts), dimension) float32 행렬)."""
+        if not texts:
+            return np.empty((0, self.embedding_service.dimension), dtype=np.float32)
+        vectors = await asyncio.gather(*(self._submit(text) for text in texts))
+        return np.vstack(vectors)
+
+    def metrics(self) -> Dict[str, float]:
+        """배치 및 큐 대기 시간 지표."""
+        with self._metrics_lock:
+            return {
+                "batches": self.batches,
+                "items": self.items,
+                "avg_batch_size": self.items / self.batches if self.batches else 0.0,
+                "queue_wait_avg_ms": self.queue_wait_total / self.items * 1000 if self.items else 0.0,
+                "queue_wait_max_ms": self.queue_wait_max * 1000,
+                "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            }
+
+    async def _submit(self, text: str) -> np.ndarray:
+        """요청을 큐에 넣고 결과를 기다림."""
+        loop = asyncio.get_running_loop()
+        self._ensure_worker(loop)
+
+        future = loop.create_future()
+        await self._queue.put((text, future, loop.time()))
+        return await future
+
+    def _ensure_worker(self, loop: asyncio.AbstractEventLoop) -> None:
+        """현재 이벤트 루프에 큐와 워커 태스크를 준비."""
+        if self._loop is loop and self._worker is not None and not self._worker.done():
+            return
+
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._worker = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        """큐에서 요청을 모아 배치 단위로 임베딩."""
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.window
+
+            # 윈도우가 끝나거나 배치가 찰 때까지 수집
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # 취소된 요청은 제외
+            batch = [item for item in batch if not item[1].done()]
+            if not batch:
+                continue
+
+            started = loop.time()
+            self._record_batch([started - enqueued for _, _, enqueued in batch])
+
+            texts = [text for text, _, _ in batch]
+            try:
+                vectors = await loop.run_in_executor(
+                    self._executor, self.embedding_service.embed_texts_array, texts
+                )
+            except Exception as e:
+                logger.error(f"배치 임베딩 실패 ({len(texts)}개): {e}")
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future, _), vector in zip(batch, vectors):
+                if not future.done():
+                    future.set_result(vector)
+
+    def _record_batch(self, waits: List[float]) -> None:
+        """배치 처리 지표 기록."""
+        with self._metrics_lock:
+            self.batches += 1
+            self.items += len(waits)
+            self.queue_wait_total += sum(waits)
+            self.queue_wait_max = max(self.queue_wait_max, max(waits))
+
+
+# 전역 인스턴스
+_embedding_batcher: Optional[EmbeddingMicroBatcher] = None
+_embedding_batcher_lock = threading.Lock()
+
+
+def get_embedding_batcher() -> EmbeddingMicroBatcher:
+    """프로세스 공유 임베딩 마이크로 배처 반환."""
+    global _embedding_batcher
+    if _embedding_batcher is None:
+        with _embedding_batcher_lock:
+            if _embedding_batcher is None:
+                from packages.infrastructure.services.embedding.cached_embedding_service import get_embedding_service
+
+                settings = get_settings()
+                _embedding_batcher = EmbeddingMicroBatcher(
+                    get_embedding_service(),
+                    window_ms=settings.embedding_batch_window_ms,
+                    max_batch_size=settings.embedding_batch_max_size
+                )
+    return _embedding_batcher
@@ -1,5 +1,6 @@
 """간단한 임베딩 서비스 (sentence-transformers 대신 사용)"""
 
+import hashlib
 import numpy as np
 from typing import List
 import logging
@@ -8,41 +9,43 @@ logger = logging.getLogger(__name__)
 
 
 class SimpleEmbeddingService:
-    """간단한 임베딩 서비스 - 실제 프로덕션에서는 sentence-transformers 사용"""
-    
+    """간단한 임베딩 서비스 - 실제 프로덕션에서는 sentence-transformers 사용
+
+    텍스트 전체의 blake2b 해시로 시드를 만들기 때문에 프로세스(API, Celery 워커,
+    크롤러)가 달라도 같은 텍스트는 항상 같은 벡터를 얻습니다.
+    (내장 hash()는 프로세스마다 솔트가 달라 저장/검색 임베딩이 어긋남)
+    """
+
     def __init__(self):
         self.dimension = 384  # sentence-transformers/all-MiniLM-L6-v2와 동일한 차원
-    
+        self.model_name = "simple-hash-embedding"
+
+    def embed_texts_array(self, texts: List[str]) -> np.ndarray:
+        """텍스트들을 (len(texts), dimension) float32 정규화 행렬로 변환 (더미 구현)"""
+        embeddings = np.empty((len(texts), self.dimension), dtype=np.float32)
+
+        for row, text in enumerate(texts):
+            # 텍스트당 한 번의 Generator 생성 + 한 번의 벡터 샘플링
+            rng = np.random.default_rng(self._stable_seed(text))
+            embeddings[row] = rng.standard_normal(self.dimension, dtype=np.float32)
+
+        # 배치 전체를 한 번에 정규화
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        np.divide(embeddings, norms, out=embeddings, where=norms > 0)
+
+        logger.debug(f"간단한 임베딩 생성 완료: {len(texts)}개")
+        return embeddings
+
     def embed_texts(self, texts: List[str]) -> List[List[float]]:
         """텍스트들을 임베딩으로 변환 (더미 구현)"""
-        embeddings = []
-        
-        for text in texts:
-            # 간단한 해시 기반 임베딩 생성 (실제로는 sentence-transformers 사용)
-            # 텍스트의 길이와 단어 수를 기반으로 한 더미 벡터 생성
-            words = text.split()
-            text_length = len(text)
-            word_count = len(words)
-            
-            # 384차원 벡터 생성 (텍스트 특성을 반영한 더미 벡터)
-            embedding = []
-            for i in range(self.dimension):
-                # 텍스트 길이, 단어 수, 문자 코드 등을 기반으로 한 결정적 벡터
-                seed = hash(text[:min(50, len(text))]) + i
-                np.random.seed(seed % (2**32))
-                value = np.random.normal(0, 1)
-                embedding.append(float(value))
-            
-            # 정규화
-            norm = np.linalg.norm(embedding)
-            if norm > 0:
-                embedding = [x / norm for x in embedding]
-            
-            embeddings.append(embedding)
-        
-        logger.info(f"간단한 임베딩 생성 완료: {len(embeddings)}개")
-        return embeddings
-    
+        return self.embed_texts_array(texts).tolist()
+
     def embed_text(self, text: str) -> List[float]:
         """단일 텍스트 임베딩"""
-        return self.embed_texts([text])[0]
+        return self.embed_texts_array([text])[0].tolist()
+
+    @staticmethod
+    def _stable_seed(text: str) -> int:
+        """프로세스와 무관하게 고정된 64비트 시드 (텍스트 전체의 blake2b)."""
+        digest = hashlib.blake2b(text.encode("utf-8", errors="ignore"), digest_size=8).digest()
+        return int.from_bytes(digest, "little")
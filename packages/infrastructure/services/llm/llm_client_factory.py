@@ -0,0 +1,196 @@
+"""(model, base_url)별로 HTTP 커넥션 풀을 공유하는 LLM 클라이언트 팩토리."""
+
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple, Type
+import httpx
+from langchain_naver import ChatClovaX
+from packages.infrastructure.config.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# 생성 노드 공통 설정 (structured output은 thinking과 함께 쓸 수 없음)
+DEFAULT_THINKING = {"effort": "none"}
+
+
+@dataclass
+class _PoolCounters:
+    """풀별 뷰/요청 카운터."""
+
+    views: int = 0
+    requests: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def add_view(self) -> None:
+        with self.lock:
+            self.views += 1
+
+    def on_request(self, request: httpx.Request) -> None:
+        """httpx 요청 이벤트 훅."""
+        with self.lock:
+            self.requests += 1
+
+
+@dataclass
+class _PooledClient:
+    """(model, base_url) 하나에 대한 기본 ChatClovaX와 공유 HTTP 클라이언트."""
+
+    base: ChatClovaX
+    http_client: httpx.Client
+    http_async_client: httpx.AsyncClient
+    counters: _PoolCounters
+
+
+class LLMClientFactory:
+    """프로세스당 (model, base_url)별로 keep-alive 커넥션 풀을 하나씩 두고,
+    노드에는 그 풀을 공유하는 가벼운 설정 뷰(temperature, max_tokens, structured schema)를 나눠주는 팩토리.
+
+    뷰는 기본 클라이언트의 얕은 복사(model_copy)라 생성 비용이 거의 없고,
+    내부 OpenAI 호환 클라이언트와 httpx 커넥션 풀을 그대로 공유합니다.
+    fork된 자식 프로세스(Celery prefork, uvicorn 워커)에서는 부모의 소켓을 쓰지 않도록 풀을 새로 만듭니다.
+    """
+
+    def __init__(self):
+        self.settings = get_settings()
+        self._lock = threading.RLock()
+        self._clients: Dict[Tuple[str, str], _PooledClient] = {}
+        self._pid: Optional[int] = None
+
+    def get_llm(self, temperature: Optional[float] = None, max_tokens: Optional[int] = None,
+                schema: Optional[Type] = None, model: Optional[str] = None,
+                base_url: Optional[str] = None, **overrides: Any):
+        """공유 커넥션 풀을 쓰는 설정 뷰 반환.
+
+        Args:
+            temperature: 샘플링 온도 (None이면 기본값)
+            max_tokens: 최대 생성 토큰 수 (None이면 기본값)
+            schema: 지정하면 해당 Pydantic 모델로 structured output (json_schema)
+            model, base_url: 기본값은 설정의 Clova X 모델/엔드포인트
+            overrides: 그 밖에 ChatClovaX 필드 (예: thinking, top_p)
+        """
+        pooled = self._get_pooled(model or self.settings.clova_x_model, base_url or self.settings.clova_x_base_url)
+
+        update = dict(overrides)
+        if temperature is not None:
+            update["temperature"] = temperature
+        if max_tokens is not None:
+            update["max_tokens"] = max_tokens
+        llm = pooled.base.model_copy(update=update) if update else pooled.base
+
+        pooled.counters.add_view()
+        if schema is not None:
+            llm = llm.with_structured_output(schema, method="json_schema")
+        return llm
+
+    def stats(self) -> Dict[str, Any]:
+        """(model, base_url)별 뷰 수, 요청 수, 열린/유휴 커넥션 수."""
+        with self._lock:
+            clients = dict(self._clients) if self._pid == os.getpid() else {}
+        return {
+            "pid": os.getpid(),
+            "pools": [
+                {
+                    "model": model,
+                    "base_url": base_url,
+                    "views": pooled.counters.views,
+                    "requests": pooled.counters.requests,
+                    "sync_connections": self._connection_stats(pooled.http_client),
+                    "async_connections": self._connection_stats(pooled.http_async_client),
+                    "max_connections": self.settings.llm_max_connections,
+                    "max_keepalive_connections": self.settings.llm_max_keepalive_connections,
+                }
+                for (model, base_url), pooled in clients.items()
+            ],
+        }
+
+    async def aclose(self) -> None:
+        """동기/비동기 커넥션 풀 정리 (이벤트 루프 종료 전 사용)."""
+        with self._lock:
+            clients = list(self._clients.values()) if self._pid == os.getpid() else []
+            self._clients = {}
+        for pooled in clients:
+            pooled.http_client.close()
+            await pooled.http_async_client.aclose()
+        if clients:
+            logger.info("LLM 커넥션 풀 정리 완료")
+
+    def _get_pooled(self, model: str, base_url: str) -> _PooledClient:
+        """현재 프로세스의 (model, base_url) 풀 반환 (없으면 생성)."""
+        with self._lock:
+            self._check_pid()
+            pooled = self._clients.get((model, base_url))
+            if pooled is None:
+                pooled = self._create_pooled(model, base_url)
+                self._clients[(model, base_url)] = pooled
+                logger.info(f"LLM 커넥션 풀 생성: {model} @ {base_url} (pid={self._pid})")
+            return pooled
+
+    def _create_pooled(self, model: str, base_url: str) -> _PooledClient:
+        """keep-alive 커넥션 풀을 가진 httpx 클라이언트와 기본 ChatClovaX 생성."""
+        limits = httpx.Limits(
+            max_connections=self.settings.llm_max_connections,
+            max_keepalive_connections=self.settings.llm_max_keepalive_connections,
+            keepalive_expiry=self.settings.llm_keepalive_expiry
+        )
+        timeout = httpx.Timeout(self.settings.llm_timeout)
+        counters = _PoolCounters()
+
+        async def on_async_request(request: httpx.Request) -> None:
+            counters.on_request(request)
+
+        http_client = httpx.Client(limits=limits, timeout=timeout, event_hooks={"request": [counters.on_request]})
+        http_async_client = httpx.AsyncClient(
+            limits=limits, timeout=timeout, event_hooks={"request": [on_async_request]}
+        )
+        base = ChatClovaX(
+            api_key=self.settings.clova_x_api_key,
+            base_url=base_url,
+            model=model,
+            thinking=DEFAULT_THINKING,
+            http_client=http_client,
+            http_async_client=http_async_client,
+        )
+        return _PooledClient(base, http_client, http_async_client, counters)
+
+    def _check_pid(self) -> None:
+        """PID가 바뀌었으면(fork) 상속받은 풀을 닫지 않고 버립니다. 락 안에서 호출."""
+        pid = os.getpid()
+        if self._pid != pid:
+            self._clients = {}
+            self._pid = pid
+
+    def _after_fork_in_child(self) -> None:
+        """fork 직후 자식 프로세스에서 호출되는 훅."""
+        # fork 시점에 다른 스레드가 락을 잡고 있었을 수 있으므로 새로 생성
+        self._lock = threading.RLock()
+        self._clients = {}
+        self._pid = os.getpid()
+
+    @staticmethod
+    def _connection_stats(client) -> Dict[str, int]:
+        """httpx 클라이언트의 열린/유휴 커넥션 수 (httpcore 풀 내부 상태, 조회 실패 시 0)."""
+        pool = getattr(getattr(client, "_transport", None), "_pool", None)
+        connections = list(getattr(pool, "connections", None) or [])
+        return {
+            "open": len(connections),
+            "idle": sum(1 for connection in connections if connection.is_idle()),
+        }
+
+
+# 전역 인스턴스
+_llm_client_factory: Optional[LLMClientFactory] = None
+_llm_client_factory_lock = threading.Lock()
+
+
+def get_llm_client_factory() -> LLMClientFactory:
+    """프로세스 공유 LLM 클라이언트 팩토리 반환."""
+    global _llm_client_factory
+    if _llm_client_factory is None:
+        with _llm_client_factory_lock:
+            if _llm_client_factory is None:
+                _llm_client_factory = LLMClientFactory()
+                if hasattr(os, "register_at_fork"):
+                    os.register_at_fork(after_in_child=_llm_client_factory._after_fork_in_child)
+    return _llm_client_factory
@@ -0,0 +1,269 @@
+"""입력이 같으면 LLM 응답도 같아도 되는 노드를 위한 완전 일치 응답 캐시."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from packages.infrastructure.config.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Valkey 오류 후 다시 시도하기까지 대기 시간 (초)
+_VALKEY_RETRY_INTERVAL = 30.0
+
+
+def normalize_cache_input(value: Any) -> Any:
+    """캐시 키용 입력 정규화 (유니코드 NFKC, 앞뒤 공백 제거, 연속 공백 축약)."""
+    if isinstance(value, str):
+        return " ".join(unicodedata.normalize("NFKC", value).split())
+    if isinstance(value, dict):
+        return {str(key): normalize_cache_input(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [normalize_cache_input(item) for item in value]
+    return value
+
+
+class _NodeMetrics:
+    """노드별 캐시 지표."""
+
+    __slots__ = ("memory_hits", "valkey_hits", "misses", "bypasses", "latency_saved")
+
+    def __init__(self):
+        self.memory_hits = 0
+        self.valkey_hits = 0
+        self.misses = 0
+        self.bypasses = 0
+        self.latency_saved = 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        lookups = self.memory_hits + self.valkey_hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "valkey_hits": self.valkey_hits,
+            "misses": self.misses,
+            "bypasses": self.bypasses,
+            "hit_ratio": (self.memory_hits + self.valkey_hits) / lookups if lookups else 0.0,
+            "latency_saved_seconds": round(self.latency_saved, 3),
+        }
+
+
+class LLMResponseCache:
+    """2단 LLM 응답 캐시 (프로세스 내 LRU → Valkey).
+
+    키는 (노드 이름, 모델, 프롬프트 버전, 정규화된 입력)의 blake2b 해시이고,
+    값은 JSON으로 직렬화 가능한 노드 결과와 원래 LLM 호출에 걸린 시간입니다.
+    적중할 때마다 원래 호출 시간을 '절약한 지연 시간'으로 집계합니다.
+    Valkey가 없거나 오류가 나면 메모리 캐시만으로 동작합니다.
+    """
+
+    def __init__(self, memory_size: int = 2048, valkey_url: Optional[str] = None,
+                 ttls: Optional[Dict[str, int]] = None, default_ttl: int = 86400,
+                 key_prefix: str = "llm_cache:"):
+        self.memory_size = memory_size
+        self.valkey_url = valkey_url
+        self.ttls = dict(ttls or {})
+        self.default_ttl = default_ttl
+        self.key_prefix = key_prefix
+
+        # key -> (만료 시각, 값, 원래 LLM 호출 시간)
+        self._memory: "OrderedDict[str, Tuple[float, Any, float]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._metrics: Dict[str, _NodeMetrics] = {}
+        self._client = None
+        self._async_clients: Dict[int, Any] = {}
+        self._valkey_retry_at = 0.0
+
+    def make_key(self, node: str, model: str, prompt_version: str, inputs: Dict[str, Any]) -> str:
+        """(노드, 모델, 프롬프트 버전, 정규화된 입력) 캐시 키."""
+        payload = json.dumps(
+            [node, model, prompt_version, normalize_cache_input(inputs)],
+            ensure_ascii=False, sort_keys=True, separators=(",", ":")
+        )
+        return f"{node}:{hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()}"
+
+    def ttl_for(self, node: str) -> int:
+        """노드별 TTL (초)."""
+        return self.ttls.get(node, self.default_ttl)
+
+    def get(self, node: str, key: str) -> Optional[Any]:
+        """캐시 조회 (동기)."""
+        started = time.perf_counter()
+        cached = self._memory_get(key)
+        if cached is not None:
+            return self._hit(node, "memory", cached, started)
+
+        entry = self._decode(self._valkey_call(lambda client: client.get(self.key_prefix + key)))
+        if entry is not None:
+            self._memory_put(key, entry, self.ttl_for(node))
+            return self._hit(node, "valkey", entry, started)
+
+        self._record_miss(node)
+        return None
+
+    async def aget(self, node: str, key: str) -> Optional[Any]:
+        """캐시 조회 (비동기, Valkey는 redis.asyncio 클라이언트 사용)."""
+        started = time.perf_counter()
+        cached = self._memory_get(key)
+        if cached is not None:
+            return self._hit(node, "memory", cached, started)
+
+        entry = self._decode(await self._avalkey_call(lambda client: client.get(self.key_prefix + key)))
+        if entry is not None:
+            self._memory_put(key, entry, self.ttl_for(node))
+            return self._hit(node, "valkey", entry, started)
+
+        self._record_miss(node)
+        return None
+
+    def set(self, node: str, key: str, value: Any, latency: float) -> None:
+        """캐시 저장 (동기)."""
+        ttl = self.ttl_for(node)
+        entry = (value, latency)
+        self._memory_put(key, entry, ttl)
+        self._valkey_call(lambda client: client.set(self.key_prefix + key, self._encode(entry), ex=ttl))
+
+    async def aset(self, node: str, key: str, value: Any, latency: float) -> None:
+        """캐시 저장 (비동기)."""
+        ttl = self.ttl_for(node)
+        entry = (value, latency)
+        self._memory_put(key, entry, ttl)
+        await self._avalkey_call(lambda client: client.set(self.key_prefix + key, self._encode(entry), ex=ttl))
+
+    def record_bypass(self, node: str) -> None:
+        """요청이 캐시 우회를 지정한 경우 집계."""
+        with self._lock:
+            self._metrics_for(node).bypasses += 1
+
+    def metrics(self) -> Dict[str, Any]:
+        """노드별 적중률과 절약한 지연 시간."""
+        with self._lock:
+            nodes = {node: metrics.as_dict() for node, metrics in self._metrics.items()}
+            return {
+                "memory_entries": len(self._memory),
+                "valkey": bool(self.valkey_url),
+                "nodes": nodes,
+            }
+
+    def _hit(self, node: str, tier: str, entry: Tuple[Any, float], started: float) -> Any:
+        """적중 집계 (절약한 지연 = 원래 LLM 호출 시간 - 조회 시간)."""
+        value, latency = entry
+        with self._lock:
+            metrics = self._metrics_for(node)
+            if tier == "memory":
+                metrics.memory_hits += 1
+            else:
+                metrics.valkey_hits += 1
+            metrics.latency_saved += max(latency - (time.perf_counter() - started), 0.0)
+        return value
+
+    def _record_miss(self, node: str) -> None:
+        with self._lock:
+            self._metrics_for(node).misses += 1
+
+    def _metrics_for(self, node: str) -> _NodeMetrics:
+        with self._lock:
+            metrics = self._metrics.get(node)
+            if metrics is None:
+                metrics = self._metrics[node] = _NodeMetrics()
+            return metrics
+
+    def _memory_get(self, key: str) -> Optional[Tuple[Any, float]]:
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is None:
+                return None
+            expires_at, value, latency = cached
+            if expires_at <= time.monotonic():
+                del self._memory[key]
+                return None
+            self._memory.move_to_end(key)
+            return value, latency
+
+    def _memory_put(self, key: str, entry: Tuple[Any, float], ttl: int) -> None:
+        value, latency = entry
+        with self._lock:
+            self._memory[key] = (time.monotonic() + ttl, value, latency)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+    @staticmethod
+    def _encode(entry: Tuple[Any, float]) -> str:
+        value, latency = entry
+        return json.dumps({"value": value, "latency": latency}, ensure_ascii=False)
+
+    @staticmethod
+    def _decode(raw: Optional[Any]) -> Optional[Tuple[Any, float]]:
+        if raw is None:
+            return None
+        try:
+            data = json.loads(raw)
+            return data["value"], float(data.get("latency") or 0.0)
+        except (ValueError, KeyError, TypeError):
+            return None
+
+    def _valkey_available(self) -> bool:
+        return bool(self.valkey_url) and time.monotonic() >= self._valkey_retry_at
+
+    def _valkey_failed(self, e: Exception) -> None:
+        logger.warning(f"LLM 응답 캐시 Valkey 사용 불가, {_VALKEY_RETRY_INTERVAL:.0f}초 동안 메모리 캐시만 사용: {e}")
+        self._valkey_retry_at = time.monotonic() + _VALKEY_RETRY_INTERVAL
+
+    def _valkey_call(self, operation) -> Optional[Any]:
+        """동기 Valkey 명령 실행 (실패 시 None)."""
+        if not self._valkey_available():
+            return None
+        try:
+            if self._client is None:
+                import redis
+
+                self._client = redis.Redis.from_url(self.valkey_url, socket_timeout=0.5, socket_connect_timeout=0.5)
+            return operation(self._client)
+        except Exception as e:
+            self._valkey_failed(e)
+            return None
+
+    async def _avalkey_call(self, operation) -> Optional[Any]:
+        """비동기 Valkey 명령 실행 (이벤트 루프별 클라이언트, 실패 시 None)."""
+        if not self._valkey_available():
+            return None
+        try:
+            loop_id = id(asyncio.get_running_loop())
+            client = self._async_clients.get(loop_id)
+            if client is None:
+                import redis.asyncio as aioredis
+
+                client = aioredis.Redis.from_url(self.valkey_url, socket_timeout=0.5, socket_connect_timeout=0.5)
+                self._async_clients[loop_id] = client
+            return await operation(client)
+        except Exception as e:
+            self._valkey_failed(e)
+            return None
+
+
+# 전역 인스턴스
+_llm_response_cache: Optional[LLMResponseCache] = None
+_llm_response_cache_lock = threading.Lock()
+
+
+def get_llm_response_cache() -> Optional[LLMResponseCache]:
+    """프로세스 공유 LLM 응답 캐시 반환 (llm_cache_enabled가 꺼져 있으면 None)."""
+    global _llm_response_cache
+    settings = get_settings()
+    if not settings.llm_cache_enabled:
+        return None
+    if _llm_response_cache is None:
+        with _llm_response_cache_lock:
+            if _llm_response_cache is None:
+                _llm_response_cache = LLMResponseCache(
+                    memory_size=settings.llm_cache_memory_size,
+                    valkey_url=settings.llm_cache_valkey_url or None,
+                    ttls=settings.llm_cache_ttls,
+                    default_ttl=settings.llm_cache_default_ttl
+                )
+    return _llm_response_cache
@@ -0,0 +1,173 @@
+"""비슷한 프로필이면 생성 결과를 재사용하는 사이드잡 생성용 의미 기반 응답 캐시."""
+
+import logging
+import threading
+import time
+import unicodedata
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from packages.infrastructure.config.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize_text(value: Any) -> str:
+    """유니코드 NFKC, 소문자, 연속 공백 축약."""
+    return " ".join(unicodedata.normalize("NFKC", str(value or "")).lower().split())
+
+
+def canonical_profile_text(job: str, hobbies: Sequence[str], strength_type: str) -> str:
+    """임베딩용 정규화 프로필 문자열 (취미는 중복 제거 후 정렬해 입력 순서와 무관하게 만듦)."""
+    canonical_hobbies = sorted({_normalize_text(hobby) for hobby in hobbies if _normalize_text(hobby)})
+    return (
+        f"직업: {_normalize_text(job)} | "
+        f"취미: {', '.join(canonical_hobbies)} | "
+        f"강점: {_normalize_text(strength_type)}"
+    )
+
+
+class _Partition:
+    """표현 방식 하나에 대한 캐시 항목 (정규화 벡터 행렬 + 값)."""
+
+    __slots__ = ("vectors", "entries")
+
+    def __init__(self, dimension: int):
+        self.vectors = np.empty((0, dimension), dtype=np.float32)
+        # (만료 시각, 값, 원래 LLM 호출 시간)
+        self.entries: List[Tuple[float, Any, float]] = []
+
+    def prune(self, now: float) -> None:
+        """만료된 항목 제거."""
+        alive = [row for row, entry in enumerate(self.entries) if entry[0] > now]
+        if len(alive) != len(self.entries):
+            self.vectors = self.vectors[alive]
+            self.entries = [self.entries[row] for row in alive]
+
+
+class SemanticResponseCache:
+    """프로필 임베딩 유사도로 조회하는 프로세스 내 응답 캐시.
+
+    표현 방식(expression_style)과 프롬프트 버전이 같은 항목끼리만 비교하고,
+    코사인 유사도가 임계값 이상인 가장 가까운 항목을 돌려줍니다.
+    항목은 트렌드 크롤링 주기(TTL)가 지나면 만료되어 새 트렌드로 다시 생성됩니다.
+    """
+
+    def __init__(self, dimension: int, threshold: float = 0.95,
+                 thresholds: Optional[Dict[str, float]] = None, ttl: int = 3600,
+                 max_entries: int = 512):
+        self.dimension = dimension
+        self.threshold = threshold
+        self.thresholds = dict(thresholds or {})
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        self._partitions: Dict[Tuple[str, str], _Partition] = {}
+        self._lock = threading.Lock()
+
+        # 지표
+        self.hits = 0
+        self.misses = 0
+        self.bypasses = 0
+        self.latency_saved = 0.0
+        self._hit_similarity_sum = 0.0
+
+    def threshold_for(self, style: str) -> float:
+        """표현 방식별 적중 임계값."""
+        return self.thresholds.get(style, self.threshold)
+
+    def lookup(self, style: str, prompt_version: str, vector: np.ndarray) -> Optional[Any]:
+        """유사도가 임계값 이상인 가장 가까운 항목의 값 (없으면 None)."""
+        query = self._normalize(vector)
+        with self._lock:
+            partition = self._partitions.get((style, prompt_version))
+            if partition is not None:
+                partition.prune(time.monotonic())
+            if partition is None or not partition.entries:
+                self.misses += 1
+                return None
+
+            similarities = partition.vectors @ query
+            best = int(np.argmax(similarities))
+            similarity = float(similarities[best])
+            if similarity < self.threshold_for(style):
+                self.misses += 1
+                return None
+
+            _, value, latency = partition.entries[best]
+            self.hits += 1
+            self.latency_saved += latency
+            self._hit_similarity_sum += similarity
+            return value
+
+    def store(self, style: str, prompt_version: str, vector: np.ndarray, value: Any, latency: float) -> None:
+        """생성 결과 저장 (용량을 넘으면 가장 먼저 들어온 항목부터 제거)."""
+        row = self._normalize(vector)[np.newaxis, :]
+        with self._lock:
+            partition = self._partitions.get((style, prompt_version))
+            if partition is None:
+                partition = self._partitions[(style, prompt_version)] = _Partition(self.dimension)
+            partition.prune(time.monotonic())
+
+            partition.vectors = np.vstack([partition.vectors, row])
+            partition.entries.append((time.monotonic() + self.ttl, value, latency))
+            overflow = len(partition.entries) - self.max_entries
+            if overflow > 0:
+                partition.vectors = partition.vectors[overflow:]
+                partition.entries = partition.entries[overflow:]
+
+    def record_bypass(self) -> None:
+        """요청이 캐시 우회를 지정한 경우 집계."""
+        with self._lock:
+            self.bypasses += 1
+
+    def metrics(self) -> Dict[str, Any]:
+        """적중률, 평균 적중 유사도, 절약한 지연 시간."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "bypasses": self.bypasses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "mean_hit_similarity": self._hit_similarity_sum / self.hits if self.hits else 0.0,
+                "latency_saved_seconds": round(self.latency_saved, 3),
+                "entries": {
+                    f"{style}:v{version}": len(partition.entries)
+                    for (style, version), partition in self._partitions.items()
+                },
+                "ttl_seconds": self.ttl,
+            }
+
+    def _normalize(self, vector: np.ndarray) -> np.ndarray:
+        """L2 정규화 (내적 = 코사인 유사도)."""
+        vector = np.asarray(vector, dtype=np.float32).reshape(-1)
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm > 0 else vector
+
+
+# 전역 인스턴스
+_semantic_response_cache: Optional[SemanticResponseCache] = None
+_semantic_response_cache_lock = threading.Lock()
+
+
+def get_semantic_response_cache() -> Optional[SemanticResponseCache]:
+    """프로세스 공유 의미 기반 응답 캐시 반환 (llm_semantic_cache_enabled가 꺼져 있으면 None)."""
+    global _semantic_response_cache
+    settings = get_settings()
+    if not settings.llm_semantic_cache_enabled:
+        return None
+    if _semantic_response_cache is None:
+        with _semantic_response_cache_lock:
+            if _semantic_response_cache is None:
+                from packages.infrastructure.services.embedding.cached_embedding_service import get_embedding_service
+
+                # TTL을 지정하지 않으면 피드 최소 크롤링 주기에 맞춰 새 트렌드가 반영되도록 함
+                ttl_minutes = settings.llm_semantic_cache_ttl_minutes or settings.crawling_min_interval_minutes
+                _semantic_response_cache = SemanticResponseCache(
+                    dimension=get_embedding_service().dimension,
+                    threshold=settings.llm_semantic_cache_threshold,
+                    thresholds=settings.llm_semantic_cache_thresholds,
+                    ttl=ttl_minutes * 60,
+                    max_entries=settings.llm_semantic_cache_max_entries
+                )
+    return _semantic_response_cache
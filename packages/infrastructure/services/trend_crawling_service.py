@@ -1,7 +1,11 @@
 """SNS 트렌드 RSS 크롤링 서비스."""
 
+import asyncio
 import logging
-from typing import List, Dict, Any
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional
+from packages.infrastructure.config.config import get_settings
+from packages.infrastructure.services.crawling.feed_state_store import FeedStateStore
 from packages.infrastructure.services.crawling.rss_crawler import RSSCrawler
 from packages.infrastructure.services.trend_storage_service import TrendStorageService
 
@@ -13,49 +17,104 @@ class TrendCrawlingService:
     
     def __init__(self):
         self.storage_service = TrendStorageService()
-        self.rss_crawler = RSSCrawler()
+        self.rss_crawler = RSSCrawler(state_store=FeedStateStore())
+        self.settings = get_settings()
     
-    def crawl_all_trends(self) -> Dict[str, int]:
-        """SNS 트렌드 RSS 크롤링 및 저장."""
+    def crawl_all_trends(self, full: bool = False, feed_urls: Optional[List[str]] = None) -> Dict[str, int]:
+        """SNS 트렌드 RSS 크롤링 및 저장 (Celery 등 동기 환경용).
+        
+        크롤러가 내보내는 트렌드를 crawling_stream_batch_size개씩 바로 저장하므로
+        수집과 저장이 겹쳐 진행되고, 중간에 실패해도 커밋된 배치는 남습니다.
+        
+        Args:
+            full: True면 피드 워터마크/변경 감지/서킷을 무시하고 전체 재수집
+            feed_urls: 지정하면 해당 피드만 크롤링 (None이면 모든 피드)
+        """
         try:
-            logger.info("SNS 트렌드 RSS 크롤링 시작")
-            trends = self.rss_crawler.crawl()
-            
-            if trends:
-                saved_trends = self.storage_service.save_trends(trends)
-                count = len(saved_trends)
-                logger.info(f"SNS 트렌드 RSS 크롤링 완료: {count}개")
-                return {"rss": count}
-            else:
-                logger.warning("SNS 트렌드 RSS 크롤링 결과 없음")
-                return {"rss": 0}
-                
+            return self._crawl(full, feed_urls)
         except Exception as e:
             logger.error(f"SNS 트렌드 RSS 크롤링 실패: {e}")
             return {"rss": 0}
     
+    def crawl_feed(self, feed_url: str, full: bool = False) -> Dict[str, Any]:
+        """피드 하나 크롤링 및 저장 (Celery 피드별 태스크용, 저장 실패 시 예외 전파로 재시도)."""
+        return {"feed_url": feed_url, **self._crawl(full, [feed_url])}
+    
+    def _crawl(self, full: bool = False, feed_urls: Optional[List[str]] = None) -> Dict[str, Any]:
+        """크롤링 스트림을 배치 단위로 저장하고 결과 요약 (예외는 호출자에게 전파)."""
+        logger.info(f"SNS 트렌드 RSS 크롤링 시작 ({'전체' if full else '증분'}, 피드 {len(feed_urls) if feed_urls else '전체'})")
+        if self.settings.crawling_async:
+            totals = asyncio.run(self._astream_trends(full, feed_urls))
+        else:
+            totals = self.storage_service.save_trend_stream(
+                self.rss_crawler.iter_trends(full, feed_urls), batch_size=self.settings.crawling_stream_batch_size
+            )
+        return self._finish_run(totals)
+    
+    async def acrawl_all_trends(self, full: bool = False) -> Dict[str, int]:
+        """SNS 트렌드 RSS 크롤링 및 저장 (이미 이벤트 루프가 도는 환경용)."""
+        try:
+            logger.info(f"SNS 트렌드 RSS 비동기 크롤링 시작 ({'전체' if full else '증분'})")
+            totals = await self._astream_trends(full)
+            return await asyncio.to_thread(self._finish_run, totals)
+        except Exception as e:
+            logger.error(f"SNS 트렌드 RSS 크롤링 실패: {e}")
+            return {"rss": 0}
+    
+    def due_feed_urls(self) -> List[str]:
+        """적응형 주기상 크롤링할 차례가 되었고 서킷이 닫힌 피드 URL 목록."""
+        feed_urls = self.rss_crawler.feed_urls()
+        states = self.rss_crawler.state_store.load_states(feed_urls)
+        return self.rss_crawler.registry.due_feed_urls(feed_urls, states)
+    
+    def claim_due_feed_urls(self) -> List[str]:
+        """크롤링할 차례가 된 피드를 선점해 반환 (디스패치 직전에 사용).
+        
+        next_crawl_at은 피드 태스크가 저장을 마친 뒤에야 앞으로 옮겨지므로, 선점하지 않으면
+        대기 중이거나 재시도 중인 피드가 beat 주기마다 다시 디스패치되어 중복 크롤링이 쌓입니다.
+        """
+        now = datetime.utcnow()
+        lease_until = now + timedelta(minutes=self.settings.crawling_dispatch_lease_minutes)
+        return self.rss_crawler.state_store.claim_feeds(self.due_feed_urls(), lease_until, now)
+    
+    async def _astream_trends(self, full: bool = False, feed_urls: Optional[List[str]] = None) -> Dict[str, int]:
+        """비동기 크롤러 스트림을 배치 단위로 저장."""
+        return await self.storage_service.asave_trend_stream(
+            self.rss_crawler.aiter_trends(full, feed_urls), batch_size=self.settings.crawling_stream_batch_size
+        )
+    
+    def _finish_run(self, totals: Dict[str, int]) -> Dict[str, Any]:
+        """피드 상태 갱신 및 결과 요약.
+        
+        피드 상태(digest, 워터마크)는 모든 배치가 저장된 뒤에만 기록합니다.
+        중간에 실패하면 다음 실행이 같은 피드를 다시 처리하고, 이미 저장된 행은
+        ON CONFLICT로 건너뜁니다.
+        """
+        self.rss_crawler.save_feed_states()
+        feeds = self.rss_crawler.feed_stats_summary()
+        
+        if not totals["batches"]:
+            logger.warning(f"SNS 트렌드 RSS 크롤링 결과 없음 (피드 {feeds})")
+            return {"rss": 0, "feeds": feeds}
+        
+        logger.info(f"SNS 트렌드 RSS 크롤링 완료: {totals['saved']}개 (거부 {totals['rejected']}개, 피드 {feeds})")
+        return {
+            "rss": totals["saved"],
+            "inserted": totals["inserted"],
+            "updated": totals["updated"],
+            "skipped": totals["skipped"],
+            "rejected": totals["rejected"],
+            "batches": totals["batches"],
+            "feeds": feeds
+        }
+    
     def crawl_platform_trends(self, platform: str) -> int:
         """RSS 트렌드 크롤링 (platform 파라미터는 호환성을 위해 유지)."""
         if platform != "rss":
             logger.warning(f"지원하지 않는 플랫폼: {platform}. RSS만 지원됩니다.")
             return 0
         
-        try:
-            logger.info("SNS 트렌드 RSS 크롤링 시작")
-            trends = self.rss_crawler.crawl()
-            
-            if trends:
-                saved_trends = self.storage_service.save_trends(trends)
-                count = len(saved_trends)
-                logger.info(f"SNS 트렌드 RSS 크롤링 완료: {count}개")
-                return count
-            else:
-                logger.warning("SNS 트렌드 RSS 크롤링 결과 없음")
-                return 0
-                
-        except Exception as e:
-            logger.error(f"SNS 트렌드 RSS 크롤링 실패: {e}")
-            return 0
+        return self.crawl_all_trends()["rss"]
     
     def search_trends(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
         """트렌드 검색."""
@@ -1,24 +1,84 @@
 """트렌드 검색 및 추천을 위한 서비스."""
 
+import asyncio
 import logging
 import json
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import text, and_, or_
+from sqlalchemy import text, bindparam, and_, or_
+from pgvector.sqlalchemy import Vector
 from packages.core.db.uow_sqlalchemy import SqlAlchemyUoW
-from packages.domain.entities.sns_trend import SNSTrend, TrendEmbedding
-from packages.infrastructure.services.embedding.simple_embedding_service import SimpleEmbeddingService
+from packages.domain.entities.sns_trend import SNSTrend, TrendEmbedding, EMBEDDING_DIMENSION
+from packages.infrastructure.services.embedding.cached_embedding_service import get_embedding_service
+from packages.infrastructure.services.embedding.micro_batcher import get_embedding_batcher
 from packages.infrastructure.config.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# _row_to_trend_dict에 필요한 컬럼만 조회
+_TREND_COLUMNS = """
+    st.id, st.uuid, st.platform, st.trend_type, st.title, st.content, st.url,
+    st.tags, st.engagement_metrics, st.legal_implications, st.created_at, st.is_active
+"""
+
+# 거리 연산자로 직접 정렬해야 플래너가 ANN 인덱스(vector_cosine_ops)를 사용할 수 있음
+_VECTOR_SEARCH_TEMPLATE = """
+    SELECT {columns},
+           1 - (te.embedding <=> :query_vector) AS similarity_score
+    FROM trend_embeddings te
+    JOIN sns_trends st ON st.uuid = te.trend_uuid
+    WHERE st.is_active = true{platform_filter}
+    ORDER BY te.embedding <=> :query_vector
+    LIMIT :limit
+"""
+
+_VECTOR_SEARCH_SQL = text(
+    _VECTOR_SEARCH_TEMPLATE.format(columns=_TREND_COLUMNS, platform_filter="")
+).bindparams(bindparam("query_vector", type_=Vector(EMBEDDING_DIMENSION)))
+
+_VECTOR_SEARCH_BY_PLATFORM_SQL = text(
+    _VECTOR_SEARCH_TEMPLATE.format(columns=_TREND_COLUMNS, platform_filter=" AND st.platform = :platform")
+).bindparams(bindparam("query_vector", type_=Vector(EMBEDDING_DIMENSION)))
+
+# 쿼리 벡터 배열을 unnest한 뒤 쿼리마다 LATERAL k-NN (한 번의 왕복으로 모든 top-k 조회)
+_BATCH_VECTOR_SEARCH_TEMPLATE = """
+    SELECT q.query_index, hit.*
+    FROM unnest(CAST(:query_vectors AS text[])) WITH ORDINALITY AS q(query_vector, query_index)
+    CROSS JOIN LATERAL (
+        SELECT {columns},
+               1 - (te.embedding <=> CAST(q.query_vector AS vector)) AS similarity_score
+        FROM trend_embeddings te
+        JOIN sns_trends st ON st.uuid = te.trend_uuid
+        WHERE st.is_active = true{platform_filter}
+        ORDER BY te.embedding <=> CAST(q.query_vector AS vector)
+        LIMIT :limit
+    ) AS hit
+    ORDER BY q.query_index, hit.similarity_score DESC
+"""
+
+_BATCH_VECTOR_SEARCH_SQL = text(
+    _BATCH_VECTOR_SEARCH_TEMPLATE.format(columns=_TREND_COLUMNS, platform_filter="")
+)
+
+_BATCH_VECTOR_SEARCH_BY_PLATFORM_SQL = text(
+    _BATCH_VECTOR_SEARCH_TEMPLATE.format(columns=_TREND_COLUMNS, platform_filter=" AND st.platform = :platform")
+)
+
+_SET_EF_SEARCH_SQL = text("SELECT set_config('hnsw.ef_search', :ef_search, true)")
+
+
+
+def _to_vector_literal(embedding: List[float]) -> str:
+    """임베딩을 pgvector 입력 형식 문자열('[x1,x2,...]')로 변환."""
+    return "[" + ",".join(str(float(value)) for value in embedding) + "]"
+
 
 class TrendRetrieverService:
     """트렌드 검색 및 추천 서비스."""
     
     def __init__(self):
-        self.embedding_service = SimpleEmbeddingService()
+        self.embedding_service = get_embedding_service()
         self.settings = get_settings()
     
     def search_trends_by_query(self, query: str, limit: int = 10, platform: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -39,6 +99,53 @@ class TrendRetrieverService:
             logger.error(f"트렌드 검색 실패: {e}")
             raise
     
+    def search_trends_by_queries(self, queries: List[str], limit_per_query: int = 3,
+                                 platform: Optional[str] = None) -> List[Dict[str, Any]]:
+        """여러 쿼리 기반 트렌드 검색 (배치 임베딩 + 단일 SQL 왕복).
+        
+        쿼리별 상위 limit_per_query개를 한 번에 조회한 뒤 UUID 기준으로 병합하며,
+        같은 트렌드가 여러 쿼리에 걸리면 가장 높은 유사도를 유지합니다.
+        """
+        if not queries:
+            return []
+        
+        try:
+            # 모든 쿼리를 한 번에 임베딩
+            query_embeddings = self.embedding_service.embed_texts(queries)
+            return self._search_by_embeddings(query_embeddings, limit_per_query, platform)
+                
+        except Exception as e:
+            logger.error(f"다중 쿼리 트렌드 검색 실패: {e}")
+            raise
+    
+    async def asearch_trends_by_queries(self, queries: List[str], limit_per_query: int = 3,
+                                        platform: Optional[str] = None) -> List[Dict[str, Any]]:
+        """search_trends_by_queries의 비동기 버전.
+        
+        임베딩은 마이크로 배처로 다른 동시 요청과 묶어 처리하고,
+        DB 조회는 워커 스레드에서 실행해 이벤트 루프를 막지 않습니다.
+        """
+        if not queries:
+            return []
+        
+        try:
+            query_embeddings = await get_embedding_batcher().embed_texts(queries)
+            return await asyncio.to_thread(
+                self._search_by_embeddings, query_embeddings, limit_per_query, platform
+            )
+                
+        except Exception as e:
+            logger.error(f"다중 쿼리 트렌드 검색 실패: {e}")
+            raise
+    
+    def _search_by_embeddings(self, query_embeddings, limit_per_query: int,
+                              platform: Optional[str] = None) -> List[Dict[str, Any]]:
+        """임베딩된 쿼리들로 배치 벡터 검색 실행."""
+        with SqlAlchemyUoW() as uow:
+            return self._batch_vector_similarity_search(
+                uow.session, query_embeddings, limit_per_query, platform
+            )
+    
     def get_trending_topics(self, days: int = 7, limit: int = 20) -> List[Dict[str, Any]]:
         """최근 트렌딩 토픽 조회."""
         try:
@@ -97,55 +204,18 @@ class TrendRetrieverService:
                                  limit: int, platform: Optional[str] = None) -> List[Dict[str, Any]]:
         """벡터 유사도 검색."""
         try:
-            # 벡터를 JSON 문자열로 변환
-            query_vector_str = json.dumps(query_embedding)
-            
-            # PostgreSQL pgvector를 사용한 유사도 검색 쿼리
-            base_query = """
-                SELECT st.*, 
-                       CASE 
-                           WHEN te.embedding IS NOT NULL THEN 
-                               (1 - (te.embedding::vector <-> :query_vector::vector))
-                           ELSE 0.0
-                       END as similarity_score
-                FROM sns_trends st
-                LEFT JOIN trend_embeddings te ON st.uuid = te.trend_uuid
-                WHERE st.is_active = true
-            """
-            
-            params = {"query_vector": query_vector_str, "limit": limit}
-            
-            if platform:
-                base_query += " AND st.platform = :platform"
-                params["platform"] = platform
-            
-            base_query += " ORDER BY similarity_score DESC LIMIT :limit"
-            
-            # pgvector 검색 시도
+            # pgvector 검색 시도 (실패해도 fallback 쿼리가 가능하도록 savepoint 사용)
             try:
-                # 벡터를 PostgreSQL 배열 형식으로 변환
-                query_vector_array = "[" + ",".join(map(str, query_embedding)) + "]"
-                
-                # 수정된 pgvector 쿼리 (직접 값 삽입)
-                pgvector_query = f"""
-                    SELECT st.*, 
-                           CASE 
-                               WHEN te.embedding IS NOT NULL THEN 
-                                   (1 - (te.embedding <-> '{query_vector_array}'::vector))
-                               ELSE 0.0
-                           END as similarity_score
-                    FROM sns_trends st
-                    LEFT JOIN trend_embeddings te ON st.uuid = te.trend_uuid
-                    WHERE st.is_active = true
-                """
-                
-                if platform:
-                    pgvector_query += f" AND st.platform = '{platform}'"
-                
-                pgvector_query += f" ORDER BY similarity_score DESC LIMIT {limit}"
-                
-                result = session.execute(text(pgvector_query))
-                trends_data = result.fetchall()
+                with session.begin_nested():
+                    self._set_hnsw_ef_search(session, limit)
+                    
+                    statement = _VECTOR_SEARCH_BY_PLATFORM_SQL if platform else _VECTOR_SEARCH_SQL
+                    params = {"query_vector": query_embedding, "limit": limit}
+                    if platform:
+                        params["platform"] = platform
+                    
+                    result = session.execute(statement, params)
+                    trends_data = result.fetchall()
                 
                 if trends_data:
                     logger.info(f"pgvector 검색 성공: {len(trends_data)}개 트렌드")
@@ -154,26 +224,107 @@ class TrendRetrieverService:
             except Exception as pgvector_error:
                 logger.warning(f"pgvector 검색 실패, fallback 사용: {pgvector_error}")
             
-            # Fallback: 검색 쿼리와 관련된 트렌드 반환 (키워드 기반)
-            logger.info("키워드 기반 fallback 검색 사용")
-            
-            # 검색 쿼리에서 키워드 추출
-            search_keywords = self._extract_keywords_from_query(query_embedding)
+            return self._fallback_search(session, query_embedding, limit, platform)
             
-            # 키워드 기반 검색
-            trends = self._keyword_based_search(session, search_keywords, platform, limit)
-            
-            if not trends:
-                # 키워드 검색 실패 시 최근 트렌드 반환
-                query = session.query(SNSTrend).filter(SNSTrend.is_active == True)
+        except Exception as e:
+            logger.error(f"벡터 유사도 검색 실패: {e}")
+            raise
+    
+    def _batch_vector_similarity_search(self, session: Session, query_embeddings: List[List[float]],
+                                       limit_per_query: int, platform: Optional[str] = None) -> List[Dict[str, Any]]:
+        """여러 쿼리 벡터에 대한 k-NN을 unnest + LATERAL로 한 번에 조회하고 병합."""
+        try:
+            with session.begin_nested():
+                self._set_hnsw_ef_search(session, limit_per_query)
+                
+                statement = _BATCH_VECTOR_SEARCH_BY_PLATFORM_SQL if platform else _BATCH_VECTOR_SEARCH_SQL
+                params = {
+                    "query_vectors": [_to_vector_literal(embedding) for embedding in query_embeddings],
+                    "limit": limit_per_query
+                }
                 if platform:
-                    query = query.filter(SNSTrend.platform == platform)
-                trends = query.order_by(SNSTrend.created_at.desc()).limit(limit).all()
+                    params["platform"] = platform
+                
+                rows = session.execute(statement, params).fetchall()
             
-            return [self._trend_to_dict(trend) for trend in trends]
+            if rows:
+                # UUID 기준 병합 (한 번의 순회, 최초 등장 순서 유지 + 최고 유사도 유지)
+                merged: Dict[str, Dict[str, Any]] = {}
+                for row in rows:
+                    trend = self._row_to_trend_dict(row)
+                    existing = merged.get(trend["uuid"])
+                    if existing is None:
+                        merged[trend["uuid"]] = trend
+                    elif trend["similarity_score"] > existing["similarity_score"]:
+                        existing["similarity_score"] = trend["similarity_score"]
+                
+                logger.info(f"pgvector 배치 검색 성공: 쿼리 {len(query_embeddings)}개, 트렌드 {len(merged)}개")
+                return list(merged.values())
+                
+        except Exception as pgvector_error:
+            logger.warning(f"pgvector 배치 검색 실패, fallback 사용: {pgvector_error}")
+        
+        return self._fallback_search(session, None, limit_per_query * len(query_embeddings), platform)
+    
+    def _fallback_search(self, session: Session, query_embedding: Optional[List[float]],
+                         limit: int, platform: Optional[str] = None) -> List[Dict[str, Any]]:
+        """pgvector 검색 실패/무결과 시 키워드 기반 → 최근 트렌드 순으로 대체 검색."""
+        # Fallback: 검색 쿼리와 관련된 트렌드 반환 (키워드 기반)
+        logger.info("키워드 기반 fallback 검색 사용")
+        
+        # 검색 쿼리에서 키워드 추출
+        search_keywords = self._extract_keywords_from_query(query_embedding)
+        
+        # 키워드 기반 검색
+        trends = self._keyword_based_search(session, search_keywords, platform, limit)
+        
+        if not trends:
+            # 키워드 검색 실패 시 최근 트렌드 반환
+            query = session.query(SNSTrend).filter(SNSTrend.is_active == True)
+            if platform:
+                query = query.filter(SNSTrend.platform == platform)
+            trends = query.order_by(SNSTrend.created_at.desc()).limit(limit).all()
+        
+        return [self._trend_to_dict(trend) for trend in trends]
+    
+    def _set_hnsw_ef_search(self, session: Session, limit: int):
+        """현재 트랜잭션의 hnsw.ef_search를 설정 (필터 후에도 limit개가 남도록 limit 이상 보장)."""
+        ef_search = max(self.settings.vector_hnsw_ef_search, limit)
+        session.execute(_SET_EF_SEARCH_SQL, {"ef_search": str(ef_search)})
+    
+    def explain_vector_search(self, query: str, limit: int = 10, platform: Optional[str] = None,
+                              disable_seqscan: bool = False) -> Dict[str, Any]:
+        """벡터 검색 쿼리의 실행 계획을 조회하고 ANN 인덱스 사용 여부를 반환.
+        
+        데이터가 적으면 플래너가 순차 스캔을 고르므로, disable_seqscan=True로
+        인덱스를 사용할 수 있는 쿼리 형태인지만 확인할 수 있습니다.
+        """
+        try:
+            query_embedding = self.embedding_service.embed_text(query)
             
+            with SqlAlchemyUoW() as uow:
+                self._set_hnsw_ef_search(uow.session, limit)
+                if disable_seqscan:
+                    uow.session.execute(text("SELECT set_config('enable_seqscan', 'off', true)"))
+                
+                statement = _VECTOR_SEARCH_BY_PLATFORM_SQL if platform else _VECTOR_SEARCH_SQL
+                params = {"query_vector": query_embedding, "limit": limit}
+                if platform:
+                    params["platform"] = platform
+                
+                explain = text("EXPLAIN " + statement.text).bindparams(
+                    bindparam("query_vector", type_=Vector(EMBEDDING_DIMENSION))
+                )
+                plan_lines = [row[0] for row in uow.session.execute(explain, params).fetchall()]
+                plan = "\n".join(plan_lines)
+                
+                return {
+                    "plan": plan,
+                    "uses_vector_index": "ix_trend_embeddings_embedding" in plan
+                }
+                
         except Exception as e:
-            logger.error(f"벡터 유사도 검색 실패: {e}")
+            logger.error(f"벡터 검색 실행 계획 조회 실패: {e}")
             raise
     
     def _extract_keywords_from_query(self, query_embedding: List[float]) -> List[str]:
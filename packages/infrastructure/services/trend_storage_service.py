@@ -1,13 +1,16 @@
 """트렌드 데이터 저장 및 관리 서비스."""
 
+import asyncio
 import logging
 import json
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterable, AsyncIterator
 from datetime import datetime
+from sqlalchemy import literal_column
 from sqlalchemy.orm import Session
 from packages.core.db.uow_sqlalchemy import SqlAlchemyUoW
 from packages.domain.entities.sns_trend import SNSTrend, TrendEmbedding
-from packages.infrastructure.services.embedding.simple_embedding_service import SimpleEmbeddingService
+from packages.infrastructure.services.embedding.cached_embedding_service import get_embedding_service
+from packages.infrastructure.utils.content_identity import content_key
 
 logger = logging.getLogger(__name__)
 
@@ -16,7 +19,7 @@ class TrendStorageService:
     """트렌드 데이터 저장 및 관리 서비스."""
     
     def __init__(self):
-        self.embedding_service = SimpleEmbeddingService()
+        self.embedding_service = get_embedding_service()
     
     def save_trends(self, trends: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """트렌드 데이터를 저장하고 임베딩을 생성 (개별 트랜잭션 사용)."""
@@ -47,30 +50,202 @@ class TrendStorageService:
         logger.info(f"트렌드 저장 완료: {len(saved_trends)}개")
         return saved_trends
     
-    def _is_duplicate_trend(self, session: Session, trend_data: Dict[str, Any]) -> bool:
-        """중복 트렌드 체크."""
-        try:
-            # 제목과 플랫폼을 안전하게 처리
-            title = trend_data.get("title", "")
-            platform = trend_data.get("platform", "")
-            
-            # UTF-8 인코딩 문제 해결
-            if isinstance(title, bytes):
-                title = title.decode('utf-8', errors='ignore')
-            if isinstance(platform, bytes):
-                platform = platform.decode('utf-8', errors='ignore')
-            
-            # 제목과 플랫폼으로 중복 체크
-            existing = session.query(SNSTrend).filter(
-                SNSTrend.title == title,
-                SNSTrend.platform == platform
-            ).first()
+    def save_trends_bulk(self, trends: List[Dict[str, Any]], chunk_size: int = 500) -> Dict[str, Any]:
+        """트렌드 데이터를 한 트랜잭션에서 일괄 저장 (다중 행 UPSERT + 배치 임베딩).
+        
+        content_key(정규화 URL + 제목 해시) 유니크 인덱스에 대해 INSERT ... ON CONFLICT를
+        사용하므로 중복은 DB가 일괄 거부하며, 새로 들어가거나 내용이 바뀐 행만 임베딩합니다.
+        다중 행 INSERT가 실패한 청크만 savepoint로 행별 재시도하여 문제 행을 격리하고,
+        거부된 행은 rejected 목록으로 보고합니다.
+        
+        Returns:
+            {"saved": 저장(신규+갱신)된 트렌드 목록, "rejected": [{"trend": 원본, "error": 사유}, ...],
+             "inserted": 신규 수, "updated": 갱신 수, "skipped": 중복으로 건너뛴 수}
+        """
+        saved_trends: List[Dict[str, Any]] = []
+        rejected: List[Dict[str, Any]] = []
+        counts = {"inserted": 0, "updated": 0, "skipped": 0}
+        
+        # 1) 한 번의 순회로 정규화 + 배치 내 중복 제거
+        rows = []
+        seen_keys = set()
+        for trend_data in trends:
+            if not isinstance(trend_data, dict):
+                rejected.append({"trend": trend_data, "error": "trend_data가 dict가 아닙니다"})
+                continue
+            try:
+                insert_data = self._normalize_trend(trend_data)
+            except Exception as e:
+                rejected.append({"trend": trend_data, "error": f"정규화 실패: {e}"})
+                continue
+            if insert_data["content_key"] in seen_keys:
+                counts["skipped"] += 1
+                continue
+            seen_keys.add(insert_data["content_key"])
+            rows.append((trend_data, insert_data))
+        
+        # 2) 단일 트랜잭션에서 청크 단위 다중 행 UPSERT
+        if rows:
+            with SqlAlchemyUoW() as uow:
+                for start in range(0, len(rows), chunk_size):
+                    chunk = rows[start:start + chunk_size]
+                    try:
+                        with uow.session.begin_nested():
+                            self._upsert_trend_chunk(uow.session, chunk, saved_trends, counts)
+                    except Exception as e:
+                        logger.warning(f"다중 행 UPSERT 실패, 행 단위 재시도: {e}")
+                        for row in chunk:
+                            try:
+                                with uow.session.begin_nested():
+                                    self._upsert_trend_chunk(uow.session, [row], saved_trends, counts)
+                            except Exception as row_error:
+                                rejected.append({"trend": row[0], "error": str(row_error)})
+        
+        logger.info(
+            f"트렌드 일괄 저장 완료: 신규 {counts['inserted']}개, 갱신 {counts['updated']}개, "
+            f"중복 {counts['skipped']}개, 거부 {len(rejected)}개"
+        )
+        return {"saved": saved_trends, "rejected": rejected, **counts}
+    
+    def save_trend_stream(self, trends: Iterable[Dict[str, Any]], batch_size: int = 100) -> Dict[str, int]:
+        """트렌드 스트림을 batch_size개씩 모아 배치마다 커밋 (메모리는 배치 크기로 고정).
+        
+        중간에 실패해도 이미 커밋된 배치는 유지됩니다.
+        
+        Returns:
+            {"saved", "inserted", "updated", "skipped", "rejected", "batches"} 누적 개수
+        """
+        totals = self._empty_stream_totals()
+        batch: List[Dict[str, Any]] = []
+        
+        for trend in trends:
+            batch.append(trend)
+            if len(batch) >= batch_size:
+                self._add_stream_result(totals, self.save_trends_bulk(batch))
+                batch = []
+        if batch:
+            self._add_stream_result(totals, self.save_trends_bulk(batch))
+        
+        logger.info(f"트렌드 스트림 저장 완료: {totals}")
+        return totals
+    
+    async def asave_trend_stream(self, trends: AsyncIterator[Dict[str, Any]], batch_size: int = 100) -> Dict[str, int]:
+        """비동기 트렌드 스트림을 batch_size개씩 저장 (배치 저장은 스레드에서 실행).
+        
+        배치를 저장하는 동안 다음 항목을 당겨오지 않으므로, 생산자(크롤러)의
+        유한 큐가 차면 수집이 저장 속도에 맞춰 대기합니다 (backpressure).
+        
+        Returns:
+            {"saved", "inserted", "updated", "skipped", "rejected", "batches"} 누적 개수
+        """
+        totals = self._empty_stream_totals()
+        batch: List[Dict[str, Any]] = []
+        
+        async for trend in trends:
+            batch.append(trend)
+            if len(batch) >= batch_size:
+                self._add_stream_result(totals, await asyncio.to_thread(self.save_trends_bulk, batch))
+                batch = []
+        if batch:
+            self._add_stream_result(totals, await asyncio.to_thread(self.save_trends_bulk, batch))
+        
+        logger.info(f"트렌드 스트림 저장 완료: {totals}")
+        return totals
+    
+    @staticmethod
+    def _empty_stream_totals() -> Dict[str, int]:
+        """스트림 저장 누적 카운터."""
+        return {"saved": 0, "inserted": 0, "updated": 0, "skipped": 0, "rejected": 0, "batches": 0}
+    
+    @staticmethod
+    def _add_stream_result(totals: Dict[str, int], result: Dict[str, Any]) -> None:
+        """배치 저장 결과를 누적 (저장/거부 목록은 개수만 보관)."""
+        totals["saved"] += len(result["saved"])
+        totals["rejected"] += len(result["rejected"])
+        for key in ("inserted", "updated", "skipped"):
+            totals[key] += result[key]
+        totals["batches"] += 1
+        for rejected in result["rejected"]:
+            logger.warning(f"트렌드 저장 거부: {rejected['error']}")
+    
+    def _embed_trends(self, rows: List[Dict[str, Any]]):
+        """정규화된 트렌드 행들을 한 번에 임베딩."""
+        texts = [f"{row.get('title', '')} {row.get('content', '')}" for row in rows]
+        if hasattr(self.embedding_service, "embed_texts_array"):
+            return self.embedding_service.embed_texts_array(texts)
+        return self.embedding_service.embed_texts(texts)
+    
+    def _upsert_trend_chunk(self, session: Session, chunk, saved_trends: List[Dict[str, Any]],
+                            counts: Dict[str, int]) -> None:
+        """트렌드를 다중 행 INSERT ... ON CONFLICT로 저장하고, 신규/변경 행만 임베딩 저장."""
+        from sqlalchemy import delete, insert, or_
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+        
+        trend_table = SNSTrend.__table__
+        stmt = pg_insert(trend_table).values([insert_data for _, insert_data in chunk])
+        excluded = stmt.excluded
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[trend_table.c.content_key],
+            set_={
+                "trend_type": excluded.trend_type,
+                "title": excluded.title,
+                "content": excluded.content,
+                "tags": excluded.tags,
+                "engagement_metrics": excluded.engagement_metrics,
+                "legal_implications": excluded.legal_implications,
+                "updated_at": datetime.utcnow(),
+                "is_active": True,
+            },
+            # 내용이 같으면 갱신하지 않음 (RETURNING에서도 빠지므로 skipped로 집계)
+            where=or_(
+                trend_table.c.title.is_distinct_from(excluded.title),
+                trend_table.c.content.is_distinct_from(excluded.content),
+                trend_table.c.is_active.is_(False),
+            ),
+        ).returning(
+            trend_table.c.id,
+            trend_table.c.uuid,
+            trend_table.c.content_key,
+            # xmax = 0 이면 새로 INSERT된 행, 아니면 ON CONFLICT로 UPDATE된 행
+            literal_column("(xmax = 0)").label("inserted"),
+        )
+        returned = {row.content_key: row for row in session.execute(stmt)}
+        
+        chunk_counts = {"inserted": 0, "updated": 0, "skipped": len(chunk) - len(returned)}
+        changed = []
+        for trend_data, insert_data in chunk:
+            row = returned.get(insert_data["content_key"])
+            if row is None:
+                continue
+            insert_data = {**insert_data, "uuid": str(row.uuid)}
+            changed.append((row, trend_data, insert_data))
+            chunk_counts["inserted" if row.inserted else "updated"] += 1
+        
+        if changed:
+            # 중복으로 거부된 행은 임베딩하지 않음
+            embeddings = self._embed_trends([insert_data for _, _, insert_data in changed])
             
-            return existing is not None
+            updated_uuids = [insert_data["uuid"] for row, _, insert_data in changed if not row.inserted]
+            if updated_uuids:
+                session.execute(
+                    delete(TrendEmbedding.__table__).where(TrendEmbedding.__table__.c.trend_uuid.in_(updated_uuids))
+                )
             
-        except Exception as e:
-            logger.error(f"중복 체크 실패: {e}")
-            return False
+            now = datetime.utcnow()
+            session.execute(
+                insert(TrendEmbedding.__table__),
+                [
+                    {"trend_uuid": insert_data["uuid"], "embedding": embedding, "created_at": now}
+                    for (_, _, insert_data), embedding in zip(changed, embeddings)
+                ]
+            )
+        
+        # savepoint가 성공한 뒤에만 결과 반영
+        saved_trends.extend(
+            self._to_saved_trend(row.id, insert_data, trend_data) for row, trend_data, insert_data in changed
+        )
+        for key, value in chunk_counts.items():
+            counts[key] += value
     
     def _save_trend(self, session: Session, trend_data: Dict[str, Any]) -> Dict[str, Any]:
         """트렌드 데이터 저장 (직접 SQL 사용)."""
@@ -80,65 +255,76 @@ class TrendStorageService:
                 logger.error(f"trend_data가 문자열입니다: {trend_data}")
                 return None
             
-            # 데이터를 안전하게 처리
-            def safe_decode(value):
-                if isinstance(value, bytes):
-                    return value.decode('utf-8', errors='ignore')
-                elif isinstance(value, str):
-                    # 문자열도 UTF-8로 재인코딩/디코딩하여 문제 문자 제거
-                    try:
-                        return value.encode('utf-8', errors='ignore').decode('utf-8')
-                    except:
-                        return str(value)
-                return str(value) if value else ''
-            
-            import uuid
-            import json
-            
-            # UUID 생성
-            trend_uuid = str(uuid.uuid4())
+            insert_data = self._normalize_trend(trend_data)
             
-            # SQLAlchemy Core insert 사용 (기존 프로젝트 패턴)
-            insert_data = {
-                "uuid": trend_uuid,
-                "platform": safe_decode(trend_data.get("platform")),
-                "trend_type": safe_decode(trend_data.get("trend_type")),
-                "title": safe_decode(trend_data.get("title")),
-                "content": safe_decode(trend_data.get("content")),
-                "url": safe_decode(trend_data.get("url")),
-                "tags": json.dumps(trend_data.get("tags", [])),
-                "engagement_metrics": json.dumps(trend_data.get("engagement_metrics", {})),
-                "legal_implications": safe_decode(trend_data.get("legal_implications")),
-                "created_at": trend_data.get("created_at", datetime.utcnow())
-            }
-            
-            # SNSTrend 테이블에 삽입
-            from sqlalchemy import insert
-            stmt = insert(SNSTrend.__table__).values(insert_data).returning(SNSTrend.__table__.c.id)
-            result = session.execute(stmt)
-            trend_id = result.fetchone()[0]
+            # SNSTrend 테이블에 삽입 (content_key 중복이면 건너뜀)
+            from sqlalchemy.dialects.postgresql import insert
+            stmt = (
+                insert(SNSTrend.__table__)
+                .values(insert_data)
+                .on_conflict_do_nothing(index_elements=[SNSTrend.__table__.c.content_key])
+                .returning(SNSTrend.__table__.c.id)
+            )
+            row = session.execute(stmt).fetchone()
+            if row is None:
+                logger.info(f"중복 트렌드 건너뜀: {insert_data['title']}")
+                return None
+            trend_id = row[0]
             
             # 딕셔너리로 변환하여 반환
-            saved_trend = {
-                "id": trend_id,
-                "uuid": trend_uuid,
-                "platform": safe_decode(trend_data.get("platform")),
-                "trend_type": safe_decode(trend_data.get("trend_type")),
-                "title": safe_decode(trend_data.get("title")),
-                "content": safe_decode(trend_data.get("content")),
-                "url": safe_decode(trend_data.get("url")),
-                "tags": trend_data.get("tags"),
-                "engagement_metrics": trend_data.get("engagement_metrics"),
-                "legal_implications": safe_decode(trend_data.get("legal_implications")),
-                "created_at": trend_data.get("created_at", datetime.utcnow())
-            }
-            
-            return saved_trend
+            return self._to_saved_trend(trend_id, insert_data, trend_data)
             
         except Exception as e:
             logger.error(f"트렌드 저장 실패: {e}")
             raise
     
+    def _normalize_trend(self, trend_data: Dict[str, Any]) -> Dict[str, Any]:
+        """크롤링 결과 한 건을 sns_trends INSERT 행으로 정규화."""
+        # 데이터를 안전하게 처리
+        def safe_decode(value):
+            if isinstance(value, bytes):
+                return value.decode('utf-8', errors='ignore')
+            elif isinstance(value, str):
+                # 문자열도 UTF-8로 재인코딩/디코딩하여 문제 문자 제거
+                try:
+                    return value.encode('utf-8', errors='ignore').decode('utf-8')
+                except:
+                    return str(value)
+            return str(value) if value else ''
+        
+        import uuid
+        
+        # SQLAlchemy Core insert 사용 (기존 프로젝트 패턴)
+        return {
+            "uuid": str(uuid.uuid4()),
+            "platform": safe_decode(trend_data.get("platform")),
+            "trend_type": safe_decode(trend_data.get("trend_type")),
+            "title": safe_decode(trend_data.get("title")),
+            "content": safe_decode(trend_data.get("content")),
+            "url": safe_decode(trend_data.get("url")),
+            "content_key": content_key(trend_data.get("url"), safe_decode(trend_data.get("title"))),
+            "tags": json.dumps(trend_data.get("tags", [])),
+            "engagement_metrics": json.dumps(trend_data.get("engagement_metrics", {})),
+            "legal_implications": safe_decode(trend_data.get("legal_implications")),
+            "created_at": trend_data.get("created_at", datetime.utcnow())
+        }
+    
+    def _to_saved_trend(self, trend_id: int, insert_data: Dict[str, Any], trend_data: Dict[str, Any]) -> Dict[str, Any]:
+        """저장된 행을 반환용 딕셔너리로 변환."""
+        return {
+            "id": trend_id,
+            "uuid": insert_data["uuid"],
+            "platform": insert_data["platform"],
+            "trend_type": insert_data["trend_type"],
+            "title": insert_data["title"],
+            "content": insert_data["content"],
+            "url": insert_data["url"],
+            "tags": trend_data.get("tags"),
+            "engagement_metrics": trend_data.get("engagement_metrics"),
+            "legal_implications": insert_data["legal_implications"],
+            "created_at": insert_data["created_at"]
+        }
+    
     def _save_embedding(self, session: Session, trend_data: Dict[str, Any]):
         """트렌드 임베딩 저장 (직접 SQL 사용)."""
         try:
@@ -146,15 +332,12 @@ class TrendStorageService:
             text = f"{trend_data.get('title', '')} {trend_data.get('content', '')}"
             embedding_vector = self.embedding_service.embed_text(text)
             
-            # 벡터를 문자열로 변환 (pgvector 형식)
-            import json
-            vector_str = json.dumps(embedding_vector)
-            
             # SQLAlchemy Core insert 사용 (기존 프로젝트 패턴)
+            # embedding 컬럼은 pgvector Vector 타입이므로 리스트를 그대로 바인딩
             from sqlalchemy import insert
             insert_data = {
                 "trend_uuid": trend_data["uuid"],
-                "embedding": vector_str,
+                "embedding": embedding_vector,
                 "created_at": datetime.utcnow()
             }
             
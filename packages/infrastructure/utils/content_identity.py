@@ -0,0 +1,49 @@
+"""크롤링된 트렌드의 콘텐츠 식별 키 생성 유틸리티."""
+
+import hashlib
+import re
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# 같은 글을 가리키지만 값이 매번 달라지는 추적용 쿼리 파라미터
+_TRACKING_PARAMS = {"fbclid", "gclid", "igshid", "mc_cid", "mc_eid", "ref", "ref_src", "cmpid", "ncid", "sr_share"}
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def canonicalize_url(url: Optional[str]) -> str:
+    """URL 정규화 (스킴/호스트 소문자, www·기본 포트·fragment·추적 파라미터 제거, 쿼리 정렬)."""
+    if not url:
+        return ""
+
+    parts = urlsplit(url.strip())
+    scheme = (parts.scheme or "http").lower()
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if parts.port and not ((scheme == "http" and parts.port == 80) or (scheme == "https" and parts.port == 443)):
+        host = f"{host}:{parts.port}"
+
+    path = parts.path or "/"
+    if len(path) > 1:
+        path = path.rstrip("/")
+
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in _TRACKING_PARAMS
+    ))
+
+    # http/https 차이는 같은 글로 취급
+    return urlunsplit(("https" if scheme in ("http", "https") else scheme, host, path, query, ""))
+
+
+def normalize_title(title: Optional[str]) -> str:
+    """제목 정규화 (소문자, 공백 압축)."""
+    return _WHITESPACE.sub(" ", (title or "").strip().lower())
+
+
+def content_key(url: Optional[str], title: Optional[str]) -> str:
+    """정규화 URL + 제목 해시 기반 콘텐츠 식별 키 (sha256 hex, 64자)."""
+    title_hash = hashlib.sha256(normalize_title(title).encode("utf-8")).hexdigest()
+    identity = f"{canonicalize_url(url)}\n{title_hash}"
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()
@@ -32,14 +32,27 @@ celery_app.conf.update(
 # Task 라우팅 설정
 celery_app.conf.task_routes = {
     "apps.worker.ai_tasks.*": {"queue": "ai"},
-    "apps.worker.trend_crawling_tasks.*": {"queue": "trends"}
+    "apps.worker.trend_crawling_tasks.*": {"queue": "trends"},
+    # 트렌드 태스크는 짧은 이름으로 등록되어 있으므로 이름으로도 라우팅
+    "crawl_sns_trends": {"queue": "trends"},
+    "crawl_sns_feed": {"queue": "trends"},
+    "aggregate_sns_feed_results": {"queue": "trends"},
+    "refresh_trend_search_index": {"queue": "trends"},
+    "dispatch_due_sns_feeds": {"queue": "trends"},
 }
 
-# 주간 스케줄 설정 (SNS 트렌드 RSS 크롤링)
+# 스케줄 설정 (SNS 트렌드 RSS 크롤링)
 celery_app.conf.beat_schedule = {
-    'weekly-sns-trends': {
+    # 피드별 적응형 주기(next_crawl_at)와 서킷 상태를 보고 차례가 된 피드만 크롤링
+    'dispatch-due-sns-feeds': {
+        'task': 'dispatch_due_sns_feeds',
+        'schedule': crontab(minute='*/10'),  # 10분마다 확인
+    },
+    # 주 1회 전체 재수집 (워터마크 보정용)
+    'weekly-sns-trends-full': {
         'task': 'crawl_sns_trends',
-        'schedule': crontab(hour=2, minute=0, day_of_week=1),  # 매주 월요일 오전 2시
+        'schedule': crontab(hour=2, minute=30, day_of_week=1),  # 매주 월요일 오전 2시 30분
+        'kwargs': {'full': True},
     },
 }
 
@@ -3,6 +3,7 @@
 import sys
 import os
 import asyncio
+import argparse
 
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -22,7 +23,7 @@ from packages.infrastructure.services.trend_crawling_service import TrendCrawlin
 from packages.infrastructure.services.trend_storage_service import TrendStorageService
 
 
-async def run_trend_crawling():
+async def run_trend_crawling(full: bool = False):
     """트렌드 크롤링을 실행합니다."""
     try:
         print("🚀 SNS 트렌드 크롤링 시작...")
@@ -32,7 +33,7 @@ async def run_trend_crawling():
         
         # 모든 트렌드 크롤링
         print("📡 RSS 피드에서 트렌드 데이터 수집 중...")
-        result = crawling_service.crawl_all_trends()
+        result = await crawling_service.acrawl_all_trends(full=full)
         
         print(f"✅ 크롤링 완료: {result}")
         
@@ -53,12 +54,16 @@ async def run_trend_crawling():
 
 def main():
     """메인 함수."""
+    parser = argparse.ArgumentParser(description="SNS 트렌드 크롤링 수동 실행")
+    parser.add_argument("--full", action="store_true", help="피드 워터마크/변경 감지를 무시하고 전체 재수집")
+    args = parser.parse_args()
+    
     print("=" * 50)
     print("SNS 트렌드 크롤링 수동 실행")
     print("=" * 50)
     
     # 비동기 함수 실행
-    result = asyncio.run(run_trend_crawling())
+    result = asyncio.run(run_trend_crawling(full=args.full))
     
     if result:
         print("\n✅ 모든 작업이 성공적으로 완료되었습니다!")